@@ -26,8 +26,8 @@ Different models of ionization cross section for electron
 ###############################################################################
 
 # Standard library modules.
+import importlib
 import os.path
-import logging
 
 # Third party modules.
 
@@ -36,9 +36,47 @@ import logging
 # Project modules.
 
 # Globals and constants variables.
+# Public attributes imported on first access, so importing the package does not load numpy or the models.
+_LAZY_ATTRIBUTES = {
+    "Casnati": "pyIonisationCrossSection.casnati",
+    "Brown1974": "pyIonisationCrossSection.brown",
+    "Jakoby1987": "pyIonisationCrossSection.jakoby",
+    "Bote2009": "pyIonisationCrossSection.bote2009",
+    "TabulatedBote2009": "pyIonisationCrossSection.bote2009_tabulated",
+    "IonisationCrossSectionModel": "pyIonisationCrossSection.model",
+    "getModel": "pyIonisationCrossSection.model",
+    "getModelNames": "pyIonisationCrossSection.model",
+    "registerModel": "pyIonisationCrossSection.model",
+    "compare": "pyIonisationCrossSection.comparison",
+}
+
+_LAZY_SUBMODULES = ["adaptive_grid", "atomic_shell", "bote2009", "bote2009_tabulated", "brown", "casnati", "comparison",
+                    "edge_energy", "instrumentation", "jakoby", "material", "model", "trajectory", "units"]
+
+__all__ = sorted(_LAZY_ATTRIBUTES) + ["get_current_module_path"]
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name])
+        value = getattr(module, name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module("%s.%s" % (__name__, name))
+    else:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_LAZY_SUBMODULES))
 
 
 def get_current_module_path(module_path, relative_path=""):
+    # logging is imported here, it is the slowest import of the package otherwise.
+    import logging
+
     base_path = os.path.dirname(module_path)
     logging.debug(base_path)
 
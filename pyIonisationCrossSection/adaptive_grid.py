@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+"""
+.. py:currentmodule:: adaptive_grid
+.. moduleauthor:: Hendrix Demers <hendrix.demers@mail.mcgill.ca>
+
+Adaptive energy grids for compact tabulations of the cross sections.
+
+The grid starts from a coarse logarithmic grid and the intervals are bisected in log(E) until the log-log
+interpolation at the middle of every interval is within the tolerance of the function. All the middle points of
+one refinement are evaluated in one batch call. The intervals where the function is zero at one end are
+interpolated linearly in the value.
+"""
+
+# Script information for the file.
+__author__ = "Hendrix Demers (hendrix.demers@mail.mcgill.ca)"
+__version__ = ""
+__date__ = ""
+__copyright__ = "Copyright (c) 2012 Hendrix Demers"
+__license__ = ""
+
+# Standard library modules.
+import collections
+
+# Third party modules.
+import numpy as np
+
+# Local modules.
+
+# Project modules
+
+# Globals and constants variables.
+DEFAULT_TOLERANCE = 1.0e-3
+DEFAULT_MINIMUM_RELATIVE_VALUE = 1.0e-3
+DEFAULT_INITIAL_NUMBER_POINTS = 16
+DEFAULT_MAXIMUM_NUMBER_POINTS = 100000
+DEFAULT_MAXIMUM_ENERGY_eV = 1.0e9
+
+# Overvoltage where the Bote and Salvat (2009) DWBA and PWBA formulas join.
+OVERVOLTAGE_DWBA_PWBA = 16.0
+
+AdaptiveGrid = collections.namedtuple("AdaptiveGrid", ["energies_eV", "values", "maximumError"])
+
+def interpolateLogLog(energiesGrid_eV, valuesGrid, energies_eV):
+    """
+    Interpolate the tabulated values at the energies, log-log or linear in the value next to a zero value.
+
+    The energies outside the grid get the values of the closest end of the grid.
+    """
+    energiesGrid_eV = np.asarray(energiesGrid_eV, dtype=np.float64)
+    valuesGrid = np.asarray(valuesGrid, dtype=np.float64)
+    energies_eV = np.clip(np.asarray(energies_eV, dtype=np.float64), energiesGrid_eV[0], energiesGrid_eV[-1])
+
+    indexes = np.clip(np.searchsorted(energiesGrid_eV, energies_eV, side='right') - 1, 0, len(energiesGrid_eV) - 2)
+    return _interpolateInterval(energiesGrid_eV[indexes], energiesGrid_eV[indexes + 1], valuesGrid[indexes],
+                                valuesGrid[indexes + 1], energies_eV)
+
+def _interpolateInterval(energies0_eV, energies1_eV, values0, values1, energies_eV):
+    weights = np.log(energies_eV/energies0_eV)/np.log(energies1_eV/energies0_eV)
+
+    isPositive = (values0 > 0.0) & (values1 > 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        valuesLogLog = values0*np.power(values1/values0, weights)
+    valuesLinear = values0 + weights*(values1 - values0)
+
+    return np.where(isPositive, valuesLogLog, valuesLinear)
+
+def createAdaptiveGrid(function, minimumEnergy_eV, maximumEnergy_eV, tolerance=DEFAULT_TOLERANCE,
+                       minimumRelativeValue=DEFAULT_MINIMUM_RELATIVE_VALUE, breakpoints_eV=(),
+                       initialNumberPoints=DEFAULT_INITIAL_NUMBER_POINTS, maximumNumberPoints=DEFAULT_MAXIMUM_NUMBER_POINTS):
+    """
+    Return the `AdaptiveGrid` of a function of an array of energies.
+
+    The relative error is computed against the larger of the value and `minimumRelativeValue` times the largest
+    value, so the intervals near a zero of the function are not refined without end. The `breakpoints_eV`, such
+    as a discontinuity of the derivative, are nodes of the initial grid. A RuntimeError is raised if the tolerance
+    is not reached with `maximumNumberPoints`.
+    """
+    energies_eV = np.geomspace(minimumEnergy_eV, maximumEnergy_eV, initialNumberPoints)
+    breakpoints_eV = [energy_eV for energy_eV in breakpoints_eV if minimumEnergy_eV < energy_eV < maximumEnergy_eV]
+    energies_eV = np.unique(np.concatenate((energies_eV, breakpoints_eV)))
+    values = np.asarray(function(energies_eV), dtype=np.float64)
+
+    isConverged = np.zeros(len(energies_eV) - 1, dtype=bool)
+    maximumError = 0.0
+    maximumValue = np.max(np.abs(values))
+
+    while not np.all(isConverged):
+        intervalIndexes = np.flatnonzero(~isConverged)
+        energies0_eV = energies_eV[intervalIndexes]
+        energies1_eV = energies_eV[intervalIndexes + 1]
+        middleEnergies_eV = np.sqrt(energies0_eV*energies1_eV)
+
+        middleValues = np.asarray(function(middleEnergies_eV), dtype=np.float64)
+        interpolatedValues = _interpolateInterval(energies0_eV, energies1_eV, values[intervalIndexes],
+                                                  values[intervalIndexes + 1], middleEnergies_eV)
+
+        maximumValue = max(maximumValue, np.max(np.abs(middleValues)))
+        scales = np.maximum(np.abs(middleValues), minimumRelativeValue*maximumValue)
+        errors = np.abs(interpolatedValues - middleValues)/np.where(scales > 0.0, scales, 1.0)
+
+        isAccurate = errors <= tolerance
+        isConverged[intervalIndexes[isAccurate]] = True
+        if np.any(isAccurate):
+            maximumError = max(maximumError, float(np.max(errors[isAccurate])))
+
+        isSplit = ~isAccurate
+        numberSplits = np.count_nonzero(isSplit)
+        if numberSplits == 0:
+            break
+        if len(energies_eV) + numberSplits > maximumNumberPoints:
+            raise RuntimeError("The tolerance %g is not reached with %i points." % (tolerance, maximumNumberPoints))
+
+        splitIndexes = intervalIndexes[isSplit] + 1
+        energies_eV = np.insert(energies_eV, splitIndexes, middleEnergies_eV[isSplit])
+        values = np.insert(values, splitIndexes, middleValues[isSplit])
+        isConverged = np.insert(isConverged, splitIndexes, False)
+
+    return AdaptiveGrid(energies_eV, values, maximumError)
+
+def createModelGrid(model, atomicNumber, shell, ionisationEnergy_eV, maximumEnergy_eV=DEFAULT_MAXIMUM_ENERGY_eV,
+                    tolerance=DEFAULT_TOLERANCE, minimumRelativeValue=DEFAULT_MINIMUM_RELATIVE_VALUE):
+    """
+    Return the `AdaptiveGrid` of the cross sections in nm2 of a model, from the ionisation energy.
+
+    The energy where the DWBA and PWBA formulas join, 16 times the ionisation energy, is a node of the grid.
+    """
+    def function(energies_eV):
+        return model.ics_nm2_array(atomicNumber, ionisationEnergy_eV, energies_eV, shell)
+
+    breakpoints_eV = [OVERVOLTAGE_DWBA_PWBA*ionisationEnergy_eV]
+    return createAdaptiveGrid(function, ionisationEnergy_eV, maximumEnergy_eV, tolerance, minimumRelativeValue,
+                              breakpoints_eV)
@@ -0,0 +1,9 @@
+#!/usr/bin/env python
+"""
+.. py:currentmodule:: benchmarks
+.. moduleauthor:: Hendrix Demers <hendrix.demers@mail.mcgill.ca>
+
+Benchmarks of the ionisation cross section models and of the data loading.
+
+Run with ``python -m pyIonisationCrossSection.benchmarks``, see `runner` for the options.
+"""
@@ -0,0 +1,22 @@
+#!/usr/bin/env python
+"""
+.. py:currentmodule:: benchmarks.__main__
+.. moduleauthor:: Hendrix Demers <hendrix.demers@mail.mcgill.ca>
+
+Command line entry point of the benchmarks.
+"""
+
+# Standard library modules.
+import sys
+
+# Third party modules.
+
+# Local modules.
+
+# Project modules
+from pyIonisationCrossSection.benchmarks.runner import main
+
+# Globals and constants variables.
+
+if __name__ == '__main__':  #pragma: no cover
+    sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+"""
+.. py:currentmodule:: benchmarks.cases
+.. moduleauthor:: Hendrix Demers <hendrix.demers@mail.mcgill.ca>
+
+Benchmark cases of the models and of the data loading.
+"""
+
+# Script information for the file.
+__author__ = "Hendrix Demers (hendrix.demers@mail.mcgill.ca)"
+__version__ = ""
+__date__ = ""
+__copyright__ = "Copyright (c) 2012 Hendrix Demers"
+__license__ = ""
+
+# Standard library modules.
+import collections
+
+# Third party modules.
+import numpy as np
+
+# Local modules.
+
+# Project modules
+import pyIonisationCrossSection.atomic_shell as atomic_shell
+import pyIonisationCrossSection.bote2009 as bote2009
+from pyIonisationCrossSection import get_current_module_path
+from pyIonisationCrossSection.edge_energy import getEdgeEnergies_eV, getEdgeEnergy_eV
+from pyIonisationCrossSection.model import getModel, getModelNames
+
+# Globals and constants variables.
+IMPORT_MODULES = ["pyIonisationCrossSection", "pyIonisationCrossSection.bote2009", "pyIonisationCrossSection.model"]
+
+SINGLE_ATOMIC_NUMBER = 29
+ALL_ATOMIC_NUMBERS = range(4, 93)
+ALL_ATOMIC_NUMBERS_SIZE = 1000
+MAXIMUM_OVERVOLTAGE = 100.0
+
+# A case times `function`, which evaluates `size` cross sections or loads data when `size` is None.
+BenchmarkCase = collections.namedtuple("BenchmarkCase", ["name", "function", "size"])
+
+def getOriginalDataFilepath():
+    return get_current_module_path(__file__, "../../data/bote2009_tables.csv")
+
+def createDataLoadingCases():
+    """
+    Return the cases of the Bote and Salvat (2009) data loading.
+    """
+    dataFilepath = getOriginalDataFilepath()
+
+    def readOriginalDataFile():
+        bote2009.Bote2009().readOriginalDataFile(dataFilepath)
+
+    # Create the cache before it is timed.
+    bote2009.getModel(useCache=True)
+
+    return [BenchmarkCase("bote2009.getModel.cache", lambda: bote2009.getModel(useCache=True), None),
+            BenchmarkCase("bote2009.getModel.csv", lambda: bote2009.getModel(useCache=False), None),
+            BenchmarkCase("bote2009.readOriginalDataFile", readOriginalDataFile, None)]
+
+def createModelCases(modelName, sizes):
+    """
+    Return the cases of one model: a scalar call, batches of energies for one atomic number and a batch over all
+    the atomic numbers.
+    """
+    modelICS = getModel(modelName)
+    shell = atomic_shell.SHELL_K
+
+    atomicNumber = SINGLE_ATOMIC_NUMBER
+    ionisationEnergy_eV = getEdgeEnergy_eV(atomicNumber, shell)
+    energy_eV = 3.0*ionisationEnergy_eV
+
+    cases = [BenchmarkCase("%s.scalar" % (modelName), lambda: modelICS.ics_nm2(atomicNumber, ionisationEnergy_eV, energy_eV, shell), 1)]
+
+    for size in sizes:
+        energies_eV = ionisationEnergy_eV*np.geomspace(1.0, MAXIMUM_OVERVOLTAGE, size)
+        function = lambda energies_eV=energies_eV: modelICS.ics_nm2_array(atomicNumber, ionisationEnergy_eV, energies_eV, shell)
+        cases.append(BenchmarkCase("%s.batch.single_Z.%i" % (modelName, size), function, size))
+
+    atomicNumbers = np.array([atomicNumber for atomicNumber in ALL_ATOMIC_NUMBERS if modelICS.isSupported(atomicNumber, shell)])
+    ionisationEnergies_eV = getEdgeEnergies_eV(atomicNumbers, shell)[:, np.newaxis]
+    energies_eV = ionisationEnergies_eV*np.geomspace(1.0, MAXIMUM_OVERVOLTAGE, ALL_ATOMIC_NUMBERS_SIZE)
+    function = lambda: modelICS.ics_nm2_array(atomicNumbers[:, np.newaxis], ionisationEnergies_eV, energies_eV, shell)
+    cases.append(BenchmarkCase("%s.batch.all_Z.%i" % (modelName, ALL_ATOMIC_NUMBERS_SIZE), function, energies_eV.size))
+
+    return cases
+
+def createCases(sizes, modelNames=None):
+    """
+    Return all the benchmark cases except the import time.
+    """
+    if modelNames is None:
+        modelNames = getModelNames()
+
+    cases = createDataLoadingCases()
+    for modelName in modelNames:
+        cases.extend(createModelCases(modelName, sizes))
+
+    return cases
@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+"""
+.. py:currentmodule:: benchmarks.runner
+.. moduleauthor:: Hendrix Demers <hendrix.demers@mail.mcgill.ca>
+
+Run the benchmarks, write the results in a JSON file and compare them with a baseline.
+
+The time of a case is the best over the repeats of the time per call, the peak memory is the largest block of
+memory allocated by Python and numpy during one call. The import time is measured in a new interpreter.
+"""
+
+# Script information for the file.
+__author__ = "Hendrix Demers (hendrix.demers@mail.mcgill.ca)"
+__version__ = ""
+__date__ = ""
+__copyright__ = "Copyright (c) 2012 Hendrix Demers"
+__license__ = ""
+
+# Standard library modules.
+import argparse
+import json
+import logging
+import platform
+import subprocess
+import sys
+import timeit
+import tracemalloc
+
+# Third party modules.
+import numpy as np
+
+# Local modules.
+
+# Project modules
+from pyIonisationCrossSection.benchmarks.cases import createCases, IMPORT_MODULES
+
+# Globals and constants variables.
+DEFAULT_SIZES = [1000, 100000, 10000000]
+DEFAULT_REPEAT = 3
+DEFAULT_TOLERANCE = 0.25
+MINIMUM_TIME_s = 0.1
+
+KEY_METADATA = "metadata"
+KEY_RESULTS = "results"
+KEY_TIME_s = "time_s"
+KEY_PEAK_MEMORY_B = "peakMemory_B"
+KEY_SIZE = "size"
+
+def timeFunction(function, repeat=DEFAULT_REPEAT, minimumTime_s=MINIMUM_TIME_s):
+    """
+    Return the best time per call in seconds, the number of calls of each repeat lasts at least `minimumTime_s`.
+    """
+    timer = timeit.Timer(function)
+    number = 1
+    while True:
+        time_s = timer.timeit(number)
+        if time_s >= minimumTime_s:
+            break
+        number *= 10 if time_s < minimumTime_s/10.0 else 2
+
+    times_s = [time_s] + timer.repeat(repeat - 1, number)
+    return min(times_s)/number
+
+def measurePeakMemory(function):
+    """
+    Return the peak memory in bytes allocated during one call of the function.
+    """
+    tracemalloc.start()
+    try:
+        function()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+def measureImportTime(moduleName, repeat=DEFAULT_REPEAT):
+    """
+    Return the best time in seconds to import the module in a new interpreter.
+    """
+    code = "import time; t = time.perf_counter(); import %s; print(time.perf_counter() - t)" % (moduleName)
+    times_s = []
+    for _index in range(repeat):
+        output = subprocess.check_output([sys.executable, "-c", code])
+        times_s.append(float(output.decode().strip()))
+    return min(times_s)
+
+def runBenchmarks(sizes=DEFAULT_SIZES, modelNames=None, repeat=DEFAULT_REPEAT, minimumTime_s=MINIMUM_TIME_s):
+    """
+    Run all the benchmarks, return a dictionary with the metadata and the results of each case.
+    """
+    results = {}
+
+    for moduleName in IMPORT_MODULES:
+        logging.info("import %s", moduleName)
+        results["import.%s" % (moduleName)] = {KEY_TIME_s: measureImportTime(moduleName, repeat),
+                                               KEY_PEAK_MEMORY_B: None, KEY_SIZE: None}
+
+    for case in createCases(sizes, modelNames):
+        logging.info(case.name)
+        results[case.name] = {KEY_TIME_s: timeFunction(case.function, repeat, minimumTime_s),
+                              KEY_PEAK_MEMORY_B: measurePeakMemory(case.function), KEY_SIZE: case.size}
+
+    metadata = {"python": platform.python_version(), "numpy": np.__version__, "platform": platform.platform(),
+                "machine": platform.machine(), "sizes": list(sizes), "repeat": repeat}
+
+    return {KEY_METADATA: metadata, KEY_RESULTS: results}
+
+def writeResults(results, filepath):
+    with open(filepath, 'w') as outputFile:
+        json.dump(results, outputFile, indent=2, sort_keys=True)
+
+def readResults(filepath):
+    with open(filepath, 'r') as inputFile:
+        return json.load(inputFile)
+
+def compareResults(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Return the regressions, the cases slower than the baseline by more than the relative `tolerance`.
+
+    Each regression is a tuple (name, time, baseline time, ratio), the cases missing from the baseline are skipped.
+    """
+    regressions = []
+    baselineResults = baseline[KEY_RESULTS]
+    for name, result in sorted(results[KEY_RESULTS].items()):
+        if name not in baselineResults:
+            continue
+
+        time_s = result[KEY_TIME_s]
+        baselineTime_s = baselineResults[name][KEY_TIME_s]
+        ratio = time_s/baselineTime_s
+        if ratio > 1.0 + tolerance:
+            regressions.append((name, time_s, baselineTime_s, ratio))
+
+    return regressions
+
+def formatResults(results):
+    lines = []
+    for name, result in sorted(results[KEY_RESULTS].items()):
+        line = "%-50s %12.3e s" % (name, result[KEY_TIME_s])
+        if result[KEY_SIZE]:
+            line += " %12.3e s/value" % (result[KEY_TIME_s]/result[KEY_SIZE])
+        if result[KEY_PEAK_MEMORY_B] is not None:
+            line += " %10.1f MiB" % (result[KEY_PEAK_MEMORY_B]/2.0**20)
+        lines.append(line)
+    return "\n".join(lines)
+
+def main(argv=None):
+    """
+    Run the benchmarks from the command line, return 1 if a regression is found.
+    """
+    parser = argparse.ArgumentParser(description="Benchmarks of the ionisation cross section models.")
+    parser.add_argument("--output", help="JSON file of the results")
+    parser.add_argument("--baseline", help="JSON file of the baseline results to compare with")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="relative slowdown flagged as a regression (default: %(default)s)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="number of energies of the batches (default: %(default)s)")
+    parser.add_argument("--models", nargs="+", help="names of the models to benchmark (default: all)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    arguments = parser.parse_args(argv)
+
+    results = runBenchmarks(arguments.sizes, arguments.models, arguments.repeat)
+    print(formatResults(results))
+
+    if arguments.output:
+        writeResults(results, arguments.output)
+
+    if arguments.baseline:
+        regressions = compareResults(results, readResults(arguments.baseline), arguments.tolerance)
+        for name, time_s, baselineTime_s, ratio in regressions:
+            print("Regression %s: %.3e s instead of %.3e s (x%.2f)" % (name, time_s, baselineTime_s, ratio))
+        if regressions:
+            return 1
+
+    return 0
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+"""
+.. py:currentmodule:: benchmarks.test_runner
+.. moduleauthor:: Hendrix Demers <hendrix.demers@mail.mcgill.ca>
+
+Tests for the module `runner`.
+"""
+
+# Script information for the file.
+__author__ = "Hendrix Demers (hendrix.demers@mail.mcgill.ca)"
+__version__ = ""
+__date__ = ""
+__copyright__ = "Copyright (c) 2012 Hendrix Demers"
+__license__ = ""
+
+# Standard library modules.
+import unittest
+import logging
+import os.path
+import shutil
+import tempfile
+from unittest import mock
+
+# Third party modules.
+import numpy as np
+
+# Local modules.
+
+# Project modules
+import pyIonisationCrossSection.benchmarks.runner as runner
+import pyIonisationCrossSection.bote2009 as bote2009
+
+# Globals and constants variables.
+
+class Testrunner(unittest.TestCase):
+    """
+    TestCase class for the module `runner`.
+    """
+
+    def setUp(self):
+        """
+        Setup method.
+        """
+
+        unittest.TestCase.setUp(self)
+
+    def tearDown(self):
+        """
+        Teardown method.
+        """
+
+        unittest.TestCase.tearDown(self)
+
+    def testSkeleton(self):
+        """
+        First test to check if the testcase is working with the testing framework.
+        """
+
+        #self.fail("Test if the testcase is working.")
+        self.assertTrue(True)
+
+    def test_measurePeakMemory(self):
+        """
+        Tests for method `measurePeakMemory`.
+        """
+
+        peak = runner.measurePeakMemory(lambda: np.ones(1000000))
+        self.assertTrue(peak >= 8000000)
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_compareResults(self):
+        """
+        Tests for method `compareResults`.
+        """
+
+        baseline = {runner.KEY_RESULTS: {"a": {runner.KEY_TIME_s: 1.0}, "b": {runner.KEY_TIME_s: 1.0}}}
+        results = {runner.KEY_RESULTS: {"a": {runner.KEY_TIME_s: 1.2}, "b": {runner.KEY_TIME_s: 1.5},
+                                        "c": {runner.KEY_TIME_s: 10.0}}}
+
+        regressions = runner.compareResults(results, baseline, tolerance=0.25)
+        self.assertEquals([("b", 1.5, 1.0, 1.5)], regressions)
+        self.assertEquals(2, len(runner.compareResults(results, baseline, tolerance=0.1)))
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_runBenchmarks(self):
+        """
+        Tests for method `runBenchmarks` and the results file.
+        """
+
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        filepath = os.path.join(path, "benchmarks.json")
+        environment = mock.patch.dict(os.environ, {bote2009.CACHE_DIRECTORY_VARIABLE: os.path.join(path, "cache")})
+        environment.start()
+        self.addCleanup(environment.stop)
+
+        results = runner.runBenchmarks(sizes=[10], modelNames=["jakoby1987"], repeat=1, minimumTime_s=1.0e-3)
+        self.assertTrue("jakoby1987.scalar" in results[runner.KEY_RESULTS])
+        self.assertTrue("jakoby1987.batch.single_Z.10" in results[runner.KEY_RESULTS])
+        self.assertTrue("bote2009.readOriginalDataFile" in results[runner.KEY_RESULTS])
+        self.assertTrue("import.pyIonisationCrossSection.bote2009" in results[runner.KEY_RESULTS])
+        for result in results[runner.KEY_RESULTS].values():
+            self.assertTrue(result[runner.KEY_TIME_s] > 0.0)
+
+        runner.writeResults(results, filepath)
+        self.assertEquals(results, runner.readResults(filepath))
+        self.assertEquals([], runner.compareResults(results, runner.readResults(filepath)))
+
+        #self.fail("Test if the testcase is working.")
+
+if __name__ == '__main__':  #pragma: no cover
+    logging.getLogger().setLevel(logging.DEBUG)
+    from pyHendrixDemersTools.Testings import runTestModuleWithCoverage
+    runTestModuleWithCoverage(__file__)
@@ -14,20 +14,28 @@ __copyright__ = "Copyright (c) 2012 Hendrix Demers"
 __license__ = ""
 
 # Standard library modules.
+import bisect
 import logging
 import os.path
 import csv
+import collections
+import glob
+import io
+import math
+import hashlib
+import tempfile
+import threading
+import types
 
 # Third party modules.
 # import matplotlib.pyplot as plt
 import numpy as np
-# from scipy.constants import physical_constants
 
 # Local modules.
 from pyIonisationCrossSection import get_current_module_path
-# import pyHendrixDemersTools.NumericConversion as NumericConversion
 from pyIonisationCrossSection.units import cm2_to_nm2
 import pyIonisationCrossSection.atomic_shell as ashell
+from pyIonisationCrossSection.model import IonisationCrossSectionModel, getShellIndexes
 
 # Project modules
 
@@ -75,190 +83,488 @@ KEY_g2 = "g2"
 KEY_g3 = "g3"
 KEY_g4 = "g4"
 
-class Bote2009(object):
-    def __init__(self):
-        self.data = {}
-
-    def readOriginalDataFile(self, dataFilepath):
-        lines = open(dataFilepath, "r").readlines()
-
-        isReadingFactorsA = False
-        isReadingFactorsD = False
-        isReadingFactorsG = False
-        isNewAtomicNumber = False
-
-        _lineNumber = 1
-        for line in lines:
+SUBSHELLS = [SUBSHELL_K, SUBSHELL_L1, SUBSHELL_L2, SUBSHELL_L3,
+             SUBSHELL_M1, SUBSHELL_M2, SUBSHELL_M3, SUBSHELL_M4, SUBSHELL_M5]
+SUBSHELL_INDEXES = dict((subshell, index) for index, subshell in enumerate(SUBSHELLS))
+
+# Subshell index of the shells of the module `atomic_shell`.
+SHELLS = [ashell.SHELL_K, ashell.SHELL_LI, ashell.SHELL_LII, ashell.SHELL_LIII,
+          ashell.SHELL_MI, ashell.SHELL_MII, ashell.SHELL_MIII, ashell.SHELL_MIV, ashell.SHELL_MV]
+SHELL_INDEXES = dict((shell, index) for index, shell in enumerate(SHELLS))
+
+SHELL_GROUP_K = "K"
+SHELL_GROUP_L = "L"
+SHELL_GROUP_M = "M"
+SHELL_GROUP_TOTAL = "Total"
+SHELL_GROUPS = {SHELL_GROUP_K: [SUBSHELL_K],
+                SHELL_GROUP_L: [SUBSHELL_L1, SUBSHELL_L2, SUBSHELL_L3],
+                SHELL_GROUP_M: [SUBSHELL_M1, SUBSHELL_M2, SUBSHELL_M3, SUBSHELL_M4, SUBSHELL_M5],
+                SHELL_GROUP_TOTAL: SUBSHELLS}
+
+# Coefficient ordering of the last axis of the parameter table, the first 18 follow the columns of the tabulated file.
+PARAMETER_KEYS = [KEY_Eca_eV, KEY_a1, KEY_a2, KEY_a3, KEY_a4, KEY_a5,
+                  KEY_d1, KEY_d2, KEY_d3, KEY_d4, KEY_d5,
+                  KEY_B_ELECTRON, KEY_B_POSITRON, KEY_A_SUBSHELL, KEY_g1, KEY_g2, KEY_g3, KEY_g4,
+                  KEY_Ecd_eV]
+(INDEX_Eca_eV, INDEX_a1, INDEX_a2, INDEX_a3, INDEX_a4, INDEX_a5,
+ INDEX_d1, INDEX_d2, INDEX_d3, INDEX_d4, INDEX_d5,
+ INDEX_B_ELECTRON, INDEX_B_POSITRON, INDEX_A_SUBSHELL, INDEX_g1, INDEX_g2, INDEX_g3, INDEX_g4,
+ INDEX_Ecd_eV) = range(len(PARAMETER_KEYS))
+PARAMETER_INDEXES = dict((key, index) for index, key in enumerate(PARAMETER_KEYS))
+NUMBER_PARAMETERS = len(PARAMETER_KEYS)
+NUMBER_TABULATED_PARAMETERS = NUMBER_PARAMETERS - 1
+
+# Parameters read after the (Z, subshell) columns in each table of the original data file.
+ORIGINAL_TABLE_KEYS = {KEY_FACTORS_A: [KEY_Eca_eV, KEY_a1, KEY_a2, KEY_a3, KEY_a4, KEY_a5],
+                       KEY_FACTORS_D: [KEY_Ecd_eV, KEY_d1, KEY_d2, KEY_d3, KEY_d4, KEY_d5],
+                       KEY_FACTORS_G: [KEY_B_ELECTRON, KEY_B_POSITRON, KEY_A_SUBSHELL, KEY_g1, KEY_g2, KEY_g3, KEY_g4]}
+ORIGINAL_TABLE_INDEXES = dict((table, [PARAMETER_INDEXES[key] for key in keys]) for table, keys in ORIGINAL_TABLE_KEYS.items())
+
+MAXIMUM_ATOMIC_NUMBER = 99
+
+# Environment variable of the directory of the binary cache files.
+CACHE_DIRECTORY_VARIABLE = "PYIONISATIONCROSSSECTION_CACHE_DIR"
+
+BOHR_RADIUS_cm = 5.2917721067e-9
+REST_MASS_eV = 0.5109989461e6
+FACTOR_4_PI_A0_2_cm2 = 4.0 * np.pi * BOHR_RADIUS_cm * BOHR_RADIUS_cm
+
+# Parameter index of the ionization energy of each particle.
+IONIZATION_ENERGY_INDEXES = {PARTICLE_ELECTRON: INDEX_Eca_eV, PARTICLE_POSITRON: INDEX_Ecd_eV}
+
+def _getIonizationEnergyIndex(particle):
+    """
+    Return the parameter index of the ionization energy of a particle, an unknown particle raises ValueError.
+    """
+    try:
+        return IONIZATION_ENERGY_INDEXES[particle]
+    except KeyError:
+        raise ValueError("Unknown particle: %s" % (particle))
+
+def createParameterTable():
+    """
+    Create an empty parameter table indexed by (Z, subshell index, coefficient index).
+
+    Missing (Z, subshell) entries are filled with NaN.
+    """
+    shape = (MAXIMUM_ATOMIC_NUMBER + 1, len(SUBSHELLS), NUMBER_PARAMETERS)
+    parameters = np.empty(shape, dtype=np.float64)
+    parameters.fill(np.nan)
+    return parameters
+
+class ThresholdIndex(object):
+    """
+    Sorted index of the ionization thresholds of a `Bote2009` model.
+
+    A (Z, subshell) pair is open at an energy larger than its threshold. The thresholds are kept sorted for each
+    element and for all the pairs together, so the open pairs and the edges inside an energy range are found by
+    bisection.
+    """
+
+    def __init__(self, model, particle=PARTICLE_ELECTRON):
+        indexIonizationEnergy = _getIonizationEnergyIndex(particle)
+
+        atomicNumbers, subshellIndexes = np.nonzero(model.isValid)
+        thresholds_eV = model.parameters[atomicNumbers, subshellIndexes, indexIonizationEnergy]
+
+        order = np.argsort(thresholds_eV, kind="stable")
+        self.thresholds_eV = thresholds_eV[order]
+        self._thresholdsList = self.thresholds_eV.tolist()
+        self.atomicNumbers = atomicNumbers[order]
+        self.subshellIndexes = subshellIndexes[order]
+
+        self._elementThresholds = {}
+        for atomicNumber in np.unique(atomicNumbers).tolist():
+            mask = self.atomicNumbers == atomicNumber
+            thresholds = self.thresholds_eV[mask].tolist()
+            subshells = [SUBSHELLS[index] for index in self.subshellIndexes[mask]]
+            self._elementThresholds[atomicNumber] = (thresholds, subshells)
+
+    def getElementThresholds(self, atomicNumber):
+        """
+        Return the thresholds (eV) of an element in increasing order and their subshells.
+        """
+        thresholds, subshells = self._elementThresholds.get(atomicNumber, ([], []))
+        return list(thresholds), list(subshells)
+
+    def getOpenSubshells(self, energy_eV, atomicNumber):
+        """
+        Return the subshells of an element with a threshold below the energy, the outer subshell first.
+        """
+        thresholds, subshells = self._elementThresholds.get(atomicNumber, ([], []))
+        return subshells[:bisect.bisect_left(thresholds, energy_eV)]
+
+    def getNumberOpenSubshells(self, energies_eV, atomicNumber):
+        """
+        Return the number of subshells of an element with a threshold below each energy of an array.
+        """
+        thresholds, _subshells = self._elementThresholds.get(atomicNumber, ([], []))
+        return np.searchsorted(thresholds, energies_eV, side="left")
+
+    def getOpenPairs(self, energy_eV):
+        """
+        Return the (Z, subshell) pairs with a threshold below the energy, in increasing threshold order.
+        """
+        numberOpen = bisect.bisect_left(self._thresholdsList, energy_eV)
+        return self._getPairs(0, numberOpen)
+
+    def getNumberOpenPairs(self, energies_eV):
+        """
+        Return the number of open (Z, subshell) pairs for each energy, the open pairs of an energy are the first
+        ones of `atomicNumbers` and `subshellIndexes`.
+        """
+        return np.searchsorted(self.thresholds_eV, energies_eV, side="left")
+
+    def getEdges(self, minimumEnergy_eV, maximumEnergy_eV):
+        """
+        Return the (threshold, Z, subshell) of the edges inside [minimumEnergy_eV, maximumEnergy_eV].
+        """
+        start = bisect.bisect_left(self._thresholdsList, minimumEnergy_eV)
+        stop = bisect.bisect_right(self._thresholdsList, maximumEnergy_eV)
+        thresholds = self._thresholdsList[start:stop]
+        return [(threshold_eV,) + pair for threshold_eV, pair in zip(thresholds, self._getPairs(start, stop))]
+
+    def getEdgeRanges(self, minimumEnergies_eV, maximumEnergies_eV):
+        """
+        Return the start and stop indexes in the sorted arrays of the edges inside each energy range.
+        """
+        starts = np.searchsorted(self.thresholds_eV, minimumEnergies_eV, side="left")
+        stops = np.searchsorted(self.thresholds_eV, maximumEnergies_eV, side="right")
+        return starts, np.maximum(starts, stops)
+
+    def _getPairs(self, start, stop):
+        atomicNumbers = self.atomicNumbers[start:stop].tolist()
+        subshellIndexes = self.subshellIndexes[start:stop].tolist()
+        return [(atomicNumber, SUBSHELLS[index]) for atomicNumber, index in zip(atomicNumbers, subshellIndexes)]
+
+OriginalRecord = collections.namedtuple("OriginalRecord", ["table", "atomicNumber", "subshell", "values"])
+
+def iterateOriginalDataFile(dataFilepath):
+    """
+    Yield one `OriginalRecord` for each (Z, subshell) row of the original tables file.
+
+    The file is read line by line, `table` is the header of the table (`KEY_FACTORS_A`, `KEY_FACTORS_D` or
+    `KEY_FACTORS_G`) and `values` are ordered as `ORIGINAL_TABLE_KEYS[table]`.
+    """
+    with io.open(dataFilepath, 'r', encoding="utf-8") as dataFile:
+        table = None
+        numberValues = 0
+        atomicNumber = None
+
+        for line in dataFile:
             line = line.strip()
-            #logging.debug("%4i %s", _lineNumber, line)
-            _lineNumber += 1
-
-            if line == KEY_FACTORS_A:
-                isReadingFactorsA = True
-                isReadingFactorsD = False
-                isReadingFactorsG = False
-                isNewAtomicNumber = True
-                continue
-            elif line == KEY_FACTORS_D:
-                isReadingFactorsA = False
-                isReadingFactorsD = True
-                isReadingFactorsG = False
-                isNewAtomicNumber = True
-                continue
-            elif line == KEY_FACTORS_G:
-                isReadingFactorsA = False
-                isReadingFactorsD = False
-                isReadingFactorsG = True
-                isNewAtomicNumber = True
-                continue
-            elif line == KEY_NEW_ATOMIC_NUMBER:
-                isNewAtomicNumber = True
-                continue
-            elif line == "":
-                if isReadingFactorsD or isReadingFactorsG:
-                    isNewAtomicNumber = True
+
+            if line in ORIGINAL_TABLE_KEYS:
+                table = line
+                numberValues = len(ORIGINAL_TABLE_KEYS[table])
+                atomicNumber = None
                 continue
             elif line.startswith("Table"):
-                isReadingFactorsA = False
-                isReadingFactorsD = False
-                isReadingFactorsG = False
+                table = None
+                continue
+            elif table is None or line == "" or line == KEY_NEW_ATOMIC_NUMBER:
                 continue
 
-            if isReadingFactorsA:
-                items = line.split(',')
-                if isNewAtomicNumber:
-                    atomicNumber = int(items[0])
-                    subshell = str(items[1])
-                    ionizationEnergy_eV = float(items[2])
-                    a1 = float(items[3])
-                    a2 = float(items[4])
-                    a3 = float(items[5])
-                    a4 = float(items[6])
-                    a5 = float(items[7])
-                    isNewAtomicNumber = False
-                else:
-                    subshell = str(items[0])
-                    ionizationEnergy_eV = float(items[1])
-                    a1 = float(items[2])
-                    a2 = float(items[3])
-                    a3 = float(items[4])
-                    a4 = float(items[5])
-                    a5 = float(items[6])
-
-                self.data.setdefault(atomicNumber, {})
-                self.data[atomicNumber].setdefault(subshell, {})
-                self.data[atomicNumber][subshell][KEY_Eca_eV] = ionizationEnergy_eV
-                self.data[atomicNumber][subshell][KEY_a1] = a1
-                self.data[atomicNumber][subshell][KEY_a2] = a2
-                self.data[atomicNumber][subshell][KEY_a3] = a3
-                self.data[atomicNumber][subshell][KEY_a4] = a4
-                self.data[atomicNumber][subshell][KEY_a5] = a5
-
-            if isReadingFactorsD:
-                items = line.split(',')
-                if isNewAtomicNumber:
-                    atomicNumber = int(items[0])
-                    subshell = str(items[1])
-                    ionizationEnergy_eV = float(items[2])
-                    d1 = float(items[3])
-                    d2 = float(items[4])
-                    d3 = float(items[5])
-                    d4 = float(items[6])
-                    d5 = float(items[7])
-                    isNewAtomicNumber = False
-                else:
-                    subshell = str(items[0])
-                    ionizationEnergy_eV = float(items[1])
-                    d1 = float(items[2])
-                    d2 = float(items[3])
-                    d3 = float(items[4])
-                    d4 = float(items[5])
-                    d5 = float(items[6])
-
-                self.data.setdefault(atomicNumber, {})
-                self.data[atomicNumber].setdefault(subshell, {})
-                self.data[atomicNumber][subshell][KEY_Ecd_eV] = ionizationEnergy_eV
-                self.data[atomicNumber][subshell][KEY_d1] = d1
-                self.data[atomicNumber][subshell][KEY_d2] = d2
-                self.data[atomicNumber][subshell][KEY_d3] = d3
-                self.data[atomicNumber][subshell][KEY_d4] = d4
-                self.data[atomicNumber][subshell][KEY_d5] = d5
-
-            if isReadingFactorsG:
-                items = line.split(',')
-                if isNewAtomicNumber:
-                    atomicNumber = int(items[0])
-                    subshell = str(items[1])
-                    bElectron = float(items[2])
-                    bPositron = float(items[3])
-                    Anlj = float(items[4])
-                    g1 = float(items[5])
-                    g2 = float(items[6])
-                    g3 = float(items[7])
-                    g4 = float(items[8])
-                    isNewAtomicNumber = False
-                else:
-                    subshell = str(items[0])
-                    bElectron = float(items[1])
-                    bPositron = float(items[2])
-                    Anlj = float(items[3])
-                    g1 = float(items[4])
-                    g2 = float(items[5])
-                    g3 = float(items[6])
-                    g4 = float(items[7])
-
-                self.data.setdefault(atomicNumber, {})
-                self.data[atomicNumber].setdefault(subshell, {})
-                self.data[atomicNumber][subshell][KEY_B_ELECTRON] = bElectron
-                self.data[atomicNumber][subshell][KEY_B_POSITRON] = bPositron
-                self.data[atomicNumber][subshell][KEY_A_SUBSHELL] = Anlj
-                self.data[atomicNumber][subshell][KEY_g1] = g1
-                self.data[atomicNumber][subshell][KEY_g2] = g2
-                self.data[atomicNumber][subshell][KEY_g3] = g3
-                self.data[atomicNumber][subshell][KEY_g4] = g4
+            items = line.split(',')
+            if items[0].isdigit():
+                atomicNumber = int(items[0])
+                items = items[1:]
+
+            values = [float(item) for item in items[1:numberValues + 1]]
+            yield OriginalRecord(table, atomicNumber, items[0], values)
+
+class SubshellEvaluator(object):
+    """
+    Cross section of one (Z, subshell, particle) with the coefficients bound as attributes.
+
+    Use `Bote2009.getEvaluator` to create an instance. Calling the instance computes the cross section (cm2) for a
+    scalar energy (eV) and `evaluate` for an array of energies. The DWBA formula of the particle is the method
+    `_computeCrossSectionDWBA(U)` of the subclasses `ElectronSubshellEvaluator` and `PositronSubshellEvaluator`.
+    """
+    __slots__ = ("atomicNumber", "subshell", "particle", "ionizationEnergy_eV", "factorB",
+                 "Anlj", "g1", "g2", "g3", "g4", "factor4PiA0_2_cm2", "_model", "_parameters")
+
+    def __init__(self, model, atomicNumber, subshell, particle, indexIonizationEnergy, indexFactorB):
+        parameters = model._getParameters(atomicNumber, subshell)
+
+        self.atomicNumber = atomicNumber
+        self.subshell = subshell
+        self.particle = particle
+        self.ionizationEnergy_eV = parameters[indexIonizationEnergy]
+        self.factorB = parameters[indexFactorB]
+        self.Anlj = parameters[INDEX_A_SUBSHELL]
+        self.g1 = parameters[INDEX_g1]
+        self.g2 = parameters[INDEX_g2]
+        self.g3 = parameters[INDEX_g3]
+        self.g4 = parameters[INDEX_g4]
+        self.factor4PiA0_2_cm2 = FACTOR_4_PI_A0_2_cm2
+
+        self._model = model
+        self._parameters = np.array(parameters)
+
+    def __call__(self, energy_eV):
+        ionizationEnergy_eV = self.ionizationEnergy_eV
 
-    def createTabulatedDataFile(self, dataFilepath):
-        self.readOriginalDataFile(dataFilepath)
+        if energy_eV > 16.0 * ionizationEnergy_eV:
+            E_eV = energy_eV
+            mc2_eV = REST_MASS_eV
+            momentum_eV = math.sqrt(E_eV * (E_eV + 2.0 * mc2_eV))
+            beta = momentum_eV / (E_eV + mc2_eV)
+            beta2 = beta * beta
+            xi = momentum_eV / mc2_eV
+
+            factorA_cm2 = self.factor4PiA0_2_cm2 * self.Anlj / beta2
+            factorB = (2.0 * math.log(xi) - beta2) * (1.0 + self.g1 / xi) + self.g2 \
+                + self.g3 * math.sqrt(math.sqrt(1.0 - beta2)) + self.g4 / xi
+            scalingFactor = E_eV / (E_eV + self.factorB * ionizationEnergy_eV)
+
+            return scalingFactor * factorA_cm2 * factorB
+
+        U = energy_eV / ionizationEnergy_eV
+        if U < 1.0:
+            return 0.0
 
-        path = os.path.dirname(dataFilepath)
-        filename = "bote2009_Parameters.csv"
-        filepath = os.path.join(path, filename)
-        assert filepath != dataFilepath
+        return self._computeCrossSectionDWBA(U)
+
+    def evaluate(self, energies_eV):
+        """
+        Compute the cross sections (cm2) for an array of energies (eV) or a `Kinematics`.
+        """
+        return self._model._computeCrossSections_cm2(energies_eV, self._parameters, self.particle)
+
+class ElectronSubshellEvaluator(SubshellEvaluator):
+    __slots__ = ("a1", "a2", "a3", "a4", "a5")
+
+    def __init__(self, model, atomicNumber, subshell):
+        SubshellEvaluator.__init__(self, model, atomicNumber, subshell, PARTICLE_ELECTRON, INDEX_Eca_eV, INDEX_B_ELECTRON)
+        self.a1, self.a2, self.a3, self.a4, self.a5 = self._parameters[INDEX_a1:INDEX_a5 + 1].tolist()
+
+    def _computeCrossSectionDWBA(self, U):
+        onePlusU = 1.0 + U
+        factorA_cm2 = self.factor4PiA0_2_cm2 * (U - 1.0) / (U * U)
+        factorB = self.a1 + self.a2 * U + self.a3 / onePlusU + self.a4 / onePlusU**3 + self.a5 / onePlusU**5
+
+        return factorA_cm2 * factorB * factorB
+
+class PositronSubshellEvaluator(SubshellEvaluator):
+    __slots__ = ("d1", "d2", "d3", "d4", "d5")
+
+    def __init__(self, model, atomicNumber, subshell):
+        SubshellEvaluator.__init__(self, model, atomicNumber, subshell, PARTICLE_POSITRON, INDEX_Ecd_eV, INDEX_B_POSITRON)
+        self.d1, self.d2, self.d3, self.d4, self.d5 = self._parameters[INDEX_d1:INDEX_d5 + 1].tolist()
+
+    def _computeCrossSectionDWBA(self, U):
+        onePlusU = 1.0 + U
+        factorA_cm2 = self.factor4PiA0_2_cm2 * (U - 1.0) / (U * U)
+        factorB = self.d1 + self.d2 * U + self.d3 / onePlusU + self.d4 * math.sqrt(U) / onePlusU**3 \
+            + self.d5 * U / onePlusU**5
+
+        factorB2 = factorB * factorB
+        return factorA_cm2 * factorB2 * factorB2
+
+def getCacheDirectory():
+    """
+    Return the directory of the binary cache files.
+
+    The directory is given by the environment variable `CACHE_DIRECTORY_VARIABLE`, by default it is in the user
+    cache directory, `XDG_CACHE_HOME` or ~/.cache.
+    """
+    cacheDirectory = os.environ.get(CACHE_DIRECTORY_VARIABLE)
+    if not cacheDirectory:
+        userCacheDirectory = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        cacheDirectory = os.path.join(userCacheDirectory, "pyIonisationCrossSection")
+    return cacheDirectory
+
+def getCacheFilepath(dataFilepath):
+    """
+    Return the binary cache file path of a tabulated parameters file.
+
+    The name contains a hash of the path of the data file and a hash of its modification time and size, so a
+    modified data file never reads a stale cache.
+    """
+    dataFilepath = os.path.abspath(dataFilepath)
+    status = os.stat(dataFilepath)
+    pathDigest = hashlib.sha1(dataFilepath.encode("utf-8")).hexdigest()[:8]
+    key = "%i-%i-%i" % (status.st_mtime_ns, status.st_size, NUMBER_PARAMETERS)
+    digest = hashlib.sha1(key.encode("ascii")).hexdigest()[:16]
+    filename = "%s.%s.%s.npy" % (os.path.basename(dataFilepath), pathDigest, digest)
+    return os.path.join(getCacheDirectory(), filename)
+
+def _readCacheFile(cacheFilepath):
+    if not os.path.isfile(cacheFilepath):
+        return None
+
+    try:
+        parameters = np.load(cacheFilepath, mmap_mode='r')
+    except (IOError, ValueError) as message:
+        logging.warning("Cannot read the cache file %s: %s", cacheFilepath, message)
+        return None
+
+    if parameters.shape != createParameterTable().shape or parameters.dtype != np.float64:
+        return None
+
+    return parameters
+
+def _writeCacheFile(cacheFilepath, parameters):
+    path = os.path.dirname(cacheFilepath)
+    cachePrefix = cacheFilepath.rsplit(".", 2)[0]
+
+    try:
+        os.makedirs(path, exist_ok=True)
+        fileDescriptor, temporaryFilepath = tempfile.mkstemp(suffix=".tmp", dir=path)
+    except OSError as message:
+        logging.warning("Cannot write the cache file %s: %s", cacheFilepath, message)
+        return
+
+    try:
+        with os.fdopen(fileDescriptor, 'wb') as cacheFile:
+            np.save(cacheFile, np.asarray(parameters, dtype=np.float64))
+        os.replace(temporaryFilepath, cacheFilepath)
+    except (IOError, OSError) as message:
+        logging.warning("Cannot write the cache file %s: %s", cacheFilepath, message)
+        os.remove(temporaryFilepath)
+        return
+
+    for staleFilepath in glob.glob(glob.escape(cachePrefix) + ".*.npy"):
+        if staleFilepath != cacheFilepath:
+            try:
+                os.remove(staleFilepath)
+            except OSError:
+                pass
+
+class Kinematics(object):
+    """
+    Relativistic kinematics of the incident particle for an array of energies.
+
+    The values only depend on the energy, so one instance can be passed as the energies of `Bote2009` methods
+    for every subshell and element evaluated on the same energy grid.
+    """
+    _ARRAY_NAMES = ("energies_eV", "beta", "beta2", "xi", "logXi2", "quarterPowerOneMinusBeta2")
+
+    def __init__(self, energies_eV):
+        E_eV = np.asarray(energies_eV, dtype=np.float64)
+        mc2_eV = REST_MASS_eV
+        momentum_eV = np.sqrt(E_eV * (E_eV + 2.0 * mc2_eV))
+
+        self.energies_eV = E_eV
+        self.beta = momentum_eV / (E_eV + mc2_eV)
+        self.beta2 = self.beta * self.beta
+        self.xi = momentum_eV / mc2_eV
+        with np.errstate(divide='ignore'):
+            self.logXi2 = 2.0 * np.log(self.xi)
+        self.quarterPowerOneMinusBeta2 = np.sqrt(np.sqrt(1.0 - self.beta2))
+
+    def select(self, mask):
+        """
+        Return the kinematics of the energies selected by `mask`, the energies are broadcast to the mask shape.
+        """
+        kinematics = Kinematics.__new__(Kinematics)
+        for name in self._ARRAY_NAMES:
+            values = np.broadcast_to(getattr(self, name), mask.shape)
+            setattr(kinematics, name, values[mask])
+        return kinematics
+
+def _gatherCoefficient(parameters, index, mask):
+    """
+    Return the coefficient `index` of the elements selected by `mask`, a single coefficient row stays a scalar.
+    """
+    coefficient = parameters[..., index]
+    if coefficient.ndim == 0:
+        return coefficient
+    return np.broadcast_to(coefficient, mask.shape)[mask]
+
+class Bote2009(IonisationCrossSectionModel):
+    name = "Bote (2009)"
+    shells = tuple(SHELLS)
+    maximumAtomicNumber = MAXIMUM_ATOMIC_NUMBER
+
+    def __init__(self):
+        self._isReadOnly = False
+        self.parameters = createParameterTable()
 
-        fieldsname = [KEY_ATOMIC_NUMBER, KEY_SUBSHELL, KEY_Eca_eV, KEY_a1, KEY_a2, KEY_a3, KEY_a4, KEY_a5,
-                      KEY_d1, KEY_d2, KEY_d3, KEY_d4, KEY_d5,
-                      KEY_B_ELECTRON, KEY_B_POSITRON, KEY_A_SUBSHELL, KEY_g1, KEY_g2, KEY_g3, KEY_g4]
+    def setReadOnly(self):
+        """
+        Make the model immutable, the parameter table cannot be written or replaced afterwards.
+        """
+        self._parameters.flags.writeable = False
+        self._isReadOnly = True
 
-        writer = csv.DictWriter(open(filepath, 'wb'), fieldsname)
+    @property
+    def isReadOnly(self):
+        return self._isReadOnly
 
-        for atomicNumber in self.data:
-            for subshell in self.data[atomicNumber]:
-                data = self.data[atomicNumber][subshell]
-                del data[KEY_Ecd_eV]
-                data[KEY_ATOMIC_NUMBER] = atomicNumber
-                data[KEY_SUBSHELL] = subshell
+    def readOriginalDataFile(self, dataFilepath):
+        parameters = np.array(self._parameters)
 
-                writer.writerow(data)
+        for record in iterateOriginalDataFile(dataFilepath):
+            subshellIndex = SUBSHELL_INDEXES[record.subshell]
+            parameters[record.atomicNumber, subshellIndex, ORIGINAL_TABLE_INDEXES[record.table]] = record.values
 
-    def readTabulatedDataFile(self, dataFilepath):
-        fieldsname = [KEY_ATOMIC_NUMBER, KEY_SUBSHELL, KEY_Eca_eV, KEY_a1, KEY_a2, KEY_a3, KEY_a4, KEY_a5,
-                      KEY_d1, KEY_d2, KEY_d3, KEY_d4, KEY_d5,
-                      KEY_B_ELECTRON, KEY_B_POSITRON, KEY_A_SUBSHELL, KEY_g1, KEY_g2, KEY_g3, KEY_g4]
+        self.parameters = parameters
 
-        reader = csv.DictReader(open(dataFilepath, 'r'), fieldsname)
+    def createTabulatedDataFile(self, dataFilepath):
+        self.readOriginalDataFile(dataFilepath)
 
-        for row in reader:
-            atomicNumber = int(row[KEY_ATOMIC_NUMBER])
-            subshell = row[KEY_SUBSHELL]
-            self.data.setdefault(atomicNumber, {})
-            self.data[atomicNumber].setdefault(subshell, {})
+        path = os.path.dirname(dataFilepath)
+        filename = "bote2009_Parameters.csv"
+        filepath = os.path.join(path, filename)
+        assert filepath != dataFilepath
 
-            self.data[atomicNumber][subshell] = row
-            self.data[atomicNumber][subshell][KEY_Ecd_eV]  = row[KEY_Eca_eV]
-            del self.data[atomicNumber][subshell][KEY_ATOMIC_NUMBER]
-            del self.data[atomicNumber][subshell][KEY_SUBSHELL]
-            for key in self.data[atomicNumber][subshell]:
-                self.data[atomicNumber][subshell][key] = float(self.data[atomicNumber][subshell][key])
+        with open(filepath, 'w', newline='') as parametersFile:
+            writer = csv.writer(parametersFile)
+
+            for atomicNumber, subshellIndex in zip(*np.nonzero(self._isValid)):
+                values = self._parameters[atomicNumber, subshellIndex, :NUMBER_TABULATED_PARAMETERS].tolist()
+                writer.writerow([int(atomicNumber), SUBSHELLS[subshellIndex]] + values)
+
+    def readTabulatedDataFile(self, dataFilepath, useCache=False):
+        """
+        Read the tabulated parameters file.
+
+        With `useCache`, the parameters are memory mapped from a binary cache in the directory of
+        `getCacheDirectory` and the model is read only. The cache is created on the first read and rebuilt when the
+        modification time or size of the data file changes.
+        """
+        if useCache:
+            cacheFilepath = getCacheFilepath(dataFilepath)
+            parameters = _readCacheFile(cacheFilepath)
+            if parameters is None:
+                self.readTabulatedDataFile(dataFilepath)
+                _writeCacheFile(cacheFilepath, self._parameters)
+                parameters = _readCacheFile(cacheFilepath)
+            if parameters is not None:
+                self.parameters = parameters
+            self.setReadOnly()
+            return
+
+        parameters = createParameterTable()
+
+        with open(dataFilepath, 'r') as dataFile:
+            for row in csv.reader(dataFile):
+                atomicNumber = int(row[0])
+                subshellIndex = SUBSHELL_INDEXES[row[1]]
+                values = parameters[atomicNumber, subshellIndex]
+                values[:NUMBER_TABULATED_PARAMETERS] = [float(item) for item in row[2:]]
+                values[INDEX_Ecd_eV] = values[INDEX_Eca_eV]
+
+        self.parameters = parameters
+
+    def _getParameters(self, atomicNumber, subshell):
+        """
+        Return the coefficients of one (Z, subshell) as a list of floats ordered as `PARAMETER_KEYS`.
+        """
+        if not 0 < atomicNumber <= MAXIMUM_ATOMIC_NUMBER:
+            raise KeyError((atomicNumber, subshell))
+        parameters = self._parameters[atomicNumber, SUBSHELL_INDEXES[subshell]].tolist()
+        if parameters[INDEX_Eca_eV] != parameters[INDEX_Eca_eV]:
+            raise KeyError((atomicNumber, subshell))
+        return parameters
+
+    def _getParameterArray(self, atomicNumber, subshell):
+        subshellIndex = SUBSHELL_INDEXES[subshell]
+        if not 0 < atomicNumber <= MAXIMUM_ATOMIC_NUMBER or not self._isValid[atomicNumber, subshellIndex]:
+            raise KeyError((atomicNumber, subshell))
+        return self._parameters[atomicNumber, subshellIndex]
 
     def convert_subshell(self, outside_subshell):
         if outside_subshell == ashell.SHELL_K:
@@ -280,16 +586,67 @@ class Bote2009(object):
         elif outside_subshell == ashell.SHELL_MV:
             return SUBSHELL_M5
 
+    def getThresholdIndex(self, particle=PARTICLE_ELECTRON):
+        """
+        Return the `ThresholdIndex` of the model, it is built on the first call.
+        """
+        thresholdIndex = self._thresholdIndexes.get(particle)
+        if thresholdIndex is None:
+            thresholdIndex = ThresholdIndex(self, particle)
+            self._thresholdIndexes[particle] = thresholdIndex
+        return thresholdIndex
+
+    def getEvaluator(self, atomicNumber, subshell, particle):
+        """
+        Return a `SubshellEvaluator` with the coefficients of (Z, subshell, particle) bound as attributes.
+        """
+        if particle == PARTICLE_ELECTRON:
+            return ElectronSubshellEvaluator(self, atomicNumber, subshell)
+        elif particle == PARTICLE_POSITRON:
+            return PositronSubshellEvaluator(self, atomicNumber, subshell)
+        else:
+            raise ValueError("Unknown particle: %s" % (particle))
+
     def ics_nm2(self, atomicNumber, ionisationEnergy_eV, electronEnergy_eV, shell):
         return cm2_to_nm2(self.crossSection_cm2(electronEnergy_eV, atomicNumber, self.convert_subshell(shell), PARTICLE_ELECTRON))
 
+    def ics_nm2_array(self, atomicNumbers, ionisationEnergies_eV, electronEnergies_eV, shells):
+        """
+        Compute the electron ionisation cross sections in nm2 of broadcastable arrays of arguments.
+
+        The ionisation energies of the model are used, `ionisationEnergies_eV` only sets the shape of the result.
+        The missing (Z, shell) pairs are zero.
+        """
+        atomicNumbers = np.asarray(atomicNumbers, dtype=np.int64)
+        subshellIndexes = getShellIndexes(shells, SHELL_INDEXES)
+        isInTable = (atomicNumbers > 0) & (atomicNumbers <= MAXIMUM_ATOMIC_NUMBER)
+        parameters = self._parameters[np.where(isInTable, atomicNumbers, 0), subshellIndexes]
+
+        shape = np.broadcast(parameters[..., INDEX_Eca_eV], ionisationEnergies_eV, electronEnergies_eV).shape
+        parameters = np.broadcast_to(parameters, shape + (NUMBER_PARAMETERS,))
+        energies_eV = np.broadcast_to(np.asarray(electronEnergies_eV, dtype=np.float64), shape)
+
+        crossSections = self._computeCrossSections_cm2(energies_eV, parameters, PARTICLE_ELECTRON)
+        return cm2_to_nm2(crossSections, out=crossSections)
+
+    def isSupported(self, atomicNumber, shell):
+        if not IonisationCrossSectionModel.isSupported(self, atomicNumber, shell):
+            return False
+        return bool(self._isValid[atomicNumber, SHELL_INDEXES[shell]])
+
     def crossSection_cm2(self, energy_eV, atomicNumber, subshell, particle):
+        if particle not in IONIZATION_ENERGY_INDEXES:
+            raise ValueError("Unknown particle: %s" % (particle))
+        if isinstance(energy_eV, Kinematics) or np.ndim(energy_eV) > 0:
+            return self._computeCrossSectionArray_cm2(energy_eV, atomicNumber, subshell, particle)
+
+        parameters = self._getParameters(atomicNumber, subshell)
         if particle == PARTICLE_ELECTRON:
-            ionizationEnergy_eV = self.data[atomicNumber][subshell][KEY_Eca_eV]
-            factorB = self.data[atomicNumber][subshell][KEY_B_ELECTRON]
+            ionizationEnergy_eV = parameters[INDEX_Eca_eV]
+            factorB = parameters[INDEX_B_ELECTRON]
         elif particle == PARTICLE_POSITRON:
-            ionizationEnergy_eV = self.data[atomicNumber][subshell][KEY_Ecd_eV]
-            factorB = self.data[atomicNumber][subshell][KEY_B_POSITRON]
+            ionizationEnergy_eV = parameters[INDEX_Ecd_eV]
+            factorB = parameters[INDEX_B_POSITRON]
 
         if energy_eV > 16.0 * ionizationEnergy_eV:
             crossSectionPWBA_cm2 = self._computeCrossSectionPWBA(energy_eV, atomicNumber, subshell)
@@ -305,23 +662,236 @@ class Bote2009(object):
 
         return crossSection_cm2
 
+    def _computeCrossSectionArray_cm2(self, energies_eV, atomicNumber, subshell, particle):
+        parameters = self._getParameterArray(atomicNumber, subshell)
+        return self._computeCrossSections_cm2(energies_eV, parameters, particle)
+
+    def crossSectionGrid_cm2(self, energies_eV, atomicNumbers, subshells, particle):
+        """
+        Compute the cross sections of every (Z, subshell) pair over the energies.
+
+        The result has the shape (number of Z, number of subshells) + energies shape, the missing (Z, subshell)
+        pairs are NaN. The energies can be given as a `Kinematics`.
+        """
+        _getIonizationEnergyIndex(particle)
+        atomicNumbers = np.asarray(atomicNumbers, dtype=np.int64).ravel()
+        subshellIndexes = np.array([SUBSHELL_INDEXES[subshell] for subshell in subshells], dtype=np.int64)
+        if not isinstance(energies_eV, Kinematics):
+            energies_eV = Kinematics(energies_eV)
+
+        isInTable = (atomicNumbers > 0) & (atomicNumbers <= MAXIMUM_ATOMIC_NUMBER)
+        rowIndexes = np.where(isInTable, atomicNumbers, 0)
+        parameters = self._parameters[rowIndexes[:, np.newaxis], subshellIndexes[np.newaxis, :]]
+        isMissing = np.isnan(parameters[:, :, INDEX_Eca_eV])
+
+        shape = parameters.shape[:2] + (1,) * energies_eV.energies_eV.ndim + (NUMBER_PARAMETERS,)
+        crossSections_cm2 = self._computeCrossSections_cm2(energies_eV, parameters.reshape(shape), particle)
+        crossSections_cm2[isMissing] = np.nan
+
+        return crossSections_cm2
+
+    def elementCrossSections_cm2(self, energies_eV, atomicNumber, particle):
+        """
+        Compute the cross sections of all the subshells of one element in one call.
+
+        Return the subshell cross sections, an array of shape (number of `SUBSHELLS`,) + energies shape where the
+        missing subshells are zero, and a dictionary of the cross sections summed over each of `SHELL_GROUPS`.
+        The subshells with a threshold above the largest energy are not evaluated.
+        """
+        indexIonizationEnergy = _getIonizationEnergyIndex(particle)
+        if not isinstance(energies_eV, Kinematics):
+            energies_eV = Kinematics(energies_eV)
+        energies = energies_eV.energies_eV
+
+        if not 0 < atomicNumber <= MAXIMUM_ATOMIC_NUMBER:
+            raise KeyError(atomicNumber)
+        parameters = self._parameters[atomicNumber]
+        isOpen = self._isValid[atomicNumber].copy()
+        if energies.size > 0:
+            isOpen[isOpen] = parameters[isOpen, indexIonizationEnergy] < np.max(energies)
+        else:
+            isOpen[:] = False
+
+        crossSections_cm2 = np.zeros((len(SUBSHELLS),) + energies.shape)
+        if np.any(isOpen):
+            openParameters = parameters[isOpen]
+            shape = openParameters.shape[:1] + (1,) * energies.ndim + (NUMBER_PARAMETERS,)
+            crossSections_cm2[isOpen] = self._computeCrossSections_cm2(energies_eV, openParameters.reshape(shape), particle)
+
+        shellCrossSections_cm2 = {}
+        for shellGroup, subshells in SHELL_GROUPS.items():
+            subshellIndexes = [SUBSHELL_INDEXES[subshell] for subshell in subshells]
+            shellCrossSections_cm2[shellGroup] = np.sum(crossSections_cm2[subshellIndexes], axis=0)
+
+        return crossSections_cm2, shellCrossSections_cm2
+
+    def crossSectionsElectronPositron_cm2(self, energies_eV, atomicNumber, subshell):
+        """
+        Compute the electron and positron cross sections of one subshell together.
+
+        The PWBA cross section, the kinematics and the DWBA powers of (1 + U) are computed once for both particles.
+        Return the electron and positron cross sections.
+        """
+        parameters = self._getParameterArray(atomicNumber, subshell)
+        if parameters[INDEX_Eca_eV] != parameters[INDEX_Ecd_eV]:
+            return (self._computeCrossSections_cm2(energies_eV, parameters, PARTICLE_ELECTRON),
+                    self._computeCrossSections_cm2(energies_eV, parameters, PARTICLE_POSITRON))
+
+        if isinstance(energies_eV, Kinematics):
+            kinematics = energies_eV
+            energies_eV = kinematics.energies_eV
+        else:
+            energies_eV = np.asarray(energies_eV, dtype=np.float64)
+            kinematics = None
+
+        ionizationEnergy_eV = parameters[INDEX_Eca_eV]
+        overvoltages = energies_eV / ionizationEnergy_eV
+        electronCrossSections_cm2 = np.zeros(overvoltages.shape)
+        positronCrossSections_cm2 = np.zeros(overvoltages.shape)
+
+        maskPWBA = overvoltages > 16.0
+        maskDWBA = (overvoltages >= 1.0) & ~maskPWBA
+
+        energiesPWBA_eV = energies_eV[maskPWBA]
+        if kinematics is None:
+            kinematicsPWBA = Kinematics(energiesPWBA_eV)
+        else:
+            kinematicsPWBA = kinematics.select(maskPWBA)
+        crossSectionsPWBA_cm2 = self._computeCrossSectionPWBAArray(kinematicsPWBA, parameters[INDEX_A_SUBSHELL:INDEX_g4 + 1])
+        electronCrossSections_cm2[maskPWBA] = energiesPWBA_eV / (energiesPWBA_eV + parameters[INDEX_B_ELECTRON]*ionizationEnergy_eV) * crossSectionsPWBA_cm2
+        positronCrossSections_cm2[maskPWBA] = energiesPWBA_eV / (energiesPWBA_eV + parameters[INDEX_B_POSITRON]*ionizationEnergy_eV) * crossSectionsPWBA_cm2
+
+        overvoltagesDWBA = overvoltages[maskDWBA]
+        factors = self._computeDWBAFactors(overvoltagesDWBA)
+        electronCrossSections_cm2[maskDWBA] = self._computeCrossSectionDWBAElectronArray(overvoltagesDWBA, parameters[INDEX_a1:INDEX_a5 + 1], factors)
+        positronCrossSections_cm2[maskDWBA] = self._computeCrossSectionDWBAPositronArray(overvoltagesDWBA, parameters[INDEX_d1:INDEX_d5 + 1], factors)
+
+        return electronCrossSections_cm2, positronCrossSections_cm2
+
+    def _computeCrossSections_cm2(self, energies_eV, parameters, particle):
+        """
+        Compute the cross sections, the DWBA and PWBA regimes are selected with masks.
+
+        The last axis of `parameters` is the coefficient axis and the other axes are broadcast with the energies.
+        When the energies are given as a `Kinematics`, its values are reused instead of computed again.
+        """
+        if particle == PARTICLE_ELECTRON:
+            indexIonizationEnergy = INDEX_Eca_eV
+            indexFactorB = INDEX_B_ELECTRON
+        elif particle == PARTICLE_POSITRON:
+            indexIonizationEnergy = INDEX_Ecd_eV
+            indexFactorB = INDEX_B_POSITRON
+        else:
+            raise ValueError("Unknown particle: %s" % (particle))
+
+        if isinstance(energies_eV, Kinematics):
+            kinematics = energies_eV
+            energies_eV = kinematics.energies_eV
+        else:
+            kinematics = None
+            energies_eV = np.asarray(energies_eV, dtype=np.float64)
+        parameters = np.asarray(parameters)
+        overvoltages = energies_eV / parameters[..., indexIonizationEnergy]
+        energies_eV = np.broadcast_to(energies_eV, overvoltages.shape)
+        crossSections_cm2 = np.zeros(overvoltages.shape)
+
+        maskPWBA = overvoltages > 16.0
+        maskDWBA = (overvoltages >= 1.0) & ~maskPWBA
+
+        energiesPWBA_eV = energies_eV[maskPWBA]
+        if kinematics is None:
+            kinematicsPWBA = Kinematics(energiesPWBA_eV)
+        else:
+            kinematicsPWBA = kinematics.select(maskPWBA)
+        ionizationEnergies_eV = _gatherCoefficient(parameters, indexIonizationEnergy, maskPWBA)
+        factorB = _gatherCoefficient(parameters, indexFactorB, maskPWBA)
+        coefficients = [_gatherCoefficient(parameters, index, maskPWBA) for index in (INDEX_A_SUBSHELL, INDEX_g1, INDEX_g2, INDEX_g3, INDEX_g4)]
+        scalingFactors = energiesPWBA_eV / (energiesPWBA_eV + factorB*ionizationEnergies_eV)
+        crossSections_cm2[maskPWBA] = scalingFactors * self._computeCrossSectionPWBAArray(kinematicsPWBA, coefficients)
+
+        overvoltagesDWBA = overvoltages[maskDWBA]
+        if particle == PARTICLE_ELECTRON:
+            coefficients = [_gatherCoefficient(parameters, index, maskDWBA) for index in (INDEX_a1, INDEX_a2, INDEX_a3, INDEX_a4, INDEX_a5)]
+            crossSections_cm2[maskDWBA] = self._computeCrossSectionDWBAElectronArray(overvoltagesDWBA, coefficients)
+        elif particle == PARTICLE_POSITRON:
+            coefficients = [_gatherCoefficient(parameters, index, maskDWBA) for index in (INDEX_d1, INDEX_d2, INDEX_d3, INDEX_d4, INDEX_d5)]
+            crossSections_cm2[maskDWBA] = self._computeCrossSectionDWBAPositronArray(overvoltagesDWBA, coefficients)
+
+        return crossSections_cm2
+
+    def _computeDWBAFactors(self, overvoltages):
+        """
+        Return the factors of the DWBA formulas shared by electrons and positrons: 4 pi a0^2 (U - 1)/U^2 and
+        the powers (1 + U)^-1, (1 + U)^-3 and (1 + U)^-5.
+        """
+        U = overvoltages
+        inverse1 = 1.0 / (1.0 + U)
+        inverse2 = inverse1 * inverse1
+        inverse3 = inverse2 * inverse1
+        inverse5 = inverse3 * inverse2
+        factorA_cm2 = FACTOR_4_PI_A0_2_cm2 * (U - 1.0) / (U * U)
+
+        return factorA_cm2, inverse1, inverse3, inverse5
+
+    def _computeCrossSectionDWBAElectronArray(self, overvoltages, coefficients, factors=None):
+        U = overvoltages
+        a1, a2, a3, a4, a5 = coefficients
+        if factors is None:
+            factors = self._computeDWBAFactors(U)
+        factorA_cm2, inverse1, inverse3, inverse5 = factors
+
+        factorB = a1 + a2 * U + a3 * inverse1 + a4 * inverse3 + a5 * inverse5
+
+        return factorA_cm2 * factorB * factorB
+
+    def _computeCrossSectionDWBAPositronArray(self, overvoltages, coefficients, factors=None):
+        U = overvoltages
+        d1, d2, d3, d4, d5 = coefficients
+        if factors is None:
+            factors = self._computeDWBAFactors(U)
+        factorA_cm2, inverse1, inverse3, inverse5 = factors
+
+        factorB = d1 + d2 * U + d3 * inverse1 + d4 * np.sqrt(U) * inverse3 + d5 * U * inverse5
+
+        factorB2 = factorB * factorB
+        return factorA_cm2 * factorB2 * factorB2
+
+    def _computeCrossSectionPWBAArray(self, kinematics, coefficients):
+        Anlj, g1, g2, g3, g4 = coefficients
+        beta2 = kinematics.beta2
+        xi = kinematics.xi
+
+        factorA_cm2 = FACTOR_4_PI_A0_2_cm2 * Anlj / beta2
+
+        term1 = (kinematics.logXi2 - beta2) * (1.0 + g1 / xi)
+        term2 = g2
+        term3 = g3 * kinematics.quarterPowerOneMinusBeta2
+        term4 = g4 / xi
+        factorB = term1 + term2 + term3 + term4
+
+        return factorA_cm2 * factorB
+
     def _computeCrossSectionDWBAElectron(self, overvoltage, atomicNumber, subshell):
+        if np.ndim(overvoltage) > 0:
+            parameters = self._getParameterArray(atomicNumber, subshell)
+            return self._computeCrossSectionDWBAMasked(overvoltage, parameters[INDEX_a1:INDEX_a5 + 1],
+                                                       self._computeCrossSectionDWBAElectronArray)
+
         if overvoltage < 1.0:
             return 0.0
 
         U = overvoltage
 
-        a0_m = physical_constants["Bohr radius"][0]
-        a0_cm = NumericConversion.m_To_cm(a0_m)
+        parameters = self._getParameters(atomicNumber, subshell)
+        a1 = parameters[INDEX_a1]
+        a2 = parameters[INDEX_a2]
+        a3 = parameters[INDEX_a3]
+        a4 = parameters[INDEX_a4]
+        a5 = parameters[INDEX_a5]
 
-        a1 = self.data[atomicNumber][subshell][KEY_a1]
-        a2 = self.data[atomicNumber][subshell][KEY_a2]
-        a3 = self.data[atomicNumber][subshell][KEY_a3]
-        a4 = self.data[atomicNumber][subshell][KEY_a4]
-        a5 = self.data[atomicNumber][subshell][KEY_a5]
-
-        factorA_cm2 = 4.0 * np.pi * a0_cm * a0_cm * (U - 1.0) / (U * U)
-        factorB = a1 + a2 * U + a3 / (1.0 + U) + a4 / np.power(1.0 + U, 3.0) + a5 / np.power(1.0 + U, 5.0)
+        onePlusU = 1.0 + U
+        factorA_cm2 = FACTOR_4_PI_A0_2_cm2 * (U - 1.0) / (U * U)
+        factorB = a1 + a2 * U + a3 / onePlusU + a4 / onePlusU**3 + a5 / onePlusU**5
 
         crossSection_cm2 = factorA_cm2 * factorB * factorB
         assert crossSection_cm2 >= 0.0
@@ -329,51 +899,61 @@ class Bote2009(object):
         return crossSection_cm2
 
     def _computeCrossSectionDWBAPositron(self, overvoltage, atomicNumber, subshell):
+        if np.ndim(overvoltage) > 0:
+            parameters = self._getParameterArray(atomicNumber, subshell)
+            return self._computeCrossSectionDWBAMasked(overvoltage, parameters[INDEX_d1:INDEX_d5 + 1],
+                                                       self._computeCrossSectionDWBAPositronArray)
+
         if overvoltage < 1.0:
             return 0.0
 
         U = overvoltage
 
-        a0_m = physical_constants["Bohr radius"][0]
-        a0_cm = NumericConversion.m_To_cm(a0_m)
-
-        d1 = self.data[atomicNumber][subshell][KEY_d1]
-        d2 = self.data[atomicNumber][subshell][KEY_d2]
-        d3 = self.data[atomicNumber][subshell][KEY_d3]
-        d4 = self.data[atomicNumber][subshell][KEY_d4]
-        d5 = self.data[atomicNumber][subshell][KEY_d5]
+        parameters = self._getParameters(atomicNumber, subshell)
+        d1 = parameters[INDEX_d1]
+        d2 = parameters[INDEX_d2]
+        d3 = parameters[INDEX_d3]
+        d4 = parameters[INDEX_d4]
+        d5 = parameters[INDEX_d5]
 
-        factorA_cm2 = 4.0 * np.pi * a0_cm * a0_cm * (U - 1.0) / (U * U)
-        factorB = d1 + d2 * U + d3 / (1.0 + U) + d4 * np.sqrt(U) / np.power(1.0 + U, 3.0) + d5 * U / np.power(1.0 + U, 5.0)
+        onePlusU = 1.0 + U
+        factorA_cm2 = FACTOR_4_PI_A0_2_cm2 * (U - 1.0) / (U * U)
+        factorB = d1 + d2 * U + d3 / onePlusU + d4 * math.sqrt(U) / onePlusU**3 + d5 * U / onePlusU**5
 
-        crossSection_cm2 = factorA_cm2 * factorB * factorB * factorB * factorB
+        factorB2 = factorB * factorB
+        crossSection_cm2 = factorA_cm2 * factorB2 * factorB2
         assert crossSection_cm2 >= 0.0
 
         return crossSection_cm2
 
+    def _computeCrossSectionDWBAMasked(self, overvoltages, coefficients, computeCrossSection):
+        overvoltages = np.asarray(overvoltages, dtype=np.float64)
+        crossSections_cm2 = np.zeros(overvoltages.shape)
+
+        mask = overvoltages >= 1.0
+        crossSections_cm2[mask] = computeCrossSection(overvoltages[mask], coefficients)
+
+        return crossSections_cm2
+
     def _computeCrossSectionPWBA(self, energy_eV, atomicNumber, subshell):
-        ionizationEnergy_eV = self.data[atomicNumber][subshell][KEY_Eca_eV]
+        parameters = self._getParameters(atomicNumber, subshell)
+        ionizationEnergy_eV = parameters[INDEX_Eca_eV]
         overvoltage = energy_eV / ionizationEnergy_eV
         if overvoltage < 16.0:
             return 0.0
 
-        # a0_m = physical_constants["Bohr radius"][0]
-        a0_m = 5.2917721067e-11
-        # a0_cm = NumericConversion.m_To_cm(a0_m)
-        a0_cm = a0_m * 1.0e2
-
-        Anlj = self.data[atomicNumber][subshell][KEY_A_SUBSHELL]
+        Anlj = parameters[INDEX_A_SUBSHELL]
 
         beta = self._computeBeta(energy_eV)
 
         xi = self._computeXi(energy_eV)
 
-        g1 = self.data[atomicNumber][subshell][KEY_g1]
-        g2 = self.data[atomicNumber][subshell][KEY_g2]
-        g3 = self.data[atomicNumber][subshell][KEY_g3]
-        g4 = self.data[atomicNumber][subshell][KEY_g4]
+        g1 = parameters[INDEX_g1]
+        g2 = parameters[INDEX_g2]
+        g3 = parameters[INDEX_g3]
+        g4 = parameters[INDEX_g4]
 
-        factorA_cm2 = 4.0 * np.pi * a0_cm * a0_cm * Anlj / (beta * beta)
+        factorA_cm2 = FACTOR_4_PI_A0_2_cm2 * Anlj / (beta * beta)
 
         term1 = (np.log(xi * xi) - beta * beta) * (1.0 + g1 / xi)
         term2 = g2
@@ -419,12 +999,55 @@ class Bote2009(object):
 
         return xi
 
+    @property
+    def parameters(self):
+        """
+        Parameter table indexed by (Z, subshell index, coefficient index), see `SUBSHELLS` and `PARAMETER_KEYS`.
+        """
+        return self._parameters
+    @parameters.setter
+    def parameters(self, parameters):
+        if self._isReadOnly:
+            raise AttributeError("The parameters of a read only model cannot be modified.")
+        self._parameters = parameters
+        self._isValid = np.isfinite(parameters[:, :, INDEX_Eca_eV])
+        self._data = None
+        self._thresholdIndexes = {}
+
+    @property
+    def isValid(self):
+        """
+        Mask of the (Z, subshell index) entries present in the parameter table.
+        """
+        return self._isValid
+
     @property
     def data(self):
+        """
+        Compatibility view of the parameter table as `data[Z][subshell][key]` nested mappings.
+
+        The view is read only, writing an item raises TypeError. Assign a nested dictionary to `data`, or modify
+        `parameters`, to change the parameters.
+        """
+        if self._data is None:
+            data = {}
+            for atomicNumber, subshellIndex in zip(*np.nonzero(self._isValid)):
+                values = self._parameters[atomicNumber, subshellIndex].tolist()
+                subshells = data.setdefault(int(atomicNumber), {})
+                subshells[SUBSHELLS[subshellIndex]] = types.MappingProxyType(dict(zip(PARAMETER_KEYS, values)))
+            self._data = types.MappingProxyType(dict((atomicNumber, types.MappingProxyType(subshells))
+                                                     for atomicNumber, subshells in data.items()))
         return self._data
     @data.setter
     def data(self, data):
-        self._data = data
+        parameters = createParameterTable()
+        for atomicNumber in data:
+            for subshell in data[atomicNumber]:
+                values = parameters[atomicNumber, SUBSHELL_INDEXES[subshell]]
+                for index, key in enumerate(PARAMETER_KEYS):
+                    values[index] = data[atomicNumber][subshell].get(key, np.nan)
+
+        self.parameters = parameters
 
 def runCreateDataFile():
     dataFilepath = get_current_module_path(__file__, "../data/bote2009_tables.csv")
@@ -432,15 +1055,65 @@ def runCreateDataFile():
     model = Bote2009()
     model.createTabulatedDataFile(dataFilepath)
 
-def getModel():
-    dataFilepath = get_current_module_path(__file__, "../data/bote2009_Parameters.csv")
+def getDefaultDataFilepath():
+    return get_current_module_path(__file__, "../data/bote2009_Parameters.csv")
+
+def getModel(useCache=False):
+    dataFilepath = getDefaultDataFilepath()
 
     model = Bote2009()
-    model.readTabulatedDataFile(dataFilepath)
+    model.readTabulatedDataFile(dataFilepath, useCache)
+
+    return model
+
+_sharedModels = {}
+_sharedModelsLock = threading.Lock()
+
+def getSharedModel(dataFilepath=None, useCache=False):
+    """
+    Return the process-wide read only model of a tabulated parameters file.
+
+    The model is read on the first call for each data file and the same instance is returned afterwards. The
+    binary cache of `readTabulatedDataFile` is only used with `useCache` on the first call.
+    """
+    if dataFilepath is None:
+        dataFilepath = getDefaultDataFilepath()
+    key = os.path.abspath(dataFilepath)
+
+    model = _sharedModels.get(key)
+    if model is None:
+        with _sharedModelsLock:
+            model = _sharedModels.get(key)
+            if model is None:
+                model = Bote2009()
+                model.readTabulatedDataFile(key, useCache)
+                if not model.isReadOnly:
+                    model.setReadOnly()
+                _sharedModels[key] = model
 
     return model
 
+def reloadSharedModel(dataFilepath=None, useCache=False):
+    """
+    Read again the data file and replace the shared model, previously returned instances are not modified.
+    """
+    if dataFilepath is None:
+        dataFilepath = getDefaultDataFilepath()
+    key = os.path.abspath(dataFilepath)
+
+    with _sharedModelsLock:
+        _sharedModels.pop(key, None)
+
+    return getSharedModel(key, useCache)
+
+def clearSharedModels():
+    with _sharedModelsLock:
+        _sharedModels.clear()
+
 def runGraphicsBote2009():
+    import matplotlib.pyplot as plt
+    from pyIonisationCrossSection.units import cm2_to_barn
+
     model = getModel()
 
     energies_eV = np.logspace(3.0, 9.0, 1000)
@@ -450,7 +1123,7 @@ def runGraphicsBote2009():
 
     plt.figure()
     for subshell in subshells:
-        crossSections_cm2 = [model.crossSection_cm2(energy_eV, atomicNumber, subshell, particle) for energy_eV in energies_eV]
+        crossSections_cm2 = model.crossSection_cm2(energies_eV, atomicNumber, subshell, particle)
 
         plt.loglog(energies_eV, crossSections_cm2, label=subshell)
 
@@ -460,8 +1133,8 @@ def runGraphicsBote2009():
 
     plt.figure()
     for subshell in subshells:
-        crossSections_cm2 = [model.crossSection_cm2(energy_eV, atomicNumber, subshell, particle) for energy_eV in energies_eV]
-        crossSections_barn = [NumericConversion.cm2_To_barn(crossSection_cm2) for crossSection_cm2 in crossSections_cm2]
+        crossSections_cm2 = model.crossSection_cm2(energies_eV, atomicNumber, subshell, particle)
+        crossSections_barn = cm2_to_barn(crossSections_cm2)
         plt.loglog(energies_eV, crossSections_barn, label=subshell)
 
     plt.xlabel(r"E (eV)")
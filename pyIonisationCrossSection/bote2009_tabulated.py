@@ -0,0 +1,297 @@
+#!/usr/bin/env python
+"""
+.. py:currentmodule:: bote2009_tabulated
+.. moduleauthor:: Hendrix Demers <hendrix.demers@mail.mcgill.ca>
+
+Tabulated Bote Salvat ionization cross section evaluated by log-log interpolation.
+"""
+
+# Script information for the file.
+__author__ = "Hendrix Demers (hendrix.demers@mail.mcgill.ca)"
+__version__ = ""
+__date__ = ""
+__copyright__ = "Copyright (c) 2012 Hendrix Demers"
+__license__ = ""
+
+# Standard library modules.
+import math
+
+# Third party modules.
+import numpy as np
+
+# Local modules.
+from pyIonisationCrossSection.units import cm2_to_nm2
+from pyIonisationCrossSection.model import IonisationCrossSectionModel, getShellIndexes
+
+# Project modules
+import pyIonisationCrossSection.bote2009 as bote2009
+
+# Globals and constants variables.
+DEFAULT_MAXIMUM_ENERGY_eV = 1.0e9
+DEFAULT_NUMBER_POINTS_PER_DECADE = 64
+
+class _Table(object):
+    __slots__ = ("ionizationEnergy_eV", "logIonizationEnergy", "logCrossSections", "logCrossSectionsList",
+                 "numberIntervals", "evaluator")
+
+    def __init__(self, evaluator, logCrossSections):
+        self.evaluator = evaluator
+        self.ionizationEnergy_eV = evaluator.ionizationEnergy_eV
+        self.logIonizationEnergy = math.log(self.ionizationEnergy_eV)
+        self.numberIntervals = len(logCrossSections) - 1
+        self.logCrossSections = logCrossSections
+        self.logCrossSectionsList = logCrossSections.tolist()
+
+class TabulatedBote2009(IonisationCrossSectionModel):
+    """
+    Bote Salvat cross sections interpolated from tables precomputed with a `bote2009.Bote2009` model.
+
+    Each (Z, subshell, particle) table is uniform in log(U) from the threshold up to the maximum energy, with a
+    node at U = 16 where the DWBA and PWBA formulas join. The tables store the reduced cross section
+    sigma/(1 - 1/U), which stays finite at the threshold, and it is interpolated linearly in log-log. The index
+    of the interval is computed from the energy, so an evaluation does not depend on the table size. Energies
+    above the table are computed with the analytical model.
+
+    The tables are built on first use or with `build`, and can be saved and loaded. The class has the
+    `crossSection_cm2`, `ics_nm2` and `ics_nm2_array` methods of `bote2009.Bote2009` and can replace it.
+    """
+    name = "Bote (2009) tabulated"
+    shells = tuple(bote2009.SHELLS)
+    maximumAtomicNumber = bote2009.MAXIMUM_ATOMIC_NUMBER
+
+    def __init__(self, model=None, maximumEnergy_eV=DEFAULT_MAXIMUM_ENERGY_eV,
+                 numberPointsPerDecade=DEFAULT_NUMBER_POINTS_PER_DECADE):
+        if model is None:
+            model = bote2009.getSharedModel()
+        self._model = model
+        self._maximumEnergy_eV = maximumEnergy_eV
+
+        numberIntervalsDWBA = int(math.ceil(math.log10(16.0) * numberPointsPerDecade))
+        self._step = math.log(16.0) / numberIntervalsDWBA
+        self._inverseStep = 1.0 / self._step
+
+        self._tables = {}
+
+    @property
+    def model(self):
+        return self._model
+
+    @property
+    def step(self):
+        """
+        Interval of the tables in log(U).
+        """
+        return self._step
+
+    def build(self, atomicNumbers=None, subshells=None, particles=None):
+        """
+        Build the tables of all the (Z, subshell, particle) of the model, or of the given ones.
+        """
+        if atomicNumbers is None:
+            atomicNumbers = range(1, bote2009.MAXIMUM_ATOMIC_NUMBER + 1)
+        if subshells is None:
+            subshells = bote2009.SUBSHELLS
+        if particles is None:
+            particles = [bote2009.PARTICLE_ELECTRON, bote2009.PARTICLE_POSITRON]
+
+        isValid = self._model.isValid
+        for atomicNumber in atomicNumbers:
+            for subshell in subshells:
+                if isValid[atomicNumber, bote2009.SUBSHELL_INDEXES[subshell]]:
+                    for particle in particles:
+                        self._getTable(atomicNumber, subshell, particle)
+
+    def save(self, filepath):
+        """
+        Save the built tables in a numpy .npz file.
+        """
+        arrays = {"step": np.array(self._step), "maximumEnergy_eV": np.array(self._maximumEnergy_eV)}
+        for (atomicNumber, subshell, particle), table in self._tables.items():
+            arrays["%i_%s_%s" % (atomicNumber, subshell, particle)] = table.logCrossSections
+        np.savez_compressed(filepath, **arrays)
+
+    def load(self, filepath):
+        """
+        Load tables saved with `save`, the tables must have been saved with the same grid.
+        """
+        with np.load(filepath) as arrays:
+            if float(arrays["step"]) != self._step or float(arrays["maximumEnergy_eV"]) != self._maximumEnergy_eV:
+                raise ValueError("The tables in %s do not use the same energy grid." % (filepath))
+
+            for name in arrays.files:
+                if name in ("step", "maximumEnergy_eV"):
+                    continue
+                atomicNumber, subshell, particle = name.split("_")
+                atomicNumber = int(atomicNumber)
+                evaluator = self._model.getEvaluator(atomicNumber, subshell, particle)
+                self._tables[(atomicNumber, subshell, particle)] = _Table(evaluator, arrays[name])
+
+    def convert_subshell(self, outside_subshell):
+        return self._model.convert_subshell(outside_subshell)
+
+    def ics_nm2(self, atomicNumber, ionisationEnergy_eV, electronEnergy_eV, shell):
+        return cm2_to_nm2(self.crossSection_cm2(electronEnergy_eV, atomicNumber, self.convert_subshell(shell), bote2009.PARTICLE_ELECTRON))
+
+    def ics_nm2_array(self, atomicNumbers, ionisationEnergies_eV, electronEnergies_eV, shells):
+        """
+        Compute the electron ionisation cross sections in nm2 of broadcastable arrays of arguments.
+
+        As for `bote2009.Bote2009.ics_nm2_array`, the ionisation energies of the model are used and the missing
+        (Z, shell) pairs are zero. The tables of all the pairs are interpolated together in log-log.
+        """
+        atomicNumbers = np.asarray(atomicNumbers, dtype=np.int64)
+        subshellIndexes = getShellIndexes(shells, bote2009.SHELL_INDEXES)
+        shape = np.broadcast(atomicNumbers, subshellIndexes, ionisationEnergies_eV, electronEnergies_eV).shape
+        atomicNumbers = np.broadcast_to(atomicNumbers, shape).ravel()
+        subshellIndexes = np.broadcast_to(subshellIndexes, shape).ravel()
+        energies_eV = np.broadcast_to(np.asarray(electronEnergies_eV, dtype=np.float64), shape).ravel()
+
+        isValid = (atomicNumbers > 0) & (atomicNumbers <= bote2009.MAXIMUM_ATOMIC_NUMBER)
+        isValid[isValid] = self._model.isValid[atomicNumbers[isValid], subshellIndexes[isValid]]
+        crossSections_cm2 = np.zeros(len(energies_eV))
+
+        pairKeys = atomicNumbers[isValid]*len(bote2009.SUBSHELLS) + subshellIndexes[isValid]
+        uniqueKeys, pairIndexes = np.unique(pairKeys, return_inverse=True)
+        tables = [self._getTable(key // len(bote2009.SUBSHELLS), bote2009.SUBSHELLS[key % len(bote2009.SUBSHELLS)],
+                                 bote2009.PARTICLE_ELECTRON) for key in uniqueKeys.tolist()]
+        if tables:
+            crossSections_cm2[isValid] = self._interpolateTables(tables, pairIndexes, energies_eV[isValid])
+
+        crossSections_nm2 = cm2_to_nm2(crossSections_cm2, out=crossSections_cm2)
+        return crossSections_nm2.reshape(shape)
+
+    def isSupported(self, atomicNumber, shell):
+        return self._model.isSupported(atomicNumber, shell)
+
+    def crossSection_cm2(self, energy_eV, atomicNumber, subshell, particle):
+        table = self._tables.get((atomicNumber, subshell, particle))
+        if table is None:
+            table = self._getTable(atomicNumber, subshell, particle)
+
+        if not isinstance(energy_eV, float) and np.ndim(energy_eV) > 0:
+            return self._interpolateArray(table, energy_eV)
+
+        ionizationEnergy_eV = table.ionizationEnergy_eV
+        if energy_eV <= ionizationEnergy_eV:
+            return 0.0
+
+        x = (math.log(energy_eV) - table.logIonizationEnergy) * self._inverseStep
+        index = int(x)
+        if index >= table.numberIntervals:
+            return table.evaluator(energy_eV)
+
+        logCrossSections = table.logCrossSectionsList
+        y0 = logCrossSections[index]
+        reducedCrossSection_cm2 = math.exp(y0 + (logCrossSections[index + 1] - y0) * (x - index))
+        return reducedCrossSection_cm2 * (1.0 - ionizationEnergy_eV / energy_eV)
+
+    def interpolationError(self, atomicNumber, subshell, particle, minimumRelativeCrossSection=1.0e-3):
+        """
+        Return the largest relative error of the interpolation against the analytical model.
+
+        The error is evaluated at the middle of every interval of the table in log(U). The points where the cross
+        section is smaller than `minimumRelativeCrossSection` times the table maximum are skipped, the positron
+        formula goes through zero just above some thresholds.
+        """
+        table = self._getTable(atomicNumber, subshell, particle)
+
+        x = (np.arange(table.numberIntervals) + 0.5) * self._step
+        energies_eV = table.ionizationEnergy_eV * np.exp(x)
+        crossSections_cm2 = self._interpolateArray(table, energies_eV)
+        expectedCrossSections_cm2 = table.evaluator.evaluate(energies_eV)
+
+        mask = expectedCrossSections_cm2 >= minimumRelativeCrossSection * np.max(expectedCrossSections_cm2)
+        relativeErrors = np.abs(crossSections_cm2[mask] / expectedCrossSections_cm2[mask] - 1.0)
+        return float(np.max(relativeErrors))
+
+    def maximumInterpolationError(self, minimumRelativeCrossSection=1.0e-3):
+        """
+        Return the largest relative interpolation error of the built tables.
+        """
+        errors = [self.interpolationError(atomicNumber, subshell, particle, minimumRelativeCrossSection)
+                  for atomicNumber, subshell, particle in self._tables]
+        return max(errors) if errors else 0.0
+
+    def _getTable(self, atomicNumber, subshell, particle):
+        key = (atomicNumber, subshell, particle)
+        table = self._tables.get(key)
+        if table is None:
+            table = self._buildTable(atomicNumber, subshell, particle)
+            self._tables[key] = table
+        return table
+
+    def _buildTable(self, atomicNumber, subshell, particle):
+        evaluator = self._model.getEvaluator(atomicNumber, subshell, particle)
+
+        ratio = self._maximumEnergy_eV / evaluator.ionizationEnergy_eV
+        numberIntervals = max(3, int(math.ceil(math.log(ratio) * self._inverseStep)))
+        overvoltages = np.exp(np.arange(numberIntervals + 1) * self._step)
+        energies_eV = evaluator.ionizationEnergy_eV * overvoltages
+
+        logCrossSections = np.empty(numberIntervals + 1)
+        with np.errstate(divide='ignore'):
+            logCrossSections[1:] = np.log(evaluator.evaluate(energies_eV[1:]) / (1.0 - 1.0 / overvoltages[1:]))
+        # The reduced cross section is finite at the threshold, the first node is extrapolated.
+        logCrossSections[0] = 3.0 * logCrossSections[1] - 3.0 * logCrossSections[2] + logCrossSections[3]
+
+        return _Table(evaluator, logCrossSections)
+
+    def _interpolateTables(self, tables, tableIndexes, energies_eV):
+        """
+        Interpolate 1-d arrays of energies, each in the table of its index in `tables`.
+        """
+        ionizationEnergies_eV = np.array([table.ionizationEnergy_eV for table in tables])
+        logIonizationEnergies = np.array([table.logIonizationEnergy for table in tables])
+        numberIntervals = np.array([table.numberIntervals for table in tables])
+        offsets = np.concatenate(([0], np.cumsum(numberIntervals[:-1] + 1)))
+        logCrossSections = np.concatenate([table.logCrossSections for table in tables])
+
+        crossSections_cm2 = np.zeros(energies_eV.shape)
+        ionizationEnergies_eV = ionizationEnergies_eV[tableIndexes]
+        isAbove = energies_eV > ionizationEnergies_eV
+        tableIndexes = tableIndexes[isAbove]
+        energiesAbove_eV = energies_eV[isAbove]
+        x = (np.log(energiesAbove_eV) - logIonizationEnergies[tableIndexes]) * self._inverseStep
+        indexes = x.astype(np.int64)
+
+        isOutside = indexes >= numberIntervals[tableIndexes]
+        isInside = ~isOutside
+
+        values = np.empty(energiesAbove_eV.shape)
+        for tableIndex in np.unique(tableIndexes[isOutside]).tolist():
+            mask = isOutside & (tableIndexes == tableIndex)
+            values[mask] = tables[tableIndex].evaluator.evaluate(energiesAbove_eV[mask])
+
+        indexesInside = indexes[isInside]
+        flatIndexes = offsets[tableIndexes[isInside]] + indexesInside
+        y0 = logCrossSections[flatIndexes]
+        y1 = logCrossSections[flatIndexes + 1]
+        reducedCrossSections_cm2 = np.exp(y0 + (y1 - y0) * (x[isInside] - indexesInside))
+        values[isInside] = reducedCrossSections_cm2 * (1.0 - ionizationEnergies_eV[isAbove][isInside] / energiesAbove_eV[isInside])
+
+        crossSections_cm2[isAbove] = values
+        return crossSections_cm2
+
+    def _interpolateArray(self, table, energies_eV):
+        energies_eV = np.asarray(energies_eV, dtype=np.float64)
+        crossSections_cm2 = np.zeros(energies_eV.shape)
+
+        isAbove = energies_eV > table.ionizationEnergy_eV
+        energiesAbove_eV = energies_eV[isAbove]
+        x = (np.log(energiesAbove_eV) - table.logIonizationEnergy) * self._inverseStep
+        indexes = x.astype(np.int64)
+
+        isOutside = indexes >= table.numberIntervals
+        isInside = ~isOutside
+
+        values = np.empty(energiesAbove_eV.shape)
+        values[isOutside] = table.evaluator.evaluate(energiesAbove_eV[isOutside])
+
+        indexesInside = indexes[isInside]
+        y0 = table.logCrossSections[indexesInside]
+        y1 = table.logCrossSections[indexesInside + 1]
+        reducedCrossSections_cm2 = np.exp(y0 + (y1 - y0) * (x[isInside] - indexesInside))
+        values[isInside] = reducedCrossSections_cm2 * (1.0 - table.ionizationEnergy_eV / energiesAbove_eV[isInside])
+
+        crossSections_cm2[isAbove] = values
+        return crossSections_cm2
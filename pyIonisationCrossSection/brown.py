@@ -23,18 +23,58 @@ import numpy as np
 # Project modules
 import pyIonisationCrossSection.atomic_shell as atomic_shell
 import pyIonisationCrossSection.units as units
+from pyIonisationCrossSection.model import IonisationCrossSectionModel, isScalar, getShellIndexes
 
 # Globals and constants variables.
-class Brown1974(object):
+# Intercept and slope of the linear function C(Z) for each shell, same formula for LI and LII.
+SHELL_CONSTANTS = {atomic_shell.SHELL_K: (0.85, 0.0047),
+                   atomic_shell.SHELL_LI: (0.61, 0.0058),
+                   atomic_shell.SHELL_LII: (0.61, 0.0058),
+                   atomic_shell.SHELL_LIII: (2.19, 0.0098)}
+SHELLS = [atomic_shell.SHELL_K, atomic_shell.SHELL_LI, atomic_shell.SHELL_LII, atomic_shell.SHELL_LIII]
+SHELL_INDEXES = dict((shell, index) for index, shell in enumerate(SHELLS))
+
+class Brown1974(IonisationCrossSectionModel):
+    name = "Brown (1974)"
+    shells = tuple(SHELLS)
+
     def __init__(self):
         self._constant_cm2keV2 = 7.92e-20
 
+        self._intercepts = np.array([SHELL_CONSTANTS[shell][0] for shell in SHELLS])
+        self._slopes = np.array([SHELL_CONSTANTS[shell][1] for shell in SHELLS])
+
     def ics_nm2(self, atomicNumber, ionisationEnergy_eV, electronEnergy_eV, shell):
-        if electronEnergy_eV/ionisationEnergy_eV < 1.0:
-            return 0.0
+        """
+        Compute the ionisation cross section in nm2.
+
+        The atomic number, ionisation energy, electron energy and shell can be scalars or arrays broadcastable
+        together, the cross section is zero below the threshold (U < 1). An array is returned if any argument is
+        an array.
+        """
+        if isScalar(electronEnergy_eV) and isScalar(ionisationEnergy_eV) and isScalar(atomicNumber) and isinstance(shell, str):
+            if electronEnergy_eV/ionisationEnergy_eV < 1.0:
+                return 0.0
+
+            C = self._computeC(atomicNumber, shell)
+            return self._computeCrossSection_nm2(C, ionisationEnergy_eV, electronEnergy_eV)
 
         C = self._computeC(atomicNumber, shell)
+        C, ionisationEnergy_eV, electronEnergy_eV = np.broadcast_arrays(C,
+                                                                        np.asarray(ionisationEnergy_eV, dtype=np.float64),
+                                                                        np.asarray(electronEnergy_eV, dtype=np.float64))
+        sigmas_nm2 = np.zeros(electronEnergy_eV.shape)
 
+        mask = electronEnergy_eV/ionisationEnergy_eV >= 1.0
+        if np.any(mask):
+            sigmas_nm2[mask] = self._computeCrossSection_nm2(C[mask], ionisationEnergy_eV[mask], electronEnergy_eV[mask])
+
+        return sigmas_nm2
+
+    def ics_nm2_array(self, atomicNumbers, ionisationEnergies_eV, electronEnergies_eV, shells):
+        return np.asarray(self.ics_nm2(atomicNumbers, ionisationEnergies_eV, electronEnergies_eV, shells), dtype=np.float64)
+
+    def _computeCrossSection_nm2(self, C, ionisationEnergy_eV, electronEnergy_eV):
         ionisationEnergy_keV = units.eV_to_keV(ionisationEnergy_eV)
         electronEnergy_keV = units.eV_to_keV(electronEnergy_eV)
 
@@ -47,36 +87,32 @@ class Brown1974(object):
         return sigma_nm2
 
     def _computeC(self, atomicNumber, shell):
-        if shell == atomic_shell.SHELL_K:
-            return self._computeCK(atomicNumber)
-        elif shell == atomic_shell.SHELL_LI:
-            return self._computeCLI(atomicNumber)
-        elif shell == atomic_shell.SHELL_LII:
-            # Same formula for LI and LII.
-            return self._computeCLI(atomicNumber)
-        elif shell == atomic_shell.SHELL_LIII:
-            return self._computeCLIII(atomicNumber)
+        """
+        Compute the constant C(Z) of the shell, the atomic number and the shell can be arrays.
+        """
+        if isinstance(shell, str):
+            intercept, slope = SHELL_CONSTANTS[shell]
+        else:
+            indexes = getShellIndexes(shell, SHELL_INDEXES)
+            intercept = self._intercepts[indexes]
+            slope = self._slopes[indexes]
 
-    def _computeCK(self, atomicNumber):
         Z = atomicNumber
+        if not isScalar(Z):
+            Z = np.asarray(Z)
 
-        C = 0.85 + 0.0047*Z
+        C = intercept + slope*Z
 
         return C
 
-    def SHELL_LI(self, atomicNumber):
-        Z = atomicNumber
-
-        C = 0.61 + 0.0058*Z
+    def _computeCK(self, atomicNumber):
+        return self._computeC(atomicNumber, atomic_shell.SHELL_K)
 
-        return C
+    def _computeCLI(self, atomicNumber):
+        return self._computeC(atomicNumber, atomic_shell.SHELL_LI)
 
     def _computeCLIII(self, atomicNumber):
-        Z = atomicNumber
-
-        C = 2.19 + 0.0098*Z
-
-        return C
+        return self._computeC(atomicNumber, atomic_shell.SHELL_LIII)
 
 def dataFigure5Casnati1982():
     # N
@@ -86,10 +122,10 @@ def dataFigure5Casnati1982():
     shell = atomic_shell.SHELL_K
 
     uList = np.arange(1.0, 25.0, 0.1)
-    energies_eV = [U*ionisationEnergy_eV for U in uList]
+    energies_eV = uList*ionisationEnergy_eV
 
     modelICS = Brown1974()
-    sigmaList_nm2 = [modelICS.ics_nm2(atomicNumber, ionisationEnergy_eV, electronEnergy_eV, shell) for electronEnergy_eV in energies_eV]
+    sigmaList_nm2 = modelICS.ics_nm2(atomicNumber, ionisationEnergy_eV, energies_eV, shell)
 
     return uList, sigmaList_nm2
 
@@ -97,7 +133,7 @@ def run():
     import matplotlib.pyplot as plt
 
     uList, sigmaList_nm2 = dataFigure5Casnati1982()
-    sigmaList_m2 = [units.nm2_to_m2(sigma_nm2) for sigma_nm2 in sigmaList_nm2]
+    sigmaList_m2 = units.nm2_to_m2(sigmaList_nm2)
 
     plt.figure()
     plt.plot(uList, sigmaList_m2)
@@ -27,23 +27,59 @@ import numpy as np
 
 # Project modules
 import pyIonisationCrossSection.atomic_shell as atomic_shell
+from pyIonisationCrossSection.model import IonisationCrossSectionModel, isScalar, getShellIndexes
 
 # Globals and constants variables.
+SHELL_NUMBER_ELECTRONS = {atomic_shell.SHELL_K: 2,
+                          atomic_shell.SHELL_LIII: 4,
+                          atomic_shell.SHELL_MV: 9}
+SHELLS = [atomic_shell.SHELL_K, atomic_shell.SHELL_LIII, atomic_shell.SHELL_MV]
+SHELL_INDEXES = dict((shell, index) for index, shell in enumerate(SHELLS))
+
+class Casnati(IonisationCrossSectionModel):
+    name = "Casnati (1982)"
+    shells = tuple(SHELLS)
 
-class Casnati(object):
     def __init__(self):
         self._firstBohrRadius_m = 5.292e-11
         self._mc2_eV = 511.0e3
         self._RydbergEnergy_eV = 13.606
 
     def ics_nm2(self, atomicNumber, ionisationEnergy_eV, electronEnergy_eV, shell):
+        """
+        Compute the ionisation cross section in nm2.
+
+        The atomic number, ionisation energy and electron energy can be scalars or arrays broadcastable together,
+        the cross section is zero below the threshold (U < 1). The shell can also be an array. An array is
+        returned if any argument is an array.
+        """
+        if isScalar(electronEnergy_eV) and isScalar(ionisationEnergy_eV) and isScalar(atomicNumber) and isinstance(shell, str):
+            U = electronEnergy_eV/ionisationEnergy_eV
+            if U < 1.0:
+                return 0.0
+            numberElectronsShell = self._getNumberElectronsShell(atomicNumber, shell)
+            return self._computeCrossSection_nm2(numberElectronsShell, ionisationEnergy_eV, U)
+
+        numberElectronsShell = self._getNumberElectronsShell(atomicNumber, shell)
+        atomicNumber, numberElectronsShell, ionisationEnergy_eV, electronEnergy_eV = np.broadcast_arrays(np.asarray(atomicNumber),
+                                                                                                       numberElectronsShell,
+                                                                                                       np.asarray(ionisationEnergy_eV, dtype=np.float64),
+                                                                                                       np.asarray(electronEnergy_eV, dtype=np.float64))
+        sigmas_nm2 = np.zeros(electronEnergy_eV.shape)
+
         U = electronEnergy_eV/ionisationEnergy_eV
-        if U < 1.0:
-            return 0.0
+        mask = U >= 1.0
+        if np.any(mask):
+            sigmas_nm2[mask] = self._computeCrossSection_nm2(numberElectronsShell[mask], ionisationEnergy_eV[mask], U[mask])
 
+        return sigmas_nm2
+
+    def ics_nm2_array(self, atomicNumbers, ionisationEnergies_eV, electronEnergies_eV, shells):
+        return np.asarray(self.ics_nm2(atomicNumbers, ionisationEnergies_eV, electronEnergies_eV, shells), dtype=np.float64)
+
+    def _computeCrossSection_nm2(self, numberElectronsShell, ionisationEnergy_eV, U):
         R = self._computeRelativisticFactor(ionisationEnergy_eV, U)
 
-        numberElectronsShell = self._getNumberElectronsShell(atomicNumber, shell)
         n = numberElectronsShell
 
         a0_nm = self._firstBohrRadius_m*1.0e9
@@ -52,7 +88,8 @@ class Casnati(object):
 
         phi = self._computePhi(U)
 
-        factor1 = np.power(self._RydbergEnergy_eV/ionisationEnergy_eV, 2.0)
+        ratio = self._RydbergEnergy_eV/ionisationEnergy_eV
+        factor1 = ratio*ratio
 
         sigma_nm2 = n*a0_nm*a0_nm*R*factor1*psi*phi*np.log(U)/U
 
@@ -65,25 +102,24 @@ class Casnati(object):
         denominator = U + 2.0*J
         factor1 = nominator/denominator
 
-        nominator = U + J
-        denominator = 1.0 + J
-        factor2 = np.power(nominator/denominator, 2.0)
+        ratio = (U + J)/(1.0 + J)
+        factor2 = ratio*ratio
 
         nominator = (1.0 + U)*(U + 2.0*J)*(1.0 + J)*(1.0 + J)
         denominator = J*J*(1.0 + 2.0*J) + U*(U + 2.0*J)*(1.0 + J)*(1.0 + J)
-        factor3 = np.power(nominator/denominator, 3.0/2.0)
+        ratio = nominator/denominator
+        factor3 = ratio*np.sqrt(ratio)
 
         R = factor1*factor2*factor3
 
         return R
 
     def _getNumberElectronsShell(self, atomicNumber, shell):
-        if shell == atomic_shell.SHELL_K:
-            return 2
-        elif shell == atomic_shell.SHELL_LIII:
-            return 4
-        elif shell == atomic_shell.SHELL_MV:
-            return 9
+        if isinstance(shell, str):
+            return SHELL_NUMBER_ELECTRONS[shell]
+        else:
+            numberElectrons = np.array([SHELL_NUMBER_ELECTRONS[shell] for shell in SHELLS])
+            return numberElectrons[getShellIndexes(shell, SHELL_INDEXES)]
 
     def _computePsi(self, ionisationEnergy_eV, U):
         # d0 = d0' + 2
@@ -117,10 +153,10 @@ def dataFigure5():
     shell = atomic_shell.SHELL_K
 
     uList = np.arange(1.0, 25.0, 0.1)
-    energies_eV = [U*ionisationEnergy_eV for U in uList]
+    energies_eV = uList*ionisationEnergy_eV
 
     modelICS = Casnati()
-    sigmaList_nm2 = [modelICS.ics_nm2(atomicNumber, ionisationEnergy_eV, electronEnergy_eV, shell) for electronEnergy_eV in energies_eV]
+    sigmaList_nm2 = modelICS.ics_nm2(atomicNumber, ionisationEnergy_eV, energies_eV, shell)
 
     return uList, sigmaList_nm2
 
@@ -132,10 +168,10 @@ def dataFigure6():
     shell = atomic_shell.SHELL_K
 
     uList = np.arange(1.0, 25.0, 0.1)
-    energies_eV = [U*ionisationEnergy_eV for U in uList]
+    energies_eV = uList*ionisationEnergy_eV
 
     modelICS = Casnati()
-    sigmaList_nm2 = [modelICS.ics_nm2(atomicNumber, ionisationEnergy_eV, electronEnergy_eV, shell) for electronEnergy_eV in energies_eV]
+    sigmaList_nm2 = modelICS.ics_nm2(atomicNumber, ionisationEnergy_eV, energies_eV, shell)
 
     return uList, sigmaList_nm2
 
@@ -147,20 +183,20 @@ def dataFigure7():
     shell = atomic_shell.SHELL_K
 
     uList = np.arange(1.0, 25.0, 0.1)
-    energies_eV = [U*ionisationEnergy_eV for U in uList]
+    energies_eV = uList*ionisationEnergy_eV
 
     modelICS = Casnati()
-    sigmaList_nm2 = [modelICS.ics_nm2(atomicNumber, ionisationEnergy_eV, electronEnergy_eV, shell) for electronEnergy_eV in energies_eV]
+    sigmaList_nm2 = modelICS.ics_nm2(atomicNumber, ionisationEnergy_eV, energies_eV, shell)
 
     return uList, sigmaList_nm2
 
 def run():
     import matplotlib.pyplot as plt
-    import units
+    import pyIonisationCrossSection.units as units
 
     for dataFigure in [dataFigure5, dataFigure6, dataFigure7]:
         uList, sigmaList_nm2 = dataFigure()
-        sigmaList_m2 = [units.nm2_to_m2(sigma_nm2) for sigma_nm2 in sigmaList_nm2]
+        sigmaList_m2 = units.nm2_to_m2(sigmaList_nm2)
         plt.figure()
         plt.plot(uList, sigmaList_m2)
 
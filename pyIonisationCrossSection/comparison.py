@@ -14,6 +14,8 @@ __svnDate__ = "$Date$"
 __svnId__ = "$Id$"
 
 # Standard library modules.
+import concurrent.futures
+import os
 
 # Third party modules.
 import numpy as np
@@ -22,45 +24,154 @@ import numpy as np
 
 # Project modules
 import pyIonisationCrossSection.atomic_shell as atomic_shell
-from pyIonisationCrossSection.casnati import Casnati
-from pyIonisationCrossSection.brown import Brown1974
-from pyIonisationCrossSection.bote2009 import Bote2009, getModel
-from pyIonisationCrossSection.jakoby import Jakoby1987
+from pyIonisationCrossSection.edge_energy import getEdgeEnergies_eV
+from pyIonisationCrossSection.model import getModel, getModelNames
 
 # Globals and constants variables.
+DEFAULT_OVERVOLTAGES = np.arange(1.0, 25.0, 0.1)
+DEFAULT_ATOMIC_NUMBERS = range(4, 93)
+
+class ComparisonResult(object):
+    """
+    Cross sections of several models over atomic numbers and a shared overvoltage grid.
+
+    The cross sections in nm2 are one array of shape (number of models, number of Z, number of overvoltages) with
+    the model names, atomic numbers and overvoltages as labels of the axes. The (model, Z) pairs not supported by
+    a model are NaN.
+    """
+
+    def __init__(self, modelNames, atomicNumbers, overvoltages, ionisationEnergies_eV, crossSections_nm2, shell):
+        self.modelNames = list(modelNames)
+        self.atomicNumbers = np.asarray(atomicNumbers, dtype=np.int64)
+        self.overvoltages = np.asarray(overvoltages, dtype=np.float64)
+        self.ionisationEnergies_eV = np.asarray(ionisationEnergies_eV, dtype=np.float64)
+        self.crossSections_nm2 = np.asarray(crossSections_nm2, dtype=np.float64)
+        self.shell = shell
+
+    @property
+    def energies_eV(self):
+        """
+        Electron energies of each atomic number, an array of shape (number of Z, number of overvoltages).
+        """
+        return self.ionisationEnergies_eV[:, np.newaxis]*self.overvoltages
+
+    def getCrossSections_nm2(self, modelName, atomicNumber):
+        """
+        Return the cross sections of one model and atomic number over the overvoltages.
+        """
+        indexModel = self.modelNames.index(modelName)
+        indexZ = self.atomicNumbers.tolist().index(atomicNumber)
+        return self.crossSections_nm2[indexModel, indexZ]
+
+    def save(self, filepath):
+        """
+        Save the result in a numpy .npz file.
+        """
+        np.savez_compressed(filepath, modelNames=np.array(self.modelNames), atomicNumbers=self.atomicNumbers,
+                            overvoltages=self.overvoltages, ionisationEnergies_eV=self.ionisationEnergies_eV,
+                            crossSections_nm2=self.crossSections_nm2, shell=np.array(self.shell))
+
+    @classmethod
+    def load(cls, filepath):
+        """
+        Load a result saved with `save`.
+        """
+        with np.load(filepath) as arrays:
+            return cls(arrays["modelNames"].tolist(), arrays["atomicNumbers"], arrays["overvoltages"],
+                       arrays["ionisationEnergies_eV"], arrays["crossSections_nm2"], str(arrays["shell"]))
+
+def getDefaultIonisationEnergies_eV(atomicNumbers, shell=atomic_shell.SHELL_K):
+    """
+    Return the ionisation energies of the shell from the edge energy table, the Bote and Salvat (2009) values.
+    """
+    return getEdgeEnergies_eV(atomicNumbers, shell)
+
+def _computeTask(modelName, atomicNumbers, ionisationEnergies_eV, overvoltages, shell):
+    modelICS = getModel(modelName)
+
+    crossSections_nm2 = np.full((len(atomicNumbers), len(overvoltages)), np.nan)
+    isSupported = np.array([modelICS.isSupported(atomicNumber, shell) and np.isfinite(ionisationEnergy_eV)
+                            for atomicNumber, ionisationEnergy_eV in zip(atomicNumbers.tolist(), ionisationEnergies_eV.tolist())], dtype=bool)
+    if np.any(isSupported):
+        ionisationEnergiesSupported_eV = ionisationEnergies_eV[isSupported, np.newaxis]
+        crossSections_nm2[isSupported] = modelICS.ics_nm2_array(atomicNumbers[isSupported, np.newaxis], ionisationEnergiesSupported_eV,
+                                                                ionisationEnergiesSupported_eV*overvoltages, shell)
+    return crossSections_nm2
+
+def compare(modelNames=None, atomicNumbers=DEFAULT_ATOMIC_NUMBERS, overvoltages=DEFAULT_OVERVOLTAGES,
+            shell=atomic_shell.SHELL_K, ionisationEnergies_eV=None, numberProcesses=None, numberTasksPerModel=None):
+    """
+    Compute the cross sections of the models for the atomic numbers over a shared overvoltage grid.
+
+    The (model, block of Z) tasks are distributed over a pool of `numberProcesses` processes, all the processors
+    by default, and each task evaluates its block in one batch call. With one process, the tasks are computed in
+    this process. The ionisation energies default to the Bote and Salvat (2009) values. Return a
+    `ComparisonResult`.
+    """
+    if modelNames is None:
+        modelNames = getModelNames()
+    atomicNumbers = np.asarray(atomicNumbers, dtype=np.int64)
+    overvoltages = np.asarray(overvoltages, dtype=np.float64)
+    if ionisationEnergies_eV is None:
+        ionisationEnergies_eV = getDefaultIonisationEnergies_eV(atomicNumbers, shell)
+    ionisationEnergies_eV = np.asarray(ionisationEnergies_eV, dtype=np.float64)
+    if numberProcesses is None:
+        numberProcesses = os.cpu_count() or 1
+    if numberTasksPerModel is None:
+        numberTasksPerModel = max(1, numberProcesses)
+
+    blocks = np.array_split(np.arange(len(atomicNumbers)), min(numberTasksPerModel, max(1, len(atomicNumbers))))
+    tasks = [(indexModel, block) for indexModel in range(len(modelNames)) for block in blocks if len(block) > 0]
+    arguments = [(modelNames[indexModel], atomicNumbers[block], ionisationEnergies_eV[block], overvoltages, shell)
+                 for indexModel, block in tasks]
+
+    if numberProcesses > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=numberProcesses) as executor:
+            results = list(executor.map(_computeTask, *zip(*arguments)))
+    else:
+        results = [_computeTask(*argument) for argument in arguments]
+
+    crossSections_nm2 = np.empty((len(modelNames), len(atomicNumbers), len(overvoltages)))
+    for (indexModel, block), result in zip(tasks, results):
+        crossSections_nm2[indexModel, block] = result
+
+    return ComparisonResult(modelNames, atomicNumbers, overvoltages, ionisationEnergies_eV, crossSections_nm2, shell)
 
 def dataFigure(atomicNumber, ionisationEnergy_eV, modelICS):
     shell = atomic_shell.SHELL_K
 
-    uList = np.arange(1.0, 25.0, 0.1)
-    energies_eV = [U*ionisationEnergy_eV for U in uList]
+    uList = DEFAULT_OVERVOLTAGES
+    energies_eV = uList*ionisationEnergy_eV
 
-    sigmaList_nm2 = [modelICS.ics_nm2(atomicNumber, ionisationEnergy_eV, electronEnergy_eV, shell) for electronEnergy_eV in energies_eV]
+    sigmaList_nm2 = modelICS.ics_nm2_array(atomicNumber, ionisationEnergy_eV, energies_eV, shell)
 
     return uList, sigmaList_nm2
 
-def run():
+def plotComparison(result):
     import matplotlib.pyplot as plt
     import pyIonisationCrossSection.units as units
 
-    modelICSs = {"Casnati (1982)": Casnati(), "Brown (1974)": Brown1974(), "Bote (2009)": getModel(), "Jakoby (1987)": Jakoby1987()}
-
-    atomicNumbers = [7, 28, 79]
-    ionisationEnergies = {7: 0.399e3, 28: 8.33100e3, 79: 80713.0}
+    labels = [getModel(modelName).name for modelName in result.modelNames]
 
-    for atomicNumber in atomicNumbers:
+    for indexZ, atomicNumber in enumerate(result.atomicNumbers.tolist()):
         plt.figure()
         plt.title(r"Z = %i" % (atomicNumber))
-        for modelICSName in sorted(modelICSs):
-            print(modelICSName)
-            uList, sigmaList_nm2 = dataFigure(atomicNumber, ionisationEnergies[atomicNumber], modelICSs[modelICSName])
-            sigmaList_m2 = [units.nm2_to_m2(sigma_nm2) for sigma_nm2 in sigmaList_nm2]
-            plt.plot(uList, sigmaList_m2, label=modelICSName)
+        for indexModel, label in enumerate(labels):
+            sigmaList_m2 = units.nm2_to_m2(result.crossSections_nm2[indexModel, indexZ])
+            plt.plot(result.overvoltages, sigmaList_m2, label=label)
 
         plt.xlabel("U")
         plt.ylabel(r"$\sigma_{K}$ (m$^{2}$)")
         plt.legend(loc='best')
 
+def run():
+    import matplotlib.pyplot as plt
+
+    atomicNumbers = [7, 28, 79]
+
+    result = compare(atomicNumbers=atomicNumbers)
+    plotComparison(result)
+
     plt.show()
 
 if __name__ == '__main__':  #pragma: no cover
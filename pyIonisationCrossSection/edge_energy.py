@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+.. py:currentmodule:: edge_energy
+.. moduleauthor:: Hendrix Demers <hendrix.demers@mail.mcgill.ca>
+
+Ionisation edge energies of the shells K to MV of all the elements.
+
+The edge energies are the ionisation energies Ec of the Bote and Salvat (2009) parameters, held in one dense array
+indexed by (Z, shell index), so an edge is found in constant time and the edges of arrays of atomic numbers and
+shells with one gather. The missing (Z, shell) pairs are NaN.
+"""
+
+# Script information for the file.
+__author__ = "Hendrix Demers (hendrix.demers@mail.mcgill.ca)"
+__version__ = ""
+__date__ = ""
+__copyright__ = "Copyright (c) 2012 Hendrix Demers"
+__license__ = ""
+
+# Standard library modules.
+import threading
+
+# Third party modules.
+import numpy as np
+
+# Local modules.
+
+# Project modules
+import pyIonisationCrossSection.bote2009 as bote2009
+from pyIonisationCrossSection.bote2009 import SHELL_INDEXES
+from pyIonisationCrossSection.model import getShellIndexes
+
+# Globals and constants variables.
+_edgeEnergies_eV = None
+_edgeEnergiesLock = threading.Lock()
+
+def _createEdgeEnergyTable():
+    # The shells of the table are ordered as the subshells of the Bote and Salvat (2009) parameters.
+    parameters = bote2009.getSharedModel().parameters
+    edgeEnergies_eV = np.array(parameters[:, :, bote2009.INDEX_Eca_eV])
+    edgeEnergies_eV.setflags(write=False)
+    return edgeEnergies_eV
+
+def getEdgeEnergyTable():
+    """
+    Return the read only array of the edge energies in eV of shape (maximum Z + 1, number of shells).
+
+    The table is created from the shared Bote and Salvat (2009) model on the first call.
+    """
+    global _edgeEnergies_eV
+
+    edgeEnergies_eV = _edgeEnergies_eV
+    if edgeEnergies_eV is None:
+        with _edgeEnergiesLock:
+            if _edgeEnergies_eV is None:
+                _edgeEnergies_eV = _createEdgeEnergyTable()
+            edgeEnergies_eV = _edgeEnergies_eV
+
+    return edgeEnergies_eV
+
+def clearEdgeEnergyTable():
+    """
+    Clear the table, it is created again from the shared model on the next call.
+    """
+    global _edgeEnergies_eV
+
+    with _edgeEnergiesLock:
+        _edgeEnergies_eV = None
+
+def getEdgeEnergy_eV(atomicNumber, shell):
+    """
+    Return the edge energy in eV of a shell of an element, NaN for a missing shell.
+
+    An unknown shell raises KeyError and an atomic number outside the table raises IndexError.
+    """
+    edgeEnergies_eV = getEdgeEnergyTable()
+    if not 0 < atomicNumber < edgeEnergies_eV.shape[0]:
+        raise IndexError("No edge energies for the atomic number %s." % (atomicNumber))
+    return float(edgeEnergies_eV[atomicNumber, SHELL_INDEXES[shell]])
+
+def getEdgeEnergies_eV(atomicNumbers, shells):
+    """
+    Return the edge energies in eV of broadcastable arrays of atomic numbers and shells.
+
+    The missing shells and the atomic numbers outside the table are NaN, an unknown shell raises KeyError.
+    """
+    edgeEnergies_eV = getEdgeEnergyTable()
+    atomicNumbers = np.asarray(atomicNumbers, dtype=np.int64)
+    shellIndexes = getShellIndexes(shells, SHELL_INDEXES)
+
+    # The row of Z = 0 is NaN, it is gathered for the atomic numbers outside the table.
+    isInside = (atomicNumbers > 0) & (atomicNumbers < edgeEnergies_eV.shape[0])
+    return edgeEnergies_eV[np.where(isInside, atomicNumbers, 0), shellIndexes]
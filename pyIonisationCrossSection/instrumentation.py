@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+"""
+.. py:currentmodule:: instrumentation
+.. moduleauthor:: Hendrix Demers <hendrix.demers@mail.mcgill.ca>
+
+Opt-in call counts and timings of the model hot paths.
+
+`enable` replaces the instrumented methods of the model classes by wrappers recording, for each model and
+method or branch, the number of calls, the cumulative wall time, the number of values evaluated and a histogram
+of the number of values per call. `disable` restores the original methods, so the models run without any
+overhead when the instrumentation is disabled. The times are inclusive, a branch called by an instrumented
+method is also counted in the time of that method.
+"""
+
+# Script information for the file.
+__author__ = "Hendrix Demers (hendrix.demers@mail.mcgill.ca)"
+__version__ = ""
+__date__ = ""
+__copyright__ = "Copyright (c) 2012 Hendrix Demers"
+__license__ = ""
+
+# Standard library modules.
+import contextlib
+import functools
+import importlib
+import json
+import threading
+import time
+
+# Third party modules.
+
+# Local modules.
+
+# Project modules
+
+# Globals and constants variables.
+BRANCH_DWBA = "DWBA"
+BRANCH_PWBA = "PWBA"
+
+# Instrumented methods of each class, with the name of the record of each method.
+INSTRUMENTED_METHODS = {
+    "pyIonisationCrossSection.casnati:Casnati": {"ics_nm2": "ics_nm2", "ics_nm2_array": "ics_nm2_array"},
+    "pyIonisationCrossSection.brown:Brown1974": {"ics_nm2": "ics_nm2", "ics_nm2_array": "ics_nm2_array"},
+    "pyIonisationCrossSection.jakoby:Jakoby1987": {"ics_nm2": "ics_nm2", "ics_nm2_array": "ics_nm2_array"},
+    "pyIonisationCrossSection.bote2009:Bote2009": {"ics_nm2": "ics_nm2", "ics_nm2_array": "ics_nm2_array",
+                                                    "crossSection_cm2": "crossSection_cm2",
+                                                    "_computeCrossSectionDWBAElectron": BRANCH_DWBA,
+                                                    "_computeCrossSectionDWBAPositron": BRANCH_DWBA,
+                                                    "_computeCrossSectionPWBA": BRANCH_PWBA,
+                                                    "_computeCrossSectionDWBAElectronArray": BRANCH_DWBA,
+                                                    "_computeCrossSectionDWBAPositronArray": BRANCH_DWBA,
+                                                    "_computeCrossSectionPWBAArray": BRANCH_PWBA},
+    "pyIonisationCrossSection.bote2009_tabulated:TabulatedBote2009": {"ics_nm2": "ics_nm2", "ics_nm2_array": "ics_nm2_array",
+                                                                      "crossSection_cm2": "crossSection_cm2"},
+}
+
+KEY_CALLS = "calls"
+KEY_TIME_s = "time_s"
+KEY_VALUES = "values"
+KEY_HISTOGRAM = "histogram"
+
+_lock = threading.Lock()
+_records = {}
+_originalMethods = {}
+
+def _countValues(arguments):
+    """
+    Return the largest number of values of the array arguments, 1 for scalar arguments.
+    """
+    numberValues = 1
+    for argument in arguments:
+        size = getattr(argument, "size", None)
+        if size is None:
+            energies = getattr(argument, "energies_eV", None)
+            size = getattr(energies, "size", None)
+        if size is not None and size > numberValues:
+            numberValues = size
+    return numberValues
+
+def _getBin(numberValues):
+    """
+    Return the histogram bin of a number of values, the power of 10 not larger than it.
+    """
+    return 10**(len(str(numberValues)) - 1)
+
+def _record(name, elapsed_s, numberValues):
+    with _lock:
+        record = _records.get(name)
+        if record is None:
+            record = {KEY_CALLS: 0, KEY_TIME_s: 0.0, KEY_VALUES: 0, KEY_HISTOGRAM: {}}
+            _records[name] = record
+        record[KEY_CALLS] += 1
+        record[KEY_TIME_s] += elapsed_s
+        record[KEY_VALUES] += numberValues
+        histogram = record[KEY_HISTOGRAM]
+        binValue = _getBin(numberValues)
+        histogram[binValue] = histogram.get(binValue, 0) + 1
+
+def _wrap(method, name):
+    @functools.wraps(method)
+    def wrapper(self, *arguments, **keywords):
+        start = time.perf_counter()
+        try:
+            return method(self, *arguments, **keywords)
+        finally:
+            _record(name, time.perf_counter() - start, _countValues(arguments))
+
+    return wrapper
+
+def _getClass(classPath):
+    moduleName, className = classPath.split(":")
+    return getattr(importlib.import_module(moduleName), className)
+
+def isEnabled():
+    return bool(_originalMethods)
+
+def enable():
+    """
+    Instrument the methods of `INSTRUMENTED_METHODS`, the records are kept from previous runs.
+    """
+    with _lock:
+        if _originalMethods:
+            return
+
+        for classPath, methods in INSTRUMENTED_METHODS.items():
+            modelClass = _getClass(classPath)
+            for methodName, recordName in methods.items():
+                method = modelClass.__dict__[methodName]
+                _originalMethods[(modelClass, methodName)] = method
+                setattr(modelClass, methodName, _wrap(method, "%s.%s" % (modelClass.__name__, recordName)))
+
+def disable():
+    """
+    Restore the original methods, the records are kept.
+    """
+    with _lock:
+        for (modelClass, methodName), method in _originalMethods.items():
+            setattr(modelClass, methodName, method)
+        _originalMethods.clear()
+
+def reset():
+    with _lock:
+        _records.clear()
+
+@contextlib.contextmanager
+def instrumented():
+    """
+    Context manager enabling the instrumentation, it is disabled at the exit if it was not enabled before.
+    """
+    wasEnabled = isEnabled()
+    enable()
+    try:
+        yield
+    finally:
+        if not wasEnabled:
+            disable()
+
+def getSnapshot():
+    """
+    Return a copy of the records, a dictionary keyed by "class.method" or "class.branch".
+    """
+    with _lock:
+        snapshot = {}
+        for name, record in _records.items():
+            snapshot[name] = dict(record)
+            snapshot[name][KEY_HISTOGRAM] = dict(record[KEY_HISTOGRAM])
+        return snapshot
+
+def getSnapshotJson(indent=None):
+    """
+    Return the records as a JSON string, the histogram bins are strings.
+    """
+    snapshot = getSnapshot()
+    for record in snapshot.values():
+        record[KEY_HISTOGRAM] = dict((str(binValue), count) for binValue, count in sorted(record[KEY_HISTOGRAM].items()))
+    return json.dumps(snapshot, indent=indent, sort_keys=True)
@@ -22,14 +22,80 @@ import numpy as np
 
 # Project modules
 import pyIonisationCrossSection.units as units
+import pyIonisationCrossSection.atomic_shell as atomic_shell
+from pyIonisationCrossSection.model import IonisationCrossSectionModel, isScalar
 
 # Globals and constants variables.
 
-class Jakoby1987(object):
+MAXIMUM_ATOMIC_NUMBER = 100
+
+class Jakoby1987(IonisationCrossSectionModel):
+    name = "Jakoby (1987)"
+    shells = (atomic_shell.SHELL_K,)
+    maximumAtomicNumber = MAXIMUM_ATOMIC_NUMBER
+
     def __init__(self):
         self._mc2_eV = 511.0e3
 
+        atomicNumbers = np.arange(1, MAXIMUM_ATOMIC_NUMBER + 1, dtype=np.float64)
+        self._coefficientsA = np.concatenate(([np.nan], self._computeA(atomicNumbers)))
+        self._coefficientsB = np.concatenate(([np.nan], self._computeB(atomicNumbers)))
+        self._coefficientsC = np.concatenate(([np.nan], self._computeC(atomicNumbers)))
+        self._coefficientsList = list(zip(self._coefficientsA.tolist(), self._coefficientsB.tolist(), self._coefficientsC.tolist()))
+
     def ics_nm2(self, atomicNumber, ionisationEnergy_eV, electronEnergy_eV, shell):
+        """
+        Compute the ionisation cross section in nm2.
+
+        The atomic number, ionisation energy and electron energy can be scalars or arrays broadcastable together,
+        an array is returned if any argument is an array. The coefficients a, b, c of Z = 1 to 100 are
+        precomputed. The shell is not used, the model is for the K shell.
+        """
+        if isScalar(electronEnergy_eV) and isScalar(ionisationEnergy_eV) and isScalar(atomicNumber):
+            return self._computeCrossSection_nm2(atomicNumber, ionisationEnergy_eV, electronEnergy_eV)
+
+        a, b, c = self._getCoefficients(atomicNumber)
+        beta02 = self._computeBeta2(np.asarray(ionisationEnergy_eV, dtype=np.float64))
+        beta2 = self._computeBeta2(np.asarray(electronEnergy_eV, dtype=np.float64))
+        IK_keV = units.eV_to_keV(ionisationEnergy_eV)
+
+        ratio = beta02/beta2
+        sigmas_barn = a*254.9/(IK_keV*beta2)*(np.log(beta2/(1.0 - beta2)) - beta2 + b*(1.0 - ratio) - np.log(beta02)*np.power(ratio, c))
+
+        if isinstance(sigmas_barn, np.ndarray):
+            sigmas_nm2 = units.barn_to_nm2(sigmas_barn, out=sigmas_barn)
+        else:
+            sigmas_nm2 = units.barn_to_nm2(sigmas_barn)
+
+        return sigmas_nm2
+
+    def ics_nm2_array(self, atomicNumbers, ionisationEnergies_eV, electronEnergies_eV, shells):
+        return np.asarray(self.ics_nm2(atomicNumbers, ionisationEnergies_eV, electronEnergies_eV, shells), dtype=np.float64)
+
+    def _getCoefficients(self, atomicNumber):
+        atomicNumber = np.asarray(atomicNumber)
+        if atomicNumber.dtype.kind not in "iu":
+            return self._computeA(atomicNumber), self._computeB(atomicNumber), self._computeC(atomicNumber)
+
+        isInTable = (atomicNumber > 0) & (atomicNumber <= MAXIMUM_ATOMIC_NUMBER)
+        indexes = np.where(isInTable, atomicNumber, 0)
+        coefficients = [self._coefficientsA[indexes], self._coefficientsB[indexes], self._coefficientsC[indexes]]
+        if not np.all(isInTable):
+            coefficients = [np.array(values) for values in coefficients]
+            # The atomic numbers outside the table are computed, as in the scalar path.
+            atomicNumbersOutside = atomicNumber[~isInTable].astype(np.float64)
+            for values, computeCoefficient in zip(coefficients, [self._computeA, self._computeB, self._computeC]):
+                values[~isInTable] = computeCoefficient(atomicNumbersOutside)
+        return coefficients
+
+    def _computeCrossSection_nm2(self, atomicNumber, ionisationEnergy_eV, electronEnergy_eV):
+        if isinstance(atomicNumber, (int, np.integer)) and 0 < atomicNumber <= MAXIMUM_ATOMIC_NUMBER:
+            a, b, c = self._coefficientsList[atomicNumber]
+        else:
+            a = self._computeA(atomicNumber)
+            b = self._computeB(atomicNumber)
+            c = self._computeC(atomicNumber)
+
         beta2 = self._computeBeta2(electronEnergy_eV)
         beta02 = self._computeBeta2(ionisationEnergy_eV)
 
@@ -39,10 +105,6 @@ class Jakoby1987(object):
         F4 = self._computeF4(beta02)
         F5 = self._computeF5(beta2, beta02)
 
-        a = self._computeA(atomicNumber)
-        b = self._computeB(atomicNumber)
-        c = self._computeC(atomicNumber)
-
         factor1 = a*F1
         factor2 = F2 + b*F3 + F4*np.power(F5, c)
 
@@ -53,7 +115,8 @@ class Jakoby1987(object):
         return sigma_nm2
 
     def _computeBeta2(self, energy_eV):
-        beta2 = 1.0 - np.power((1.0 + energy_eV/self._mc2_eV), -2.0)
+        gamma = 1.0 + energy_eV/self._mc2_eV
+        beta2 = 1.0 - 1.0/(gamma*gamma)
         return beta2
 
     def _computeF1(self, ionisationEnergy_eV, beta2):
@@ -101,10 +164,10 @@ def dataFigure1Jakoby1987():
 
     uList = np.arange(1.0, 50.0, 0.1).tolist()
     uList.extend(np.arange(50.0, 1.0e9/ionisationEnergy_eV, 10.0).tolist())
-    energies_eV = [U*ionisationEnergy_eV for U in uList]
+    energies_eV = np.array(uList)*ionisationEnergy_eV
 
     modelICS = Jakoby1987()
-    sigmaList_nm2 = [modelICS.ics_nm2(atomicNumber, ionisationEnergy_eV, electronEnergy_eV, shell) for electronEnergy_eV in energies_eV]
+    sigmaList_nm2 = modelICS.ics_nm2(atomicNumber, ionisationEnergy_eV, energies_eV, shell)
 
     return energies_eV, sigmaList_nm2
 
@@ -112,8 +175,8 @@ def run():
     import matplotlib.pyplot as plt
 
     energies_eV, sigmaList_nm2 = dataFigure1Jakoby1987()
-    energies_keV = [units.eV_to_keV(energy_eV) for energy_eV in energies_eV]
-    sigmaList_barn = [units.nm2_to_barn(sigma_nm2) for sigma_nm2 in sigmaList_nm2]
+    energies_keV = units.eV_to_keV(energies_eV)
+    sigmaList_barn = units.nm2_to_barn(sigmaList_nm2)
 
     plt.figure()
     plt.semilogx(energies_keV, sigmaList_barn)
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+"""
+.. py:currentmodule:: material
+.. moduleauthor:: Hendrix Demers <hendrix.demers@mail.mcgill.ca>
+
+Materials made of several elements and their macroscopic ionisation cross sections.
+
+The macroscopic cross section of a shell of an element is n sigma, with n the number of atoms of the element
+per volume of material, and the mean free path between ionisations is its inverse.
+"""
+
+# Script information for the file.
+__author__ = "Hendrix Demers (hendrix.demers@mail.mcgill.ca)"
+__version__ = ""
+__date__ = ""
+__copyright__ = "Copyright (c) 2012 Hendrix Demers"
+__license__ = ""
+
+# Standard library modules.
+import collections
+
+# Third party modules.
+import numpy as np
+
+# Local modules.
+
+# Project modules
+from pyIonisationCrossSection.edge_energy import getEdgeEnergies_eV
+from pyIonisationCrossSection.units import computeNumberDensity_nm3
+
+# Globals and constants variables.
+FRACTION_MASS = "mass"
+FRACTION_ATOMIC = "atomic"
+
+# Standard atomic weights in g/mol of Z = 1 to 100, mass number of the most stable isotope for the elements
+# without stable isotope.
+ATOMIC_MASSES_g_mol = [
+    1.008, 4.0026, 6.94, 9.0122, 10.81, 12.011, 14.007, 15.999, 18.998, 20.180,
+    22.990, 24.305, 26.982, 28.085, 30.974, 32.06, 35.45, 39.948, 39.098, 40.078,
+    44.956, 47.867, 50.942, 51.996, 54.938, 55.845, 58.933, 58.693, 63.546, 65.38,
+    69.723, 72.630, 74.922, 78.971, 79.904, 83.798, 85.468, 87.62, 88.906, 91.224,
+    92.906, 95.95, 98.0, 101.07, 102.91, 106.42, 107.87, 112.41, 114.82, 118.71,
+    121.76, 127.60, 126.90, 131.29, 132.91, 137.33, 138.91, 140.12, 140.91, 144.24,
+    145.0, 150.36, 151.96, 157.25, 158.93, 162.50, 164.93, 167.26, 168.93, 173.05,
+    174.97, 178.49, 180.95, 183.84, 186.21, 190.23, 192.22, 195.08, 196.97, 200.59,
+    204.38, 207.2, 208.98, 209.0, 210.0, 222.0, 223.0, 226.0, 227.0, 232.04,
+    231.04, 238.03, 237.0, 244.0, 243.0, 247.0, 247.0, 251.0, 252.0, 257.0]
+
+MaterialCrossSections = collections.namedtuple("MaterialCrossSections",
+                                               ["atomicNumbers", "shells", "energies_eV", "macroscopicCrossSections_1_nm",
+                                                "totalMacroscopicCrossSections_1_nm", "meanFreePaths_nm", "totalMeanFreePaths_nm"])
+
+def getAtomicMass_g_mol(atomicNumber):
+    if not 1 <= atomicNumber <= len(ATOMIC_MASSES_g_mol):
+        raise ValueError("No atomic mass for the atomic number %s." % (atomicNumber))
+    return ATOMIC_MASSES_g_mol[atomicNumber - 1]
+
+class Material(object):
+    """
+    Material defined by the fractions of its elements and its density.
+
+    The composition is a dictionary of fractions keyed by atomic number, mass fractions by default or atomic
+    fractions with `fractionType=FRACTION_ATOMIC`. The fractions are normalized. An atomic number outside 1 to 100
+    raises ValueError.
+    """
+
+    def __init__(self, composition, density_g_cm3, fractionType=FRACTION_MASS, name=None):
+        atomicNumbers = sorted(composition)
+        fractions = np.array([composition[atomicNumber] for atomicNumber in atomicNumbers], dtype=np.float64)
+        if np.any(fractions < 0.0) or np.sum(fractions) <= 0.0:
+            raise ValueError("The fractions must be positive: %s" % (composition))
+        fractions /= np.sum(fractions)
+
+        self.name = name
+        self.density_g_cm3 = density_g_cm3
+        self.atomicNumbers = np.array(atomicNumbers, dtype=np.int64)
+        self.atomicMasses_g_mol = np.array([getAtomicMass_g_mol(atomicNumber) for atomicNumber in atomicNumbers])
+
+        if fractionType == FRACTION_MASS:
+            self.massFractions = fractions
+            atomicFractions = fractions/self.atomicMasses_g_mol
+            self.atomicFractions = atomicFractions/np.sum(atomicFractions)
+        elif fractionType == FRACTION_ATOMIC:
+            self.atomicFractions = fractions
+            massFractions = fractions*self.atomicMasses_g_mol
+            self.massFractions = massFractions/np.sum(massFractions)
+        else:
+            raise ValueError("Unknown fraction type: %s" % (fractionType))
+
+    @property
+    def numberDensities_nm3(self):
+        """
+        Number of atoms of each element per nm3 of material.
+        """
+        return computeNumberDensity_nm3(self.atomicMasses_g_mol, self.density_g_cm3*self.massFractions)
+
+class MaterialCrossSectionCalculator(object):
+    """
+    Compute the macroscopic cross sections of materials with a model over a fixed energy array.
+
+    The cross sections of all the shells of the elements not yet computed are evaluated in one `ics_nm2_array`
+    call and cached by atomic number, so materials sharing elements reuse them. The shells default to the shells
+    of the model and the ionisation energies are the edge energies of the module `edge_energy`. The cross sections are
+    zero below the edge energy and for the shells that do not exist for an element or are not supported by the model.
+    """
+
+    def __init__(self, model, energies_eV, shells=None):
+        self.model = model
+        self.energies_eV = np.asarray(energies_eV, dtype=np.float64)
+        if shells is None:
+            shells = model.shells
+        self.shells = list(shells)
+
+        self._crossSections_nm2 = {}
+
+    def getElementCrossSections_nm2(self, atomicNumbers):
+        """
+        Return the cross sections of the elements, an array of shape (number of Z, number of shells) + energies shape.
+        """
+        atomicNumbers = [int(atomicNumber) for atomicNumber in atomicNumbers]
+        missingAtomicNumbers = sorted(set(atomicNumber for atomicNumber in atomicNumbers if atomicNumber not in self._crossSections_nm2))
+        if missingAtomicNumbers:
+            crossSections_nm2 = self._computeCrossSections_nm2(np.array(missingAtomicNumbers, dtype=np.int64))
+            for atomicNumber, values in zip(missingAtomicNumbers, crossSections_nm2):
+                self._crossSections_nm2[atomicNumber] = values
+
+        shape = (len(atomicNumbers), len(self.shells)) + self.energies_eV.shape
+        crossSections_nm2 = np.empty(shape)
+        for index, atomicNumber in enumerate(atomicNumbers):
+            crossSections_nm2[index] = self._crossSections_nm2[atomicNumber]
+        return crossSections_nm2
+
+    def clearCache(self):
+        self._crossSections_nm2.clear()
+
+    def compute(self, material):
+        """
+        Return the `MaterialCrossSections` of the material.
+
+        The macroscopic cross sections in 1/nm and the mean free paths in nm have the shape (number of elements,
+        number of shells) + energies shape, the totals over the elements and shells have the energies shape. The
+        mean free path is infinite where the cross section is zero.
+        """
+        crossSections_nm2 = self.getElementCrossSections_nm2(material.atomicNumbers)
+        numberDensities_nm3 = material.numberDensities_nm3.reshape((-1, 1) + (1,)*self.energies_eV.ndim)
+        macroscopicCrossSections_1_nm = numberDensities_nm3*crossSections_nm2
+        totalMacroscopicCrossSections_1_nm = np.sum(macroscopicCrossSections_1_nm, axis=(0, 1))
+
+        with np.errstate(divide='ignore'):
+            meanFreePaths_nm = 1.0/macroscopicCrossSections_1_nm
+            totalMeanFreePaths_nm = 1.0/totalMacroscopicCrossSections_1_nm
+
+        return MaterialCrossSections(material.atomicNumbers, self.shells, self.energies_eV, macroscopicCrossSections_1_nm,
+                                     totalMacroscopicCrossSections_1_nm, meanFreePaths_nm, totalMeanFreePaths_nm)
+
+    def _computeCrossSections_nm2(self, atomicNumbers):
+        ionisationEnergies_eV = getEdgeEnergies_eV(atomicNumbers[:, np.newaxis], np.array(self.shells)[np.newaxis, :])
+        isSupported = np.empty(ionisationEnergies_eV.shape, dtype=bool)
+        for indexShell, shell in enumerate(self.shells):
+            isSupported[:, indexShell] = [self.model.isSupported(atomicNumber, shell) for atomicNumber in atomicNumbers.tolist()]
+        isSupported &= np.isfinite(ionisationEnergies_eV)
+
+        crossSections_nm2 = np.zeros(ionisationEnergies_eV.shape + self.energies_eV.shape)
+        shellIndexes = np.flatnonzero(np.any(isSupported, axis=0))
+        if len(shellIndexes) == 0:
+            return crossSections_nm2
+
+        # The shells unknown to the model are not passed to it.
+        ionisationEnergies_eV = np.where(isSupported, ionisationEnergies_eV, np.inf)[:, shellIndexes]
+        shells = np.array(self.shells)[shellIndexes]
+        axes = (1,)*self.energies_eV.ndim
+        ionisationEnergies_eV = ionisationEnergies_eV.reshape(ionisationEnergies_eV.shape + axes)
+        values = self.model.ics_nm2_array(atomicNumbers.reshape((-1, 1) + axes), ionisationEnergies_eV,
+                                          self.energies_eV, shells.reshape((1, -1) + axes))
+        # Not all the models vanish at the edge, a shell cannot be ionised below its edge energy.
+        crossSections_nm2[:, shellIndexes] = np.where(self.energies_eV < ionisationEnergies_eV, 0.0, values)
+        crossSections_nm2[~isSupported] = 0.0
+
+        return crossSections_nm2
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+"""
+.. py:currentmodule:: model
+.. moduleauthor:: Hendrix Demers <hendrix.demers@mail.mcgill.ca>
+
+Common interface of the ionisation cross section models and registry of the models by name.
+"""
+
+# Script information for the file.
+__author__ = "Hendrix Demers (hendrix.demers@mail.mcgill.ca)"
+__version__ = ""
+__date__ = ""
+__copyright__ = "Copyright (c) 2012 Hendrix Demers"
+__license__ = ""
+
+# Standard library modules.
+import importlib
+
+# Third party modules.
+import numpy as np
+
+# Local modules.
+
+# Project modules
+
+# Globals and constants variables.
+SCALAR_TYPES = (int, float, np.number)
+
+MODEL_CASNATI1982 = "casnati1982"
+MODEL_BROWN1974 = "brown1974"
+MODEL_JAKOBY1987 = "jakoby1987"
+MODEL_BOTE2009 = "bote2009"
+
+def isScalar(value):
+    """
+    Return True if the value is a python or numpy number, faster than `np.ndim(value) == 0`.
+    """
+    return isinstance(value, SCALAR_TYPES)
+
+def getShellIndexes(shells, shellIndexes):
+    """
+    Return the indexes of an array of shells, an unknown shell raises KeyError.
+    """
+    shells = np.asarray(shells)
+    uniqueShells, inverse = np.unique(shells, return_inverse=True)
+    indexes = np.array([shellIndexes[shell] for shell in uniqueShells.tolist()], dtype=np.int64)
+    return indexes[inverse].reshape(shells.shape)
+
+class IonisationCrossSectionModel(object):
+    """
+    Base class of the ionisation cross section models.
+
+    A model implements the scalar `ics_nm2(atomicNumber, ionisationEnergy_eV, electronEnergy_eV, shell)` and
+    reports the shells and the range of atomic numbers it supports. The batch method `ics_nm2_array` evaluates
+    broadcastable arrays of arguments, a model without a native batch path falls back on `np.vectorize` of
+    `ics_nm2`. The methods `ics_nm2_edge` and `ics_nm2_edge_array` look the ionisation energies up in the edge
+    energy table of the module `edge_energy`.
+    """
+    name = None
+    shells = ()
+    minimumAtomicNumber = 1
+    maximumAtomicNumber = 100
+
+    def ics_nm2(self, atomicNumber, ionisationEnergy_eV, electronEnergy_eV, shell):
+        raise NotImplementedError
+
+    def ics_nm2_array(self, atomicNumbers, ionisationEnergies_eV, electronEnergies_eV, shells):
+        """
+        Compute the ionisation cross sections in nm2 of broadcastable arrays of arguments, return an array.
+        """
+        vectorizedFunction = np.vectorize(self.ics_nm2, otypes=[np.float64])
+        return vectorizedFunction(atomicNumbers, ionisationEnergies_eV, electronEnergies_eV, shells)
+
+    def ics_nm2_edge(self, atomicNumber, electronEnergy_eV, shell):
+        """
+        Compute the ionisation cross section in nm2 with the tabulated edge energy.
+
+        The cross section is zero below the edge energy, for a missing shell or a (Z, shell) not supported by the model.
+        """
+        from pyIonisationCrossSection.edge_energy import getEdgeEnergy_eV
+
+        if not self.isSupported(atomicNumber, shell):
+            return 0.0
+        ionisationEnergy_eV = getEdgeEnergy_eV(atomicNumber, shell)
+        if ionisationEnergy_eV != ionisationEnergy_eV or electronEnergy_eV < ionisationEnergy_eV:
+            return 0.0
+        return self.ics_nm2(atomicNumber, ionisationEnergy_eV, electronEnergy_eV, shell)
+
+    def ics_nm2_edge_array(self, atomicNumbers, electronEnergies_eV, shells):
+        """
+        Compute the ionisation cross sections in nm2 of broadcastable arrays with the tabulated edge energies.
+
+        The cross sections below the edge energies, of the missing shells, of the atomic numbers outside the table
+        and of the (Z, shell) not supported by the model are zero, only the other values are passed to `ics_nm2_array`.
+        """
+        from pyIonisationCrossSection.edge_energy import getEdgeEnergies_eV
+
+        atomicNumbers = np.asarray(atomicNumbers, dtype=np.int64)
+        shells = np.asarray(shells)
+        shape = np.broadcast(atomicNumbers, electronEnergies_eV, shells).shape
+        atomicNumbers = np.broadcast_to(atomicNumbers, shape).ravel()
+        shells = np.broadcast_to(shells, shape).ravel()
+        energies_eV = np.broadcast_to(np.asarray(electronEnergies_eV, dtype=np.float64), shape).ravel()
+
+        ionisationEnergies_eV = getEdgeEnergies_eV(atomicNumbers, shells)
+        isSupported = self._getSupportedMask(atomicNumbers, shells) & ~np.isnan(ionisationEnergies_eV)
+        isSupported &= energies_eV >= ionisationEnergies_eV
+
+        crossSections_nm2 = np.zeros(len(energies_eV))
+        if np.any(isSupported):
+            crossSections_nm2[isSupported] = self.ics_nm2_array(atomicNumbers[isSupported], ionisationEnergies_eV[isSupported],
+                                                                energies_eV[isSupported], shells[isSupported])
+        return crossSections_nm2.reshape(shape)
+
+    def isSupported(self, atomicNumber, shell):
+        """
+        Return True if the model supports the atomic number and the shell.
+        """
+        return shell in self.shells and self.minimumAtomicNumber <= atomicNumber <= self.maximumAtomicNumber
+
+    def _getSupportedMask(self, atomicNumbers, shells):
+        """
+        Return the `isSupported` mask of 1-d arrays of atomic numbers and shells, evaluated once per distinct value.
+        """
+        uniqueAtomicNumbers, atomicNumberIndexes = np.unique(atomicNumbers, return_inverse=True)
+        uniqueShells, shellIndexes = np.unique(shells, return_inverse=True)
+        isSupported = np.array([[self.isSupported(atomicNumber, shell) for shell in uniqueShells.tolist()]
+                                for atomicNumber in uniqueAtomicNumbers.tolist()], dtype=bool)
+        return isSupported.reshape(len(uniqueAtomicNumbers), len(uniqueShells))[atomicNumberIndexes, shellIndexes]
+
+_registry = {}
+
+def registerModel(name, factory):
+    """
+    Register a model factory under a name, the factory is a callable returning a model or a "module:attribute"
+    string of such callable imported on first use.
+    """
+    _registry[name.lower()] = factory
+
+def getModelNames():
+    """
+    Return the sorted names of the registered models.
+    """
+    return sorted(_registry)
+
+def getModel(name):
+    """
+    Return a model from its registered name, the name is case insensitive.
+    """
+    try:
+        factory = _registry[name.lower()]
+    except KeyError:
+        raise KeyError("Unknown model %s, the registered models are: %s" % (name, ", ".join(getModelNames())))
+
+    if isinstance(factory, str):
+        moduleName, attributeName = factory.split(":")
+        factory = getattr(importlib.import_module(moduleName), attributeName)
+        _registry[name.lower()] = factory
+
+    return factory()
+
+registerModel(MODEL_CASNATI1982, "pyIonisationCrossSection.casnati:Casnati")
+registerModel(MODEL_BROWN1974, "pyIonisationCrossSection.brown:Brown1974")
+registerModel(MODEL_JAKOBY1987, "pyIonisationCrossSection.jakoby:Jakoby1987")
+registerModel(MODEL_BOTE2009, "pyIonisationCrossSection.bote2009:getSharedModel")
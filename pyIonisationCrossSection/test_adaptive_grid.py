@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+"""
+.. py:currentmodule:: test_adaptive_grid
+.. moduleauthor:: Hendrix Demers <hendrix.demers@mail.mcgill.ca>
+
+Tests for the module `adaptive_grid`.
+"""
+
+# Script information for the file.
+__author__ = "Hendrix Demers (hendrix.demers@mail.mcgill.ca)"
+__version__ = ""
+__date__ = ""
+__copyright__ = "Copyright (c) 2012 Hendrix Demers"
+__license__ = ""
+
+# Standard library modules.
+import unittest
+import logging
+
+# Third party modules.
+import numpy as np
+
+# Local modules.
+
+# Project modules
+import pyIonisationCrossSection.adaptive_grid as adaptive_grid
+import pyIonisationCrossSection.atomic_shell as atomic_shell
+import pyIonisationCrossSection.bote2009 as bote2009
+from pyIonisationCrossSection.model import getModel
+
+# Globals and constants variables.
+
+class Testadaptive_grid(unittest.TestCase):
+    """
+    TestCase class for the module `adaptive_grid`.
+    """
+
+    def setUp(self):
+        """
+        Setup method.
+        """
+
+        unittest.TestCase.setUp(self)
+
+    def tearDown(self):
+        """
+        Teardown method.
+        """
+
+        unittest.TestCase.tearDown(self)
+
+    def testSkeleton(self):
+        """
+        First test to check if the testcase is working with the testing framework.
+        """
+
+        #self.fail("Test if the testcase is working.")
+        self.assertTrue(True)
+
+    def test_interpolateLogLog(self):
+        """
+        Tests for method `interpolateLogLog`.
+        """
+
+        energiesGrid_eV = np.array([1.0, 10.0, 100.0])
+        valuesGrid = np.array([0.0, 1.0, 100.0])
+
+        values = adaptive_grid.interpolateLogLog(energiesGrid_eV, valuesGrid, [0.5, np.sqrt(10.0), 10.0, 50.0, 1000.0])
+        np.testing.assert_allclose([0.0, 0.5, 1.0, 50.0**2/100.0, 100.0], values)
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_createAdaptiveGrid(self):
+        """
+        Tests for method `createAdaptiveGrid`.
+        """
+
+        grid = adaptive_grid.createAdaptiveGrid(lambda energies_eV: np.power(energies_eV, -1.5), 1.0, 1.0e6)
+        self.assertEquals(adaptive_grid.DEFAULT_INITIAL_NUMBER_POINTS, len(grid.energies_eV))
+        self.assertTrue(grid.maximumError < 1.0e-12)
+
+        function = lambda energies_eV: np.exp(-((np.log10(energies_eV) - 3.0)/0.2)**2)
+        grid = adaptive_grid.createAdaptiveGrid(function, 1.0, 1.0e6, tolerance=1.0e-4, breakpoints_eV=[2.0e3, 1.0e7])
+        self.assertTrue(np.all(np.diff(grid.energies_eV) > 0.0))
+        self.assertTrue(2.0e3 in grid.energies_eV.tolist())
+        self.assertEquals(1.0e6, grid.energies_eV[-1])
+        np.testing.assert_array_equal(function(grid.energies_eV), grid.values)
+        self.assertTrue(0.0 < grid.maximumError <= 1.0e-4)
+
+        energies_eV = np.geomspace(1.0, 1.0e6, 10001)
+        expectedValues = function(energies_eV)
+        values = adaptive_grid.interpolateLogLog(grid.energies_eV, grid.values, energies_eV)
+        mask = expectedValues > 1.0e-3
+        self.assertTrue(np.max(np.abs(values[mask]/expectedValues[mask] - 1.0)) < 2.0e-4)
+
+        self.assertRaises(RuntimeError, adaptive_grid.createAdaptiveGrid, function, 1.0, 1.0e6, tolerance=1.0e-8,
+                          maximumNumberPoints=100)
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_createModelGrid(self):
+        """
+        Tests for method `createModelGrid`.
+        """
+
+        model = getModel("bote2009")
+        ionisationEnergy_eV = model.data[29][bote2009.SUBSHELL_K][bote2009.KEY_Eca_eV]
+        grid = adaptive_grid.createModelGrid(model, 29, atomic_shell.SHELL_K, ionisationEnergy_eV)
+
+        self.assertTrue(len(grid.energies_eV) < 250)
+        self.assertEquals(ionisationEnergy_eV, grid.energies_eV[0])
+        self.assertTrue(16.0*ionisationEnergy_eV in grid.energies_eV.tolist())
+
+        energies_eV = np.geomspace(ionisationEnergy_eV, 1.0e9, 20001)
+        expectedValues = model.ics_nm2_array(29, ionisationEnergy_eV, energies_eV, atomic_shell.SHELL_K)
+        values = adaptive_grid.interpolateLogLog(grid.energies_eV, grid.values, energies_eV)
+        mask = expectedValues > 1.0e-3*np.max(expectedValues)
+        self.assertTrue(np.max(np.abs(values[mask]/expectedValues[mask] - 1.0)) < 2.0e-3)
+
+        #self.fail("Test if the testcase is working.")
+
+if __name__ == '__main__':  #pragma: no cover
+    logging.getLogger().setLevel(logging.DEBUG)
+    from pyHendrixDemersTools.Testings import runTestModuleWithCoverage
+    runTestModuleWithCoverage(__file__)
@@ -16,9 +16,15 @@ __license__ = ""
 # Standard library modules.
 import unittest
 import logging
+import operator
 import os.path
+import shutil
+import tempfile
+import threading
+from unittest import mock
 
 # Third party modules.
+import numpy as np
 
 # Local modules.
 import pyHendrixDemersTools.Files as Files
@@ -40,6 +46,14 @@ class Test_bote2009(unittest.TestCase):
 
         unittest.TestCase.setUp(self)
 
+        self.cachePath = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cachePath)
+        environment = mock.patch.dict(os.environ, {bote2009.CACHE_DIRECTORY_VARIABLE: self.cachePath})
+        environment.start()
+        self.addCleanup(environment.stop)
+        bote2009.clearSharedModels()
+        self.addCleanup(bote2009.clearSharedModels)
+
         dataFilepath = Files.getCurrentModulePath(__file__, "../data/bote2009_tables.csv")
         self.assertTrue(os.path.isfile(dataFilepath))
 
@@ -129,6 +143,224 @@ class Test_bote2009(unittest.TestCase):
         #self.fail("Test if the testcase is working.")
         self.assert_(True)
 
+    def test_iterateOriginalDataFile(self):
+        """
+        Tests for method `iterateOriginalDataFile`.
+        """
+
+        dataFilepath = Files.getCurrentModulePath(__file__, "../data/bote2009_tables.csv")
+        records = list(bote2009.iterateOriginalDataFile(dataFilepath))
+
+        self.assertEquals(3*731, len(records))
+        for table in bote2009.ORIGINAL_TABLE_KEYS:
+            tableRecords = [record for record in records if record.table == table]
+            self.assertEquals(731, len(tableRecords))
+            for record in tableRecords:
+                self.assertEquals(len(bote2009.ORIGINAL_TABLE_KEYS[table]), len(record.values))
+
+        record = records[0]
+        self.assertEquals(bote2009.KEY_FACTORS_A, record.table)
+        self.assertEquals(1, record.atomicNumber)
+        self.assertEquals(bote2009.SUBSHELL_K, record.subshell)
+        self.assertAlmostEquals(1.361e1, record.values[0])
+
+        record = records[-1]
+        self.assertEquals(bote2009.KEY_FACTORS_G, record.table)
+        self.assertEquals(99, record.atomicNumber)
+        self.assertEquals(bote2009.SUBSHELL_M5, record.subshell)
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_createTabulatedDataFile(self):
+        """
+        Tests for method `createTabulatedDataFile`.
+        """
+
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+
+        sourceFilepath = Files.getCurrentModulePath(__file__, "../data/bote2009_tables.csv")
+        dataFilepath = os.path.join(path, "bote2009_tables.csv")
+        shutil.copy(sourceFilepath, dataFilepath)
+
+        model = bote2009.Bote2009()
+        model.createTabulatedDataFile(dataFilepath)
+
+        parametersFilepath = os.path.join(path, "bote2009_Parameters.csv")
+        self.assertTrue(os.path.isfile(parametersFilepath))
+
+        modelCreated = bote2009.Bote2009()
+        modelCreated.readTabulatedDataFile(parametersFilepath)
+
+        modelRef = bote2009.Bote2009()
+        modelRef.readTabulatedDataFile(Files.getCurrentModulePath(__file__, "../data/bote2009_Parameters.csv"))
+
+        np.testing.assert_array_equal(modelRef.isValid, modelCreated.isValid)
+        np.testing.assert_array_equal(modelRef.parameters, modelCreated.parameters)
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_readTabulatedDataFile_cache(self):
+        """
+        Tests for method `readTabulatedDataFile` with the binary cache.
+        """
+
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        cachePath = os.path.join(path, "cache")
+        environment = mock.patch.dict(os.environ, {bote2009.CACHE_DIRECTORY_VARIABLE: cachePath})
+        environment.start()
+        self.addCleanup(environment.stop)
+
+        sourceFilepath = Files.getCurrentModulePath(__file__, "../data/bote2009_Parameters.csv")
+        dataFilepath = os.path.join(path, "bote2009_Parameters.csv")
+        shutil.copy(sourceFilepath, dataFilepath)
+
+        modelRef = bote2009.Bote2009()
+        modelRef.readTabulatedDataFile(dataFilepath)
+        self.assertFalse(modelRef.isReadOnly)
+
+        model = bote2009.Bote2009()
+        model.readTabulatedDataFile(dataFilepath, useCache=True)
+        cacheFilepath = bote2009.getCacheFilepath(dataFilepath)
+        self.assertEquals(cachePath, os.path.dirname(cacheFilepath))
+        self.assertTrue(os.path.isfile(cacheFilepath))
+        self.assertEquals(["bote2009_Parameters.csv", "cache"], sorted(os.listdir(path)))
+        self.assertTrue(isinstance(model.parameters, np.memmap))
+        self.assertTrue(model.isReadOnly)
+        np.testing.assert_array_equal(modelRef.parameters, model.parameters)
+
+        model = bote2009.Bote2009()
+        model.readTabulatedDataFile(dataFilepath, useCache=True)
+        self.assertTrue(isinstance(model.parameters, np.memmap))
+        self.assertTrue(model.isReadOnly)
+        self.assertFalse(bote2009.getModel().isReadOnly)
+        np.testing.assert_array_equal(modelRef.parameters, model.parameters)
+        np.testing.assert_array_equal(modelRef.isValid, model.isValid)
+        self.assertAlmostEquals(-4.301e-2, model.data[36][bote2009.SUBSHELL_M1][bote2009.KEY_a5])
+
+        lines = open(dataFilepath, 'r').readlines()
+        with open(dataFilepath, 'w') as dataFile:
+            dataFile.writelines(lines[:10])
+        self.assertNotEquals(cacheFilepath, bote2009.getCacheFilepath(dataFilepath))
+
+        model = bote2009.Bote2009()
+        model.readTabulatedDataFile(dataFilepath, useCache=True)
+        self.assertEquals(10, np.count_nonzero(model.isValid))
+        self.assertFalse(os.path.isfile(cacheFilepath))
+        self.assertTrue(os.path.isfile(bote2009.getCacheFilepath(dataFilepath)))
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_getSharedModel(self):
+        """
+        Tests for method `getSharedModel`.
+        """
+
+        models = []
+        threads = [threading.Thread(target=lambda: models.append(bote2009.getSharedModel())) for _index in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        model = bote2009.getSharedModel()
+        self.assertEquals(8, len(models))
+        for otherModel in models:
+            self.assertTrue(otherModel is model)
+        self.assertTrue(bote2009.getSharedModel(bote2009.getDefaultDataFilepath()) is model)
+
+        self.assertTrue(model.isReadOnly)
+        self.assertFalse(isinstance(model.parameters, np.memmap))
+        self.assertEquals([], os.listdir(self.cachePath))
+        self.assertFalse(model.parameters.flags.writeable)
+        self.assertRaises(AttributeError, setattr, model, "data", {})
+        self.assertRaises(ValueError, model.parameters.__setitem__, (1, 0, 0), 1.0)
+
+        reloadedModel = bote2009.reloadSharedModel()
+        self.assertFalse(reloadedModel is model)
+        self.assertTrue(bote2009.getSharedModel() is reloadedModel)
+        np.testing.assert_array_equal(model.parameters, reloadedModel.parameters)
+
+        bote2009.clearSharedModels()
+        self.assertFalse(bote2009.getSharedModel() is reloadedModel)
+
+        reloadedModel = bote2009.reloadSharedModel(useCache=True)
+        self.assertTrue(isinstance(reloadedModel.parameters, np.memmap))
+        self.assertTrue(reloadedModel.isReadOnly)
+        self.assertEquals(1, len(os.listdir(self.cachePath)))
+        np.testing.assert_array_equal(model.parameters, reloadedModel.parameters)
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_crossSectionGrid_cm2(self):
+        """
+        Tests for method `crossSectionGrid_cm2`.
+        """
+
+        atomicNumbers = [1, 29, 79, 120]
+        energies_eV = np.logspace(1.0, 9.0, 41)
+
+        for particle in [bote2009.PARTICLE_ELECTRON, bote2009.PARTICLE_POSITRON]:
+            crossSections_cm2 = self.model.crossSectionGrid_cm2(energies_eV, atomicNumbers, bote2009.SUBSHELLS, particle)
+            self.assertEquals((4, 9, 41), crossSections_cm2.shape)
+
+            for indexZ, atomicNumber in enumerate(atomicNumbers):
+                for indexSubshell, subshell in enumerate(bote2009.SUBSHELLS):
+                    if atomicNumber in self.model.data and subshell in self.model.data[atomicNumber]:
+                        expectedValues = self.model.crossSection_cm2(energies_eV, atomicNumber, subshell, particle)
+                        np.testing.assert_allclose(expectedValues, crossSections_cm2[indexZ, indexSubshell], rtol=1.0e-12)
+                    else:
+                        self.assertTrue(np.all(np.isnan(crossSections_cm2[indexZ, indexSubshell])))
+
+        crossSections_cm2 = self.model.crossSectionGrid_cm2(energies_eV.reshape((1, 41)), [79], [bote2009.SUBSHELL_K], bote2009.PARTICLE_ELECTRON)
+        self.assertEquals((1, 1, 1, 41), crossSections_cm2.shape)
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_parameters(self):
+        """
+        Tests for the dense parameter table.
+        """
+
+        dataFilepath = Files.getCurrentModulePath(__file__, "../data/bote2009_Parameters.csv")
+        model = bote2009.Bote2009()
+        model.readTabulatedDataFile(dataFilepath)
+
+        self.assertEquals((bote2009.MAXIMUM_ATOMIC_NUMBER + 1, 9, bote2009.NUMBER_PARAMETERS), model.parameters.shape)
+        self.assertEquals(np.float64, model.parameters.dtype)
+        self.assertEquals(731, np.count_nonzero(model.isValid))
+        self.assertFalse(model.isValid[1, bote2009.SUBSHELL_INDEXES[bote2009.SUBSHELL_L1]])
+        self.assertTrue(np.isnan(model.parameters[1, bote2009.SUBSHELL_INDEXES[bote2009.SUBSHELL_L1], bote2009.INDEX_a1]))
+
+        subshellIndex = bote2009.SUBSHELL_INDEXES[bote2009.SUBSHELL_M1]
+        self.assertAlmostEquals(-4.301e-2, model.parameters[36, subshellIndex, bote2009.INDEX_a5])
+        self.assertAlmostEquals(2.783e2, model.parameters[36, subshellIndex, bote2009.INDEX_Eca_eV])
+        self.assertAlmostEquals(2.783e2, model.parameters[36, subshellIndex, bote2009.INDEX_Ecd_eV])
+        self.assertAlmostEquals(7.582e-2, model.parameters[36, subshellIndex, bote2009.INDEX_g4])
+
+        for atomicNumber in self.model.data:
+            for subshell in self.model.data[atomicNumber]:
+                for key in bote2009.PARAMETER_KEYS:
+                    self.assertAlmostEquals(self.model.data[atomicNumber][subshell][key], model.data[atomicNumber][subshell][key])
+
+        self.assertRaises(KeyError, model.crossSection_cm2, 1.0e3, 1, bote2009.SUBSHELL_L1, bote2009.PARTICLE_ELECTRON)
+        self.assertRaises(KeyError, model.crossSection_cm2, 1.0e3, 0, bote2009.SUBSHELL_K, bote2009.PARTICLE_ELECTRON)
+
+        subshellData = model.data[36][bote2009.SUBSHELL_M1]
+        self.assertRaises(TypeError, operator.setitem, subshellData, bote2009.KEY_a5, 1.0)
+        self.assertRaises(TypeError, operator.setitem, model.data[36], bote2009.SUBSHELL_M1, {})
+        self.assertRaises(TypeError, operator.setitem, model.data, 36, {})
+
+        data = dict((atomicNumber, dict((subshell, dict(values)) for subshell, values in subshells.items()))
+                    for atomicNumber, subshells in model.data.items())
+        data[36][bote2009.SUBSHELL_M1][bote2009.KEY_a5] = 1.0
+        model.data = data
+        self.assertEquals(1.0, model.parameters[36, subshellIndex, bote2009.INDEX_a5])
+        self.assertEquals(1.0, model.data[36][bote2009.SUBSHELL_M1][bote2009.KEY_a5])
+
+        #self.fail("Test if the testcase is working.")
+
     def test_ionizationEnergies(self):
         """
         Tests for method `ionizationEnergies`.
@@ -207,6 +439,45 @@ class Test_bote2009(unittest.TestCase):
 
         #self.fail("Test if the testcase is working.")
 
+    def test__computeCrossSectionDWBA_array(self):
+        """
+        Tests for methods `_computeCrossSectionDWBAElectron` and `_computeCrossSectionDWBAPositron` with arrays.
+        """
+
+        atomicNumber = 79
+        subshell = bote2009.SUBSHELL_K
+        overvoltages = np.array([0.1, 1.0, 1.1, 12.35, 16.0, 16.1])
+
+        crossSections_cm2 = self.model._computeCrossSectionDWBAElectron(overvoltages, atomicNumber, subshell)
+        expectedValues = [0.0, 0.0, 0.11724133713184771, 1.0228468908595612, 1.0973762571623711, 1.099446345773381]
+        np.testing.assert_allclose(expectedValues, crossSections_cm2*1.0e23, atol=1.0e-7)
+
+        crossSections_cm2 = self.model._computeCrossSectionDWBAPositron(overvoltages, atomicNumber, subshell)
+        expectedValues = [0.0, 0.0, 0.0090553258325375644, 0.88130255940750024, 0.98124977226526255, 0.98396561046025066]
+        np.testing.assert_allclose(expectedValues, crossSections_cm2*1.0e23, atol=1.0e-7)
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_crossSectionsElectronPositron_cm2(self):
+        """
+        Tests for method `crossSectionsElectronPositron_cm2`.
+        """
+
+        energies_eV = np.logspace(1.0, 9.0, 161)
+        kinematics = bote2009.Kinematics(energies_eV)
+
+        for atomicNumber in [6, 47, 92]:
+            for subshell in self.model.data[atomicNumber]:
+                electronValues = self.model.crossSection_cm2(energies_eV, atomicNumber, subshell, bote2009.PARTICLE_ELECTRON)
+                positronValues = self.model.crossSection_cm2(energies_eV, atomicNumber, subshell, bote2009.PARTICLE_POSITRON)
+
+                for energies in [energies_eV, kinematics]:
+                    electronCrossSections_cm2, positronCrossSections_cm2 = self.model.crossSectionsElectronPositron_cm2(energies, atomicNumber, subshell)
+                    np.testing.assert_allclose(electronValues, electronCrossSections_cm2, rtol=1.0e-12)
+                    np.testing.assert_allclose(positronValues, positronCrossSections_cm2, rtol=1.0e-12)
+
+        #self.fail("Test if the testcase is working.")
+
     def test__computeCrossSectionPWBA(self):
         """
         Tests for method `_computeCrossSectionPWBA`.
@@ -454,6 +725,189 @@ class Test_bote2009(unittest.TestCase):
 
         #self.fail("Test if the testcase is working.")
 
+    def test_Kinematics(self):
+        """
+        Tests for class `Kinematics`.
+        """
+
+        energies_eV = np.array([10.0, 0.1e6, 0.5e6, 1.0e6])
+        kinematics = bote2009.Kinematics(energies_eV)
+
+        for index, energy_eV in enumerate(energies_eV):
+            beta = self.model._computeBeta(energy_eV)
+            xi = self.model._computeXi(energy_eV)
+            self.assertAlmostEquals(beta, kinematics.beta[index])
+            self.assertAlmostEquals(beta*beta, kinematics.beta2[index])
+            self.assertAlmostEquals(xi, kinematics.xi[index])
+            self.assertAlmostEquals(np.log(xi*xi), kinematics.logXi2[index])
+            self.assertAlmostEquals(np.power(1.0 - beta*beta, 0.25), kinematics.quarterPowerOneMinusBeta2[index])
+
+        selected = kinematics.select(np.array([False, True, False, True]))
+        np.testing.assert_array_equal([0.1e6, 1.0e6], selected.energies_eV)
+        np.testing.assert_array_equal(kinematics.xi[[1, 3]], selected.xi)
+
+        energies_eV = np.logspace(2.0, 9.0, 200)
+        kinematics = bote2009.Kinematics(energies_eV)
+        for subshell in bote2009.SUBSHELLS:
+            for particle in [bote2009.PARTICLE_ELECTRON, bote2009.PARTICLE_POSITRON]:
+                expectedValues = self.model.crossSection_cm2(energies_eV, 79, subshell, particle)
+                crossSections_cm2 = self.model.crossSection_cm2(kinematics, 79, subshell, particle)
+                np.testing.assert_allclose(expectedValues, crossSections_cm2, rtol=1.0e-12)
+
+        expectedValues = self.model.crossSectionGrid_cm2(energies_eV, [29, 79], bote2009.SUBSHELLS, bote2009.PARTICLE_ELECTRON)
+        crossSections_cm2 = self.model.crossSectionGrid_cm2(kinematics, [29, 79], bote2009.SUBSHELLS, bote2009.PARTICLE_ELECTRON)
+        np.testing.assert_array_equal(expectedValues, crossSections_cm2)
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_elementCrossSections_cm2(self):
+        """
+        Tests for method `elementCrossSections_cm2`.
+        """
+
+        energies_eV = np.logspace(1.0, 9.0, 81)
+
+        for atomicNumber in [1, 13, 79]:
+            for particle in [bote2009.PARTICLE_ELECTRON, bote2009.PARTICLE_POSITRON]:
+                crossSections_cm2, shellCrossSections_cm2 = self.model.elementCrossSections_cm2(energies_eV, atomicNumber, particle)
+                self.assertEquals((9, 81), crossSections_cm2.shape)
+
+                expectedTotal_cm2 = np.zeros_like(energies_eV)
+                for index, subshell in enumerate(bote2009.SUBSHELLS):
+                    if subshell in self.model.data[atomicNumber]:
+                        expectedValues = self.model.crossSection_cm2(energies_eV, atomicNumber, subshell, particle)
+                        np.testing.assert_allclose(expectedValues, crossSections_cm2[index], rtol=1.0e-12)
+                        expectedTotal_cm2 += expectedValues
+                    else:
+                        np.testing.assert_array_equal(0.0, crossSections_cm2[index])
+
+                np.testing.assert_allclose(expectedTotal_cm2, shellCrossSections_cm2[bote2009.SHELL_GROUP_TOTAL], rtol=1.0e-12)
+                np.testing.assert_allclose(crossSections_cm2[0], shellCrossSections_cm2[bote2009.SHELL_GROUP_K], rtol=1.0e-12)
+                np.testing.assert_allclose(np.sum(crossSections_cm2[1:4], axis=0), shellCrossSections_cm2[bote2009.SHELL_GROUP_L], rtol=1.0e-12)
+                np.testing.assert_allclose(np.sum(crossSections_cm2[4:], axis=0), shellCrossSections_cm2[bote2009.SHELL_GROUP_M], rtol=1.0e-12)
+
+        crossSections_cm2, shellCrossSections_cm2 = self.model.elementCrossSections_cm2([3.0e3], 79, bote2009.PARTICLE_ELECTRON)
+        np.testing.assert_array_equal(0.0, crossSections_cm2[:4])
+        self.assertTrue(crossSections_cm2[8, 0] > 0.0)
+
+        self.assertRaises(ValueError, self.model.elementCrossSections_cm2, [10.0], 79, "Proton")
+        self.assertRaises(ValueError, self.model.elementCrossSections_cm2, [], 79, "Proton")
+        self.assertRaises(ValueError, self.model.crossSection_cm2, 10.0, 79, bote2009.SUBSHELL_K, "Proton")
+        self.assertRaises(ValueError, self.model.crossSection_cm2, [10.0], 79, bote2009.SUBSHELL_K, "Proton")
+        self.assertRaises(ValueError, self.model.crossSectionGrid_cm2, [10.0], [79], [bote2009.SUBSHELL_K], "Proton")
+        self.assertRaises(ValueError, self.model.getThresholdIndex, "Proton")
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_getEvaluator(self):
+        """
+        Tests for method `getEvaluator`.
+        """
+
+        energies_eV = np.logspace(1.0, 9.0, 81)
+
+        for particle in [bote2009.PARTICLE_ELECTRON, bote2009.PARTICLE_POSITRON]:
+            for atomicNumber in [8, 79]:
+                for subshell in self.model.data[atomicNumber]:
+                    evaluator = self.model.getEvaluator(atomicNumber, subshell, particle)
+                    self.assertEquals(atomicNumber, evaluator.atomicNumber)
+                    self.assertEquals(particle, evaluator.particle)
+                    self.assertFalse(hasattr(evaluator, "__dict__"))
+
+                    expectedValues = self.model.crossSection_cm2(energies_eV, atomicNumber, subshell, particle)
+                    np.testing.assert_allclose(expectedValues, evaluator.evaluate(energies_eV), rtol=1.0e-12)
+                    for energy_eV, expectedValue in zip(energies_eV, expectedValues):
+                        self.assertAlmostEquals(expectedValue*1.0e23, evaluator(energy_eV)*1.0e23, places=10)
+
+        evaluator = self.model.getEvaluator(79, bote2009.SUBSHELL_K, bote2009.PARTICLE_ELECTRON)
+        self.assertAlmostEquals(8.096e4, evaluator.ionizationEnergy_eV)
+        self.assertAlmostEquals(0.11724133713184771, evaluator(1.1*8.096e4)*1.0e23)
+        self.assertAlmostEquals(2.6393837320124414, evaluator(1000.0*8.096e4)*1.0e23)
+
+        self.assertRaises(KeyError, self.model.getEvaluator, 1, bote2009.SUBSHELL_L1, bote2009.PARTICLE_ELECTRON)
+        self.assertRaises(ValueError, self.model.getEvaluator, 79, bote2009.SUBSHELL_K, "Proton")
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_ThresholdIndex(self):
+        """
+        Tests for class `ThresholdIndex`.
+        """
+
+        thresholdIndex = self.model.getThresholdIndex()
+        self.assertTrue(thresholdIndex is self.model.getThresholdIndex())
+        self.assertEquals(731, len(thresholdIndex.thresholds_eV))
+        self.assertTrue(np.all(np.diff(thresholdIndex.thresholds_eV) >= 0.0))
+
+        thresholds, subshells = thresholdIndex.getElementThresholds(29)
+        self.assertEquals(len(self.model.data[29]), len(subshells))
+        self.assertEquals(bote2009.SUBSHELL_K, subshells[-1])
+        self.assertAlmostEquals(8950.0, thresholds[-1])
+
+        energies_eV = [10.0, 100.0, 3.0e3, 1.0e5, 1.0e9]
+        for energy_eV in energies_eV:
+            for atomicNumber in [1, 29, 79]:
+                expectedSubshells = [subshell for subshell in self.model.data[atomicNumber]
+                                     if self.model.data[atomicNumber][subshell][bote2009.KEY_Eca_eV] < energy_eV]
+                subshells = thresholdIndex.getOpenSubshells(energy_eV, atomicNumber)
+                self.assertEquals(sorted(expectedSubshells), sorted(subshells))
+
+            expectedPairs = [(atomicNumber, subshell) for atomicNumber in self.model.data for subshell in self.model.data[atomicNumber]
+                             if self.model.data[atomicNumber][subshell][bote2009.KEY_Eca_eV] < energy_eV]
+            self.assertEquals(sorted(expectedPairs), sorted(thresholdIndex.getOpenPairs(energy_eV)))
+
+        numberOpenPairs = thresholdIndex.getNumberOpenPairs(energies_eV)
+        self.assertEquals([len(thresholdIndex.getOpenPairs(energy_eV)) for energy_eV in energies_eV], numberOpenPairs.tolist())
+        numberOpenSubshells = thresholdIndex.getNumberOpenSubshells(energies_eV, 79)
+        self.assertEquals([len(thresholdIndex.getOpenSubshells(energy_eV, 79)) for energy_eV in energies_eV], numberOpenSubshells.tolist())
+
+        edges = thresholdIndex.getEdges(8.0e3, 9.0e3)
+        self.assertEquals(12, len(edges))
+        self.assertTrue((8303.0, 28, bote2009.SUBSHELL_K) in edges)
+        self.assertTrue((8950.0, 29, bote2009.SUBSHELL_K) in edges)
+        for threshold_eV, atomicNumber, subshell in edges:
+            self.assertTrue(8.0e3 <= threshold_eV <= 9.0e3)
+            self.assertEquals(threshold_eV, self.model.data[atomicNumber][subshell][bote2009.KEY_Eca_eV])
+
+        starts, stops = thresholdIndex.getEdgeRanges([8.0e3, 1.0e9], [9.0e3, 1.0e10])
+        self.assertEquals([12, 0], (stops - starts).tolist())
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_crossSection_cm2_array(self):
+        """
+        Tests for method `crossSection_cm2` with an array of energies.
+        """
+
+        atomicNumber = 79
+        subshell = bote2009.SUBSHELL_K
+        ionizationEnergy_eV = 8.096e4
+        overvoltages = np.array([0.1, 1.0, 1.1, 12.35, 16.0, 16.1, 16.5, 40.0, 1000.0])
+        energies_eV = overvoltages * ionizationEnergy_eV
+
+        crossSections_cm2 = self.model.crossSection_cm2(energies_eV, atomicNumber, subshell, bote2009.PARTICLE_ELECTRON)
+        self.assertEquals(energies_eV.shape, crossSections_cm2.shape)
+        expectedValues = [0.0, 0.0, 0.11724133713184771, 1.0228468908595612, 1.0973762571623711,
+                          1.0990031222736776, 1.1057356376000727, 1.385422351961584, 2.6393837320124414]
+        for expectedValue, crossSection_cm2 in zip(expectedValues, crossSections_cm2):
+            self.assertAlmostEquals(expectedValue, crossSection_cm2*1.0e23)
+
+        crossSections_cm2 = self.model.crossSection_cm2(energies_eV, atomicNumber, subshell, bote2009.PARTICLE_POSITRON)
+        expectedValues = [0.0, 0.0, 0.0090553258325375644, 0.88130255940750024, 0.98124977226526255,
+                          0.98294660815523183, 0.99161519726946945, 1.3241028077847157, 2.6345826475397951]
+        for expectedValue, crossSection_cm2 in zip(expectedValues, crossSections_cm2):
+            self.assertAlmostEquals(expectedValue, crossSection_cm2*1.0e23)
+
+        energies_eV = np.logspace(3.0, 9.0, 50).reshape((5, 10))
+        crossSections_cm2 = self.model.crossSection_cm2(energies_eV, atomicNumber, bote2009.SUBSHELL_L3, bote2009.PARTICLE_ELECTRON)
+        self.assertEquals((5, 10), crossSections_cm2.shape)
+        for energy_eV, crossSection_cm2 in zip(energies_eV.ravel(), crossSections_cm2.ravel()):
+            if energy_eV > 16.0 * self.model.data[atomicNumber][bote2009.SUBSHELL_L3][bote2009.KEY_Eca_eV]:
+                expectedValue = self.model.crossSection_cm2(energy_eV, atomicNumber, bote2009.SUBSHELL_L3, bote2009.PARTICLE_ELECTRON)
+                self.assertAlmostEquals(1.0, crossSection_cm2/expectedValue)
+
+        #self.fail("Test if the testcase is working.")
+
 if __name__ == '__main__':  #pragma: no cover
     logging.getLogger().setLevel(logging.DEBUG)
     from pyHendrixDemersTools.Testings import runTestModuleWithCoverage
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+"""
+.. py:currentmodule:: test_bote2009_tabulated
+.. moduleauthor:: Hendrix Demers <hendrix.demers@mail.mcgill.ca>
+
+Tests for the module `bote2009_tabulated`.
+"""
+
+# Script information for the file.
+__author__ = "Hendrix Demers (hendrix.demers@mail.mcgill.ca)"
+__version__ = ""
+__date__ = ""
+__copyright__ = "Copyright (c) 2012 Hendrix Demers"
+__license__ = ""
+
+# Standard library modules.
+import unittest
+import logging
+import os.path
+import shutil
+import tempfile
+
+# Third party modules.
+import numpy as np
+
+# Local modules.
+
+# Project modules
+import pyIonisationCrossSection.bote2009 as bote2009
+import pyIonisationCrossSection.atomic_shell as atomic_shell
+from pyIonisationCrossSection.bote2009_tabulated import TabulatedBote2009
+from pyIonisationCrossSection.model import IonisationCrossSectionModel
+
+# Globals and constants variables.
+
+class TestTabulatedBote2009(unittest.TestCase):
+    """
+    TestCase class for the module `bote2009_tabulated`.
+    """
+
+    def setUp(self):
+        """
+        Setup method.
+        """
+
+        unittest.TestCase.setUp(self)
+
+        self.model = bote2009.getModel()
+        self.tabulatedModel = TabulatedBote2009(self.model)
+
+    def tearDown(self):
+        """
+        Teardown method.
+        """
+
+        unittest.TestCase.tearDown(self)
+
+    def testSkeleton(self):
+        """
+        First test to check if the testcase is working with the testing framework.
+        """
+
+        #self.fail("Test if the testcase is working.")
+        self.assertTrue(True)
+
+    def test_crossSection_cm2(self):
+        """
+        Tests for method `crossSection_cm2`.
+        """
+
+        energies_eV = np.logspace(1.0, 9.5, 500)
+
+        for particle in [bote2009.PARTICLE_ELECTRON, bote2009.PARTICLE_POSITRON]:
+            for subshell in self.model.data[79]:
+                expectedValues = self.model.crossSection_cm2(energies_eV, 79, subshell, particle)
+                crossSections_cm2 = self.tabulatedModel.crossSection_cm2(energies_eV, 79, subshell, particle)
+                isLarge = expectedValues > 1.0e-3 * np.max(expectedValues)
+                np.testing.assert_array_equal(0.0, crossSections_cm2[expectedValues == 0.0])
+                np.testing.assert_allclose(expectedValues[isLarge], crossSections_cm2[isLarge], rtol=2.0e-2)
+
+                for energy_eV, crossSection_cm2 in zip(energies_eV[::10], crossSections_cm2[::10]):
+                    self.assertAlmostEquals(1.0e23*crossSection_cm2, 1.0e23*self.tabulatedModel.crossSection_cm2(energy_eV, 79, subshell, particle))
+
+        ionizationEnergy_eV = self.model.data[79][bote2009.SUBSHELL_K][bote2009.KEY_Eca_eV]
+        for overvoltage in [1.0, 16.0, 256.0]:
+            energy_eV = overvoltage*ionizationEnergy_eV
+            expectedValue = self.model.crossSection_cm2(energy_eV, 79, bote2009.SUBSHELL_K, bote2009.PARTICLE_ELECTRON)
+            crossSection_cm2 = self.tabulatedModel.crossSection_cm2(energy_eV, 79, bote2009.SUBSHELL_K, bote2009.PARTICLE_ELECTRON)
+            self.assertAlmostEquals(1.0e23*expectedValue, 1.0e23*crossSection_cm2)
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_ics_nm2(self):
+        """
+        Tests for method `ics_nm2`.
+        """
+
+        for energy_eV in [3.0e3, 1.0e5, 1.0e7]:
+            expectedValue = self.model.ics_nm2(79, None, energy_eV, atomic_shell.SHELL_MV)
+            value = self.tabulatedModel.ics_nm2(79, None, energy_eV, atomic_shell.SHELL_MV)
+            self.assertAlmostEquals(1.0, value/expectedValue, places=2)
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_ics_nm2_array(self):
+        """
+        Tests for methods `ics_nm2_array` and `isSupported`.
+        """
+
+        self.assertTrue(isinstance(self.tabulatedModel, IonisationCrossSectionModel))
+        self.assertTrue(self.tabulatedModel.isSupported(79, atomic_shell.SHELL_MV))
+        self.assertFalse(self.tabulatedModel.isSupported(1, atomic_shell.SHELL_MV))
+
+        atomicNumbers = np.array([0, 6, 29, 79])[:, np.newaxis, np.newaxis]
+        shells = np.array([atomic_shell.SHELL_K, atomic_shell.SHELL_LIII, atomic_shell.SHELL_MV])[:, np.newaxis]
+        energies_eV = np.logspace(2.0, 9.5, 200)
+
+        crossSections_nm2 = self.tabulatedModel.ics_nm2_array(atomicNumbers, None, energies_eV, shells)
+        expectedValues = self.model.ics_nm2_array(atomicNumbers, None, energies_eV, shells)
+        self.assertEquals((4, 3, 200), crossSections_nm2.shape)
+        np.testing.assert_array_equal(0.0, crossSections_nm2[expectedValues == 0.0])
+        isLarge = expectedValues > 1.0e-3*np.max(expectedValues, axis=-1, keepdims=True)
+        np.testing.assert_allclose(expectedValues[isLarge], crossSections_nm2[isLarge], rtol=2.0e-2)
+
+        for indexShell, shell in enumerate(shells[:, 0]):
+            for energy_eV, crossSection_nm2 in zip(energies_eV[::20], crossSections_nm2[3, indexShell, ::20]):
+                self.assertAlmostEquals(1.0e10*crossSection_nm2, 1.0e10*self.tabulatedModel.ics_nm2(79, None, energy_eV, shell))
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_interpolationError(self):
+        """
+        Tests for method `interpolationError`.
+        """
+
+        self.tabulatedModel.build(atomicNumbers=[6, 29, 79])
+        numberSubshells = sum(len(self.model.data[atomicNumber]) for atomicNumber in [6, 29, 79])
+        self.assertEquals(2*numberSubshells, len(self.tabulatedModel._tables))
+
+        error = self.tabulatedModel.interpolationError(79, bote2009.SUBSHELL_K, bote2009.PARTICLE_ELECTRON)
+        self.assertTrue(0.0 < error < 5.0e-3)
+
+        maximumError = self.tabulatedModel.maximumInterpolationError()
+        self.assertTrue(error <= maximumError < 5.0e-2)
+
+        tabulatedModel = TabulatedBote2009(self.model, numberPointsPerDecade=128)
+        self.assertTrue(tabulatedModel.interpolationError(79, bote2009.SUBSHELL_K, bote2009.PARTICLE_ELECTRON) < error)
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_save_load(self):
+        """
+        Tests for methods `save` and `load`.
+        """
+
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        filepath = os.path.join(path, "bote2009_tables.npz")
+
+        self.tabulatedModel.build(atomicNumbers=[29])
+        self.tabulatedModel.save(filepath)
+
+        tabulatedModel = TabulatedBote2009(self.model)
+        tabulatedModel.load(filepath)
+        self.assertEquals(sorted(self.tabulatedModel._tables), sorted(tabulatedModel._tables))
+
+        energies_eV = np.logspace(1.0, 9.0, 100)
+        np.testing.assert_array_equal(self.tabulatedModel.crossSection_cm2(energies_eV, 29, bote2009.SUBSHELL_L3, bote2009.PARTICLE_POSITRON),
+                                      tabulatedModel.crossSection_cm2(energies_eV, 29, bote2009.SUBSHELL_L3, bote2009.PARTICLE_POSITRON))
+
+        tabulatedModel = TabulatedBote2009(self.model, numberPointsPerDecade=16)
+        self.assertRaises(ValueError, tabulatedModel.load, filepath)
+
+        #self.fail("Test if the testcase is working.")
+
+if __name__ == '__main__':  #pragma: no cover
+    logging.getLogger().setLevel(logging.DEBUG)
+    from pyHendrixDemersTools.Testings import runTestModuleWithCoverage
+    runTestModuleWithCoverage(__file__)
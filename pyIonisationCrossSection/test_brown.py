@@ -18,11 +18,13 @@ import unittest
 import logging
 
 # Third party modules.
+import numpy as np
 
 # Local modules.
 
 # Project modules
-import pyIonisationCrossSection.brown
+import pyIonisationCrossSection.brown as brown
+import pyIonisationCrossSection.atomic_shell as atomic_shell
 
 
 # Globals and constants variables.
@@ -39,6 +41,57 @@ class Testbrown(unittest.TestCase):
         #self.fail("Test if the testcase is working.")
         self.assert_(True)
 
+    def test_computeC(self):
+        """
+        Tests for method `_computeC`.
+        """
+
+        model = brown.Brown1974()
+
+        self.assertAlmostEquals(0.85 + 0.0047*29, model._computeC(29, atomic_shell.SHELL_K))
+        self.assertAlmostEquals(0.61 + 0.0058*29, model._computeC(29, atomic_shell.SHELL_LI))
+        self.assertAlmostEquals(0.61 + 0.0058*29, model._computeC(29, atomic_shell.SHELL_LII))
+        self.assertAlmostEquals(2.19 + 0.0098*29, model._computeC(29, atomic_shell.SHELL_LIII))
+        self.assertAlmostEquals(0.61 + 0.0058*29, model._computeCLI(29))
+        self.assertRaises(KeyError, model._computeC, 29, atomic_shell.SHELL_MV)
+
+        shells = [atomic_shell.SHELL_K, atomic_shell.SHELL_LI, atomic_shell.SHELL_LII, atomic_shell.SHELL_LIII]
+        atomicNumbers = np.array([6, 29, 79])
+        values = model._computeC(atomicNumbers[:, np.newaxis], shells)
+        self.assertEquals((3, 4), values.shape)
+        for indexZ, atomicNumber in enumerate(atomicNumbers):
+            for indexShell, shell in enumerate(shells):
+                self.assertAlmostEquals(model._computeC(int(atomicNumber), shell), values[indexZ, indexShell])
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_ics_nm2(self):
+        """
+        Tests for method `ics_nm2`.
+        """
+
+        model = brown.Brown1974()
+
+        self.assertEquals(0.0, model.ics_nm2(7, 399.0, 200.0, atomic_shell.SHELL_K))
+        self.assertAlmostEquals(1.610207658812743e-5/1.0e-5, model.ics_nm2(7, 399.0, 1000.0, atomic_shell.SHELL_K)/1.0e-5)
+        self.assertTrue(model.ics_nm2(29, 1096.0, 3000.0, atomic_shell.SHELL_LI) > 0.0)
+        self.assertTrue(model.ics_nm2(29, 951.0, 3000.0, atomic_shell.SHELL_LII) > 0.0)
+
+        shells = [atomic_shell.SHELL_K, atomic_shell.SHELL_LI, atomic_shell.SHELL_LII, atomic_shell.SHELL_LIII]
+        ionisationEnergies_eV = np.array([8979.0, 1096.0, 951.0, 931.0])
+        energies_eV = np.array([[500.0], [3000.0], [3.0e4]])
+        sigmas_nm2 = model.ics_nm2(29, ionisationEnergies_eV, energies_eV, shells)
+        self.assertEquals((3, 4), sigmas_nm2.shape)
+        for indexE, energy_eV in enumerate(energies_eV[:, 0]):
+            for indexShell, shell in enumerate(shells):
+                sigma_nm2 = model.ics_nm2(29, ionisationEnergies_eV[indexShell], energy_eV, shell)
+                self.assertAlmostEquals(sigma_nm2*1.0e6, sigmas_nm2[indexE, indexShell]*1.0e6)
+
+        np.testing.assert_array_equal(0.0, sigmas_nm2[0])
+        self.assertEquals(0.0, sigmas_nm2[1, 0])
+
+        #self.fail("Test if the testcase is working.")
+
 if __name__ == '__main__':  #pragma: no cover
     logging.getLogger().setLevel(logging.DEBUG)
     from pyHendrixDemersTools.Testings import runTestModuleWithCoverage
@@ -23,11 +23,13 @@ import unittest
 import logging
 
 # Third party modules.
+import numpy as np
 
 # Local modules.
 
 # Project modules
-import pyIonisationCrossSection.casnati
+import pyIonisationCrossSection.casnati as casnati
+import pyIonisationCrossSection.atomic_shell as atomic_shell
 
 # Globals and constants variables.
 
@@ -58,6 +60,54 @@ class Testcasnati(unittest.TestCase):
         #self.fail("Test if the testcase is working.")
         self.assert_(True)
 
+    def test_ics_nm2(self):
+        """
+        Tests for method `ics_nm2`.
+        """
+
+        model = casnati.Casnati()
+
+        self.assertEquals(0.0, model.ics_nm2(7, 0.399e3, 0.2e3, atomic_shell.SHELL_K))
+        self.assertEquals(0.0, model.ics_nm2(7, 0.399e3, 0.399e3, atomic_shell.SHELL_K))
+        self.assertAlmostEquals(1.8134244431315435e-5, model.ics_nm2(7, 0.399e3, 4.0*0.399e3, atomic_shell.SHELL_K))
+        self.assertAlmostEquals(1.0036848222051065e-9/1.0e-9, model.ics_nm2(79, 80713.0, 4.0*80713.0, atomic_shell.SHELL_K)/1.0e-9)
+        self.assertAlmostEquals(2.9149753131492258e-6/1.0e-6, model.ics_nm2(79, 2206.0, 4.0*2206.0, atomic_shell.SHELL_MV)/1.0e-6)
+
+        overvoltages = np.array([0.5, 1.0, 1.5, 4.0, 25.0, 1000.0])
+        atomicNumbers = np.array([7, 28, 79])
+        ionisationEnergies_eV = np.array([0.399e3, 8.33100e3, 80713.0])
+        energies_eV = ionisationEnergies_eV[:, np.newaxis]*overvoltages
+        sigmas_nm2 = model.ics_nm2(atomicNumbers[:, np.newaxis], ionisationEnergies_eV[:, np.newaxis], energies_eV, atomic_shell.SHELL_K)
+        self.assertEquals((3, 6), sigmas_nm2.shape)
+        np.testing.assert_array_equal(0.0, sigmas_nm2[:, :2])
+        self.assertTrue(np.all(sigmas_nm2[:, 2:] > 0.0))
+
+        for indexZ, atomicNumber in enumerate(atomicNumbers):
+            for indexU, energy_eV in enumerate(energies_eV[indexZ]):
+                sigma_nm2 = model.ics_nm2(atomicNumber, ionisationEnergies_eV[indexZ], energy_eV, atomic_shell.SHELL_K)
+                self.assertAlmostEquals(1.0, (sigma_nm2 + 1.0e-30)/(sigmas_nm2[indexZ, indexU] + 1.0e-30))
+
+        sigmas_nm2 = model.ics_nm2(7, 0.399e3, [1.0e3], atomic_shell.SHELL_K)
+        self.assertEquals((1,), sigmas_nm2.shape)
+
+        sigmas_nm2 = model.ics_nm2_array(atomicNumbers, 1.0e3, 5.0e3, atomic_shell.SHELL_K)
+        self.assertEquals((3,), sigmas_nm2.shape)
+        self.assertTrue(np.all(sigmas_nm2 == model.ics_nm2(7, 1.0e3, 5.0e3, atomic_shell.SHELL_K)))
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_dataFigure5(self):
+        """
+        Tests for method `dataFigure5`.
+        """
+
+        uList, sigmaList_nm2 = casnati.dataFigure5()
+        self.assertEquals(len(uList), len(sigmaList_nm2))
+        self.assertEquals(0.0, sigmaList_nm2[0])
+        self.assertAlmostEquals(1.8134244431315435e-5, sigmaList_nm2[30])
+
+        #self.fail("Test if the testcase is working.")
+
 if __name__ == '__main__':  #pragma: no cover
     logging.getLogger().setLevel(logging.DEBUG)
     from pyHendrixDemersTools.Testings import runTestModuleWithCoverage
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+"""
+.. py:currentmodule:: test_comparison
+.. moduleauthor:: Hendrix Demers <hendrix.demers@mail.mcgill.ca>
+
+Tests for the module `comparison`.
+"""
+
+# Script information for the file.
+__author__ = "Hendrix Demers (hendrix.demers@mail.mcgill.ca)"
+__version__ = ""
+__date__ = ""
+__copyright__ = "Copyright (c) 2012 Hendrix Demers"
+__license__ = ""
+
+# Standard library modules.
+import unittest
+import logging
+import os.path
+import shutil
+import tempfile
+
+# Third party modules.
+import numpy as np
+
+# Local modules.
+
+# Project modules
+import pyIonisationCrossSection.comparison as comparison
+import pyIonisationCrossSection.atomic_shell as atomic_shell
+from pyIonisationCrossSection.model import getModel, getModelNames
+
+# Globals and constants variables.
+
+class Testcomparison(unittest.TestCase):
+    """
+    TestCase class for the module `comparison`.
+    """
+
+    def setUp(self):
+        """
+        Setup method.
+        """
+
+        unittest.TestCase.setUp(self)
+
+    def tearDown(self):
+        """
+        Teardown method.
+        """
+
+        unittest.TestCase.tearDown(self)
+
+    def testSkeleton(self):
+        """
+        First test to check if the testcase is working with the testing framework.
+        """
+
+        #self.fail("Test if the testcase is working.")
+        self.assertTrue(True)
+
+    def test_compare(self):
+        """
+        Tests for method `compare`.
+        """
+
+        atomicNumbers = [7, 28, 79]
+        ionisationEnergies_eV = [0.399e3, 8.33100e3, 80713.0]
+        result = comparison.compare(atomicNumbers=atomicNumbers, ionisationEnergies_eV=ionisationEnergies_eV, numberProcesses=1)
+
+        self.assertEquals(getModelNames(), result.modelNames)
+        self.assertEquals(atomicNumbers, result.atomicNumbers.tolist())
+        self.assertEquals((len(getModelNames()), 3, len(comparison.DEFAULT_OVERVOLTAGES)), result.crossSections_nm2.shape)
+
+        for modelName in result.modelNames:
+            for atomicNumber, ionisationEnergy_eV in zip(atomicNumbers, ionisationEnergies_eV):
+                uList, sigmaList_nm2 = comparison.dataFigure(atomicNumber, ionisationEnergy_eV, getModel(modelName))
+                np.testing.assert_allclose(sigmaList_nm2, result.getCrossSections_nm2(modelName, atomicNumber))
+
+        resultParallel = comparison.compare(atomicNumbers=atomicNumbers, ionisationEnergies_eV=ionisationEnergies_eV, numberProcesses=2)
+        np.testing.assert_array_equal(result.crossSections_nm2, resultParallel.crossSections_nm2)
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_compare_unsupported(self):
+        """
+        Tests for method `compare` with shells not supported by all the models.
+        """
+
+        result = comparison.compare(atomicNumbers=[1, 29, 79], shell=atomic_shell.SHELL_LIII, numberProcesses=1)
+
+        self.assertTrue(np.isnan(result.ionisationEnergies_eV[0]))
+        self.assertTrue(np.all(np.isnan(result.crossSections_nm2[:, 0])))
+        self.assertTrue(np.all(np.isnan(result.getCrossSections_nm2("jakoby1987", 79))))
+        self.assertTrue(np.all(np.isfinite(result.getCrossSections_nm2("brown1974", 79))))
+        self.assertTrue(np.all(np.isfinite(result.getCrossSections_nm2("bote2009", 29))))
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_save_load(self):
+        """
+        Tests for methods `ComparisonResult.save` and `ComparisonResult.load`.
+        """
+
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        filepath = os.path.join(path, "comparison.npz")
+
+        result = comparison.compare(atomicNumbers=[6, 29], numberProcesses=1)
+        result.save(filepath)
+
+        resultLoaded = comparison.ComparisonResult.load(filepath)
+        self.assertEquals(result.modelNames, resultLoaded.modelNames)
+        self.assertEquals(result.shell, resultLoaded.shell)
+        np.testing.assert_array_equal(result.atomicNumbers, resultLoaded.atomicNumbers)
+        np.testing.assert_array_equal(result.energies_eV, resultLoaded.energies_eV)
+        np.testing.assert_array_equal(result.crossSections_nm2, resultLoaded.crossSections_nm2)
+
+        #self.fail("Test if the testcase is working.")
+
+if __name__ == '__main__':  #pragma: no cover
+    logging.getLogger().setLevel(logging.DEBUG)
+    from pyHendrixDemersTools.Testings import runTestModuleWithCoverage
+    runTestModuleWithCoverage(__file__)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+"""
+.. py:currentmodule:: test_edge_energy
+.. moduleauthor:: Hendrix Demers <hendrix.demers@mail.mcgill.ca>
+
+Tests for the module `edge_energy`.
+"""
+
+# Script information for the file.
+__author__ = "Hendrix Demers (hendrix.demers@mail.mcgill.ca)"
+__version__ = ""
+__date__ = ""
+__copyright__ = "Copyright (c) 2012 Hendrix Demers"
+__license__ = ""
+
+# Standard library modules.
+import unittest
+import logging
+
+# Third party modules.
+import numpy as np
+
+# Local modules.
+
+# Project modules
+import pyIonisationCrossSection.edge_energy as edge_energy
+import pyIonisationCrossSection.atomic_shell as atomic_shell
+import pyIonisationCrossSection.bote2009 as bote2009
+from pyIonisationCrossSection.model import getModel, getModelNames
+
+# Globals and constants variables.
+
+class Testedge_energy(unittest.TestCase):
+    """
+    TestCase class for the module `edge_energy`.
+    """
+
+    def setUp(self):
+        """
+        Setup method.
+        """
+
+        unittest.TestCase.setUp(self)
+
+        self.model = bote2009.getSharedModel()
+
+    def tearDown(self):
+        """
+        Teardown method.
+        """
+
+        unittest.TestCase.tearDown(self)
+
+    def testSkeleton(self):
+        """
+        First test to check if the testcase is working with the testing framework.
+        """
+
+        #self.fail("Test if the testcase is working.")
+        self.assertTrue(True)
+
+    def test_getEdgeEnergyTable(self):
+        """
+        Tests for method `getEdgeEnergyTable`.
+        """
+
+        edgeEnergies_eV = edge_energy.getEdgeEnergyTable()
+        self.assertEquals((bote2009.MAXIMUM_ATOMIC_NUMBER + 1, 9), edgeEnergies_eV.shape)
+        self.assertTrue(edgeEnergies_eV is edge_energy.getEdgeEnergyTable())
+        self.assertFalse(edgeEnergies_eV.flags.writeable)
+        self.assertTrue(np.all(np.isnan(edgeEnergies_eV[0])))
+
+        for atomicNumber, subshells in self.model.data.items():
+            for subshell, values in subshells.items():
+                shell = bote2009.SHELLS[bote2009.SUBSHELL_INDEXES[subshell]]
+                self.assertEquals(values[bote2009.KEY_Eca_eV], edge_energy.getEdgeEnergy_eV(atomicNumber, shell))
+        self.assertEquals(np.count_nonzero(self.model.isValid), np.count_nonzero(np.isfinite(edgeEnergies_eV)))
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_getEdgeEnergies_eV(self):
+        """
+        Tests for methods `getEdgeEnergy_eV` and `getEdgeEnergies_eV`.
+        """
+
+        self.assertTrue(np.isnan(edge_energy.getEdgeEnergy_eV(1, atomic_shell.SHELL_MV)))
+        self.assertRaises(KeyError, edge_energy.getEdgeEnergy_eV, 29, "N1")
+        self.assertRaises(IndexError, edge_energy.getEdgeEnergy_eV, 0, atomic_shell.SHELL_K)
+        self.assertRaises(IndexError, edge_energy.getEdgeEnergy_eV, 120, atomic_shell.SHELL_K)
+
+        atomicNumbers = np.array([0, 6, 29, 79, 120])
+        shells = [atomic_shell.SHELL_K, atomic_shell.SHELL_LIII]
+        edgeEnergies_eV = edge_energy.getEdgeEnergies_eV(atomicNumbers[:, np.newaxis], shells)
+        self.assertEquals((5, 2), edgeEnergies_eV.shape)
+        self.assertTrue(np.all(np.isnan(edgeEnergies_eV[[0, -1]])))
+        for indexZ in range(1, 4):
+            for indexShell, shell in enumerate(shells):
+                expectedValue = edge_energy.getEdgeEnergy_eV(atomicNumbers[indexZ], shell)
+                self.assertTrue(np.array_equal(expectedValue, edgeEnergies_eV[indexZ, indexShell], equal_nan=True))
+        self.assertTrue(edgeEnergies_eV[3, 0] > edgeEnergies_eV[3, 1] > edgeEnergies_eV[2, 0] > edgeEnergies_eV[2, 1])
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_ics_nm2_edge(self):
+        """
+        Tests for methods `ics_nm2_edge` and `ics_nm2_edge_array` of the models.
+        """
+
+        shell = atomic_shell.SHELL_K
+        atomicNumbers = np.arange(4, 93)
+        edgeEnergies_eV = edge_energy.getEdgeEnergies_eV(atomicNumbers, shell)[:, np.newaxis]
+        energies_eV = edgeEnergies_eV*np.array([0.5, 1.5, 4.0, 20.0])
+
+        for modelName in getModelNames():
+            modelICS = getModel(modelName)
+            crossSections_nm2 = modelICS.ics_nm2_edge_array(atomicNumbers[:, np.newaxis], energies_eV, shell)
+            expectedValues = modelICS.ics_nm2_array(atomicNumbers[:, np.newaxis], edgeEnergies_eV, energies_eV, shell)
+            self.assertTrue(np.all(crossSections_nm2[:, 0] == 0.0))
+            self.assertTrue(np.allclose(expectedValues[:, 1:], crossSections_nm2[:, 1:]))
+
+            self.assertAlmostEquals(modelICS.ics_nm2(29, edgeEnergies_eV[25, 0], energies_eV[25, 2], shell),
+                                    modelICS.ics_nm2_edge(29, energies_eV[25, 2], shell))
+
+        modelICS = getModel("jakoby1987")
+        self.assertFalse(modelICS.isSupported(29, atomic_shell.SHELL_LIII))
+        self.assertEquals(0.0, modelICS.ics_nm2_edge(29, 3.0e4, atomic_shell.SHELL_LIII))
+        crossSections_nm2 = modelICS.ics_nm2_edge_array(29, 3.0e4, np.array([atomic_shell.SHELL_K, atomic_shell.SHELL_LIII]))
+        self.assertTrue(crossSections_nm2[0] > 0.0)
+        self.assertEquals(0.0, crossSections_nm2[1])
+
+        # Jakoby (1987) has no threshold, the cross section is negative below the edge without the check.
+        self.assertTrue(modelICS.ics_nm2(79, edge_energy.getEdgeEnergy_eV(79, shell), 4.0e4, shell) < 0.0)
+        self.assertEquals(0.0, modelICS.ics_nm2_edge(79, 4.0e4, shell))
+        crossSections_nm2 = modelICS.ics_nm2_edge_array(79, np.array([1.0e3, 4.0e4, 1.0e5]), shell)
+        self.assertEquals([0.0, 0.0], crossSections_nm2[:2].tolist())
+        self.assertTrue(crossSections_nm2[2] > 0.0)
+
+        modelICS = getModel("casnati1982")
+        self.assertEquals(0.0, modelICS.ics_nm2_edge(29, 3.0e4, atomic_shell.SHELL_LII))
+        self.assertEquals((2,), modelICS.ics_nm2_edge_array(29, 3.0e4, [atomic_shell.SHELL_K, atomic_shell.SHELL_LII]).shape)
+        self.assertEquals(0.0, modelICS.ics_nm2_edge(1, 1.0e4, atomic_shell.SHELL_MV))
+        crossSections_nm2 = modelICS.ics_nm2_edge_array(np.array([1, 79]), 1.0e4, atomic_shell.SHELL_MV)
+        self.assertEquals(0.0, crossSections_nm2[0])
+        self.assertTrue(crossSections_nm2[1] > 0.0)
+
+        #self.fail("Test if the testcase is working.")
+
+if __name__ == '__main__':  #pragma: no cover
+    logging.getLogger().setLevel(logging.DEBUG)
+    from pyHendrixDemersTools.Testings import runTestModuleWithCoverage
+    runTestModuleWithCoverage(__file__)
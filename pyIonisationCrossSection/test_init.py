@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+.. py:currentmodule:: test_init
+.. moduleauthor:: Hendrix Demers <hendrix.demers@mail.mcgill.ca>
+
+Tests for the package `pyIonisationCrossSection`.
+"""
+
+# Script information for the file.
+__author__ = "Hendrix Demers (hendrix.demers@mail.mcgill.ca)"
+__version__ = ""
+__date__ = ""
+__copyright__ = "Copyright (c) 2012 Hendrix Demers"
+__license__ = ""
+
+# Standard library modules.
+import unittest
+import logging
+import subprocess
+import sys
+
+# Third party modules.
+
+# Local modules.
+
+# Project modules
+import pyIonisationCrossSection
+from pyIonisationCrossSection.casnati import Casnati
+from pyIonisationCrossSection.model import getModel
+
+# Globals and constants variables.
+
+class Testinit(unittest.TestCase):
+    """
+    TestCase class for the package `pyIonisationCrossSection`.
+    """
+
+    def setUp(self):
+        """
+        Setup method.
+        """
+
+        unittest.TestCase.setUp(self)
+
+    def tearDown(self):
+        """
+        Teardown method.
+        """
+
+        unittest.TestCase.tearDown(self)
+
+    def testSkeleton(self):
+        """
+        First test to check if the testcase is working with the testing framework.
+        """
+
+        #self.fail("Test if the testcase is working.")
+        self.assertTrue(True)
+
+    def test_lazyImport(self):
+        """
+        Tests that importing the package does not import numpy, the models or matplotlib.
+        """
+
+        code = "import sys, pyIonisationCrossSection, pyIonisationCrossSection.units as units; " \
+               "units.nm2_to_m2(1.0); " \
+               "print(sorted(name for name in sys.modules if name.split('.')[0] in ('numpy', 'matplotlib') or " \
+               "name.startswith('pyIonisationCrossSection.')))"
+        output = subprocess.check_output([sys.executable, "-c", code])
+        self.assertEquals("['pyIonisationCrossSection.units']", output.decode().strip())
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_getattr(self):
+        """
+        Tests for the lazy attributes of the package.
+        """
+
+        self.assertTrue(pyIonisationCrossSection.Casnati is Casnati)
+        self.assertTrue(pyIonisationCrossSection.getModel is getModel)
+        self.assertTrue(pyIonisationCrossSection.casnati is sys.modules["pyIonisationCrossSection.casnati"])
+        self.assertTrue("Bote2009" in dir(pyIonisationCrossSection))
+        self.assertRaises(AttributeError, getattr, pyIonisationCrossSection, "Unknown")
+
+        for name in pyIonisationCrossSection.__all__:
+            self.assertTrue(getattr(pyIonisationCrossSection, name) is not None)
+
+        #self.fail("Test if the testcase is working.")
+
+if __name__ == '__main__':  #pragma: no cover
+    logging.getLogger().setLevel(logging.DEBUG)
+    from pyHendrixDemersTools.Testings import runTestModuleWithCoverage
+    runTestModuleWithCoverage(__file__)
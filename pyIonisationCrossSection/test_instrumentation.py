@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+"""
+.. py:currentmodule:: test_instrumentation
+.. moduleauthor:: Hendrix Demers <hendrix.demers@mail.mcgill.ca>
+
+Tests for the module `instrumentation`.
+"""
+
+# Script information for the file.
+__author__ = "Hendrix Demers (hendrix.demers@mail.mcgill.ca)"
+__version__ = ""
+__date__ = ""
+__copyright__ = "Copyright (c) 2012 Hendrix Demers"
+__license__ = ""
+
+# Standard library modules.
+import unittest
+import logging
+import json
+
+# Third party modules.
+import numpy as np
+
+# Local modules.
+
+# Project modules
+import pyIonisationCrossSection.instrumentation as instrumentation
+import pyIonisationCrossSection.bote2009 as bote2009
+import pyIonisationCrossSection.atomic_shell as atomic_shell
+from pyIonisationCrossSection.casnati import Casnati
+
+# Globals and constants variables.
+
+class Testinstrumentation(unittest.TestCase):
+    """
+    TestCase class for the module `instrumentation`.
+    """
+
+    def setUp(self):
+        """
+        Setup method.
+        """
+
+        unittest.TestCase.setUp(self)
+
+        self.model = bote2009.getSharedModel()
+        instrumentation.reset()
+
+    def tearDown(self):
+        """
+        Teardown method.
+        """
+
+        unittest.TestCase.tearDown(self)
+
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def testSkeleton(self):
+        """
+        First test to check if the testcase is working with the testing framework.
+        """
+
+        #self.fail("Test if the testcase is working.")
+        self.assertTrue(True)
+
+    def test_enable_disable(self):
+        """
+        Tests for methods `enable` and `disable`.
+        """
+
+        originalMethod = bote2009.Bote2009.__dict__["crossSection_cm2"]
+
+        self.assertFalse(instrumentation.isEnabled())
+        instrumentation.enable()
+        instrumentation.enable()
+        self.assertTrue(instrumentation.isEnabled())
+        self.assertTrue(bote2009.Bote2009.__dict__["crossSection_cm2"] is not originalMethod)
+
+        instrumentation.disable()
+        self.assertFalse(instrumentation.isEnabled())
+        self.assertTrue(bote2009.Bote2009.__dict__["crossSection_cm2"] is originalMethod)
+
+        self.model.crossSection_cm2(1.0e4, 29, bote2009.SUBSHELL_K, bote2009.PARTICLE_ELECTRON)
+        self.assertEquals({}, instrumentation.getSnapshot())
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_getSnapshot(self):
+        """
+        Tests for method `getSnapshot`.
+        """
+
+        expectedValue = self.model.crossSection_cm2(1.0e6, 29, bote2009.SUBSHELL_K, bote2009.PARTICLE_ELECTRON)
+        energies_eV = np.logspace(3.0, 8.0, 500)
+
+        with instrumentation.instrumented():
+            self.assertEquals(expectedValue, self.model.crossSection_cm2(1.0e6, 29, bote2009.SUBSHELL_K, bote2009.PARTICLE_ELECTRON))
+            self.model.crossSection_cm2(1.0e4, 29, bote2009.SUBSHELL_K, bote2009.PARTICLE_ELECTRON)
+            self.model.crossSection_cm2(energies_eV, 29, bote2009.SUBSHELL_K, bote2009.PARTICLE_ELECTRON)
+            Casnati().ics_nm2(29, 8979.0, 1.0e4, atomic_shell.SHELL_K)
+        self.assertFalse(instrumentation.isEnabled())
+
+        snapshot = instrumentation.getSnapshot()
+        record = snapshot["Bote2009.crossSection_cm2"]
+        self.assertEquals(3, record[instrumentation.KEY_CALLS])
+        self.assertEquals(502, record[instrumentation.KEY_VALUES])
+        self.assertEquals({1: 2, 100: 1}, record[instrumentation.KEY_HISTOGRAM])
+        self.assertTrue(record[instrumentation.KEY_TIME_s] > 0.0)
+
+        self.assertEquals(2, snapshot["Bote2009.PWBA"][instrumentation.KEY_CALLS])
+        self.assertEquals(2, snapshot["Bote2009.DWBA"][instrumentation.KEY_CALLS])
+        numberValues = snapshot["Bote2009.PWBA"][instrumentation.KEY_VALUES] + snapshot["Bote2009.DWBA"][instrumentation.KEY_VALUES]
+        ionizationEnergy_eV = self.model.data[29][bote2009.SUBSHELL_K][bote2009.KEY_Eca_eV]
+        self.assertEquals(2 + np.count_nonzero(energies_eV >= ionizationEnergy_eV), numberValues)
+        self.assertEquals(1, snapshot["Casnati.ics_nm2"][instrumentation.KEY_CALLS])
+
+        snapshotJson = json.loads(instrumentation.getSnapshotJson())
+        self.assertEquals({"1": 2, "100": 1}, snapshotJson["Bote2009.crossSection_cm2"][instrumentation.KEY_HISTOGRAM])
+
+        instrumentation.reset()
+        self.assertEquals({}, instrumentation.getSnapshot())
+
+        #self.fail("Test if the testcase is working.")
+
+if __name__ == '__main__':  #pragma: no cover
+    logging.getLogger().setLevel(logging.DEBUG)
+    from pyHendrixDemersTools.Testings import runTestModuleWithCoverage
+    runTestModuleWithCoverage(__file__)
@@ -18,11 +18,12 @@ import unittest
 import logging
 
 # Third party modules.
+import numpy as np
 
 # Local modules.
 
 # Project modules
-import pyIonisationCrossSection.jakoby
+import pyIonisationCrossSection.jakoby as jakoby
 
 # Globals and constants variables.
 
@@ -38,6 +39,50 @@ class Testjakoby(unittest.TestCase):
         #self.fail("Test if the testcase is working.")
         self.assert_(True)
 
+    def test_ics_nm2(self):
+        """
+        Tests for method `ics_nm2`.
+        """
+
+        model = jakoby.Jakoby1987()
+
+        self.assertAlmostEquals(2.220611213032404e-9/1.0e-9, model.ics_nm2(47, 25517.0, 3.0e4, None)/1.0e-9)
+        self.assertAlmostEquals(1.2025842500763364e-5/1.0e-5, model.ics_nm2(6, 284.0, 1.0e4, None)/1.0e-5)
+        self.assertAlmostEquals(9.657864791717878e-10/1.0e-10, model.ics_nm2(79, 80713.0, 1.0e6, None)/1.0e-10)
+        self.assertAlmostEquals(model.ics_nm2(47, 25517.0, 3.0e4, None), model.ics_nm2(47.0, 25517.0, 3.0e4, None))
+
+        atomicNumbers = np.array([6, 47, 79])
+        ionisationEnergies_eV = np.array([284.0, 25517.0, 80713.0])
+        energies_eV = np.logspace(5.0, 9.0, 7)
+        sigmas_nm2 = model.ics_nm2(atomicNumbers[:, np.newaxis], ionisationEnergies_eV[:, np.newaxis], energies_eV, None)
+        self.assertEquals((3, 7), sigmas_nm2.shape)
+        np.testing.assert_allclose(sigmas_nm2, model.ics_nm2(atomicNumbers[:, np.newaxis].astype(float), ionisationEnergies_eV[:, np.newaxis], energies_eV, None))
+
+        for indexZ, atomicNumber in enumerate(atomicNumbers):
+            for indexE, energy_eV in enumerate(energies_eV):
+                sigma_nm2 = model.ics_nm2(int(atomicNumber), ionisationEnergies_eV[indexZ], energy_eV, None)
+                self.assertAlmostEquals(1.0, sigma_nm2/sigmas_nm2[indexZ, indexE])
+
+        atomicNumbers = np.array([-3, 0, 29, 120])
+        sigmas_nm2 = model.ics_nm2_array(atomicNumbers, 8979.0, 3.0e4, None)
+        for atomicNumber, sigma_nm2 in zip(atomicNumbers, sigmas_nm2):
+            np.testing.assert_allclose(model.ics_nm2(int(atomicNumber), 8979.0, 3.0e4, None), sigma_nm2)
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_dataFigure1Jakoby1987(self):
+        """
+        Tests for method `dataFigure1Jakoby1987`.
+        """
+
+        energies_eV, sigmaList_nm2 = jakoby.dataFigure1Jakoby1987()
+        self.assertEquals(len(energies_eV), len(sigmaList_nm2))
+        self.assertAlmostEquals(25517.0, energies_eV[0])
+        self.assertAlmostEquals(0.0, sigmaList_nm2[0])
+        self.assertTrue(np.all(sigmaList_nm2[1:] > 0.0))
+
+        #self.fail("Test if the testcase is working.")
+
 if __name__ == '__main__':  #pragma: no cover
     logging.getLogger().setLevel(logging.DEBUG)
     from pyHendrixDemersTools.Testings import runTestModuleWithCoverage
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+"""
+.. py:currentmodule:: test_material
+.. moduleauthor:: Hendrix Demers <hendrix.demers@mail.mcgill.ca>
+
+Tests for the module `material`.
+"""
+
+# Script information for the file.
+__author__ = "Hendrix Demers (hendrix.demers@mail.mcgill.ca)"
+__version__ = ""
+__date__ = ""
+__copyright__ = "Copyright (c) 2012 Hendrix Demers"
+__license__ = ""
+
+# Standard library modules.
+import unittest
+import logging
+
+# Third party modules.
+import numpy as np
+
+# Local modules.
+
+# Project modules
+import pyIonisationCrossSection.material as material
+import pyIonisationCrossSection.atomic_shell as atomic_shell
+from pyIonisationCrossSection.edge_energy import getEdgeEnergy_eV
+from pyIonisationCrossSection.model import getModel
+
+# Globals and constants variables.
+
+class Testmaterial(unittest.TestCase):
+    """
+    TestCase class for the module `material`.
+    """
+
+    def setUp(self):
+        """
+        Setup method.
+        """
+
+        unittest.TestCase.setUp(self)
+
+        self.energies_eV = np.geomspace(1.0e3, 1.0e5, 50)
+        self.shells = [atomic_shell.SHELL_K, atomic_shell.SHELL_LIII]
+
+    def tearDown(self):
+        """
+        Teardown method.
+        """
+
+        unittest.TestCase.tearDown(self)
+
+    def testSkeleton(self):
+        """
+        First test to check if the testcase is working with the testing framework.
+        """
+
+        #self.fail("Test if the testcase is working.")
+        self.assertTrue(True)
+
+    def test_Material(self):
+        """
+        Tests for class `Material`.
+        """
+
+        water = material.Material({1: 2.0, 8: 1.0}, 1.0, fractionType=material.FRACTION_ATOMIC)
+        self.assertEquals([1, 8], water.atomicNumbers.tolist())
+        self.assertAlmostEquals(2.0/3.0, water.atomicFractions[0])
+        self.assertAlmostEquals(0.1119, water.massFractions[0], places=4)
+        self.assertAlmostEquals(1.0, np.sum(water.massFractions))
+
+        waterMass = material.Material({1: water.massFractions[0], 8: water.massFractions[1]}, 1.0)
+        self.assertTrue(np.allclose(water.atomicFractions, waterMass.atomicFractions))
+        self.assertTrue(np.allclose([66.86, 33.43], water.numberDensities_nm3, atol=1.0e-2))
+
+        copper = material.Material({29: 1.0}, 8.96)
+        self.assertAlmostEquals(84.9, copper.numberDensities_nm3[0], places=1)
+
+        self.assertRaises(ValueError, material.Material, {29: -1.0}, 8.96)
+        self.assertRaises(ValueError, material.Material, {0: 1.0}, 1.0)
+        self.assertRaises(ValueError, material.Material, {101: 1.0}, 1.0)
+        self.assertRaises(ValueError, material.Material, {29: 1.0}, 8.96, fractionType="volume")
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_compute(self):
+        """
+        Tests for method `MaterialCrossSectionCalculator.compute` against the cross sections of each element.
+        """
+
+        model = getModel("bote2009")
+        calculator = material.MaterialCrossSectionCalculator(model, self.energies_eV, self.shells)
+        brass = material.Material({29: 0.7, 30: 0.3}, 8.5)
+        result = calculator.compute(brass)
+
+        self.assertEquals((2, 2, 50), result.macroscopicCrossSections_1_nm.shape)
+        self.assertEquals((50,), result.totalMeanFreePaths_nm.shape)
+
+        for indexZ, atomicNumber in enumerate(brass.atomicNumbers):
+            for indexShell, shell in enumerate(self.shells):
+                ionisationEnergy_eV = getEdgeEnergy_eV(atomicNumber, shell)
+                crossSections_nm2 = model.ics_nm2_array(atomicNumber, ionisationEnergy_eV, self.energies_eV, shell)
+                expectedValues = brass.numberDensities_nm3[indexZ]*crossSections_nm2
+                self.assertTrue(np.allclose(expectedValues, result.macroscopicCrossSections_1_nm[indexZ, indexShell]))
+
+        self.assertTrue(np.allclose(1.0/np.sum(result.macroscopicCrossSections_1_nm, axis=(0, 1)), result.totalMeanFreePaths_nm))
+        self.assertTrue(np.isinf(result.meanFreePaths_nm[0, 0, 0]))
+        self.assertTrue(np.all(result.totalMeanFreePaths_nm > 0.0))
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_compute_belowEdge(self):
+        """
+        Tests for method `MaterialCrossSectionCalculator.compute` below the edge energy with a model without threshold.
+        """
+
+        model = getModel("jakoby1987")
+        energies_eV = np.array([1.0e3, 4.0e4, 1.0e5])
+        calculator = material.MaterialCrossSectionCalculator(model, energies_eV, [atomic_shell.SHELL_K])
+        gold = material.Material({79: 1.0}, 19.3)
+        result = calculator.compute(gold)
+
+        self.assertTrue(getEdgeEnergy_eV(79, atomic_shell.SHELL_K) > 4.0e4)
+        self.assertEquals([0.0, 0.0], result.macroscopicCrossSections_1_nm[0, 0, :2].tolist())
+        self.assertTrue(np.all(np.isinf(result.meanFreePaths_nm[0, 0, :2])))
+        self.assertTrue(result.macroscopicCrossSections_1_nm[0, 0, 2] > 0.0)
+        self.assertTrue(result.totalMeanFreePaths_nm[2] > 0.0)
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_cache(self):
+        """
+        Tests for the cache of the element cross sections of `MaterialCrossSectionCalculator`.
+        """
+
+        model = getModel("casnati1982")
+        calculator = material.MaterialCrossSectionCalculator(model, self.energies_eV)
+        calls = []
+        computeCrossSections_nm2 = calculator._computeCrossSections_nm2
+
+        def countCalls(atomicNumbers):
+            calls.append(atomicNumbers.tolist())
+            return computeCrossSections_nm2(atomicNumbers)
+
+        calculator._computeCrossSections_nm2 = countCalls
+
+        resultBrass = calculator.compute(material.Material({29: 0.7, 30: 0.3}, 8.5))
+        resultCopper = calculator.compute(material.Material({29: 1.0}, 8.96))
+        calculator.compute(material.Material({29: 0.5, 30: 0.2, 79: 0.3}, 12.0))
+        self.assertEquals([[29, 30], [79]], calls)
+
+        self.assertTrue(np.allclose(resultBrass.macroscopicCrossSections_1_nm[0]/0.7/8.5,
+                                    resultCopper.macroscopicCrossSections_1_nm[0]/8.96))
+
+        # Casnati has no LII shell, its cross section is zero.
+        calculator = material.MaterialCrossSectionCalculator(model, self.energies_eV, [atomic_shell.SHELL_K, atomic_shell.SHELL_LII])
+        crossSections_nm2 = calculator.getElementCrossSections_nm2([29])
+        self.assertTrue(np.all(crossSections_nm2[0, 1] == 0.0))
+        self.assertTrue(np.all(crossSections_nm2[0, 0, -10:] > 0.0))
+
+        #self.fail("Test if the testcase is working.")
+
+if __name__ == '__main__':  #pragma: no cover
+    logging.getLogger().setLevel(logging.DEBUG)
+    from pyHendrixDemersTools.Testings import runTestModuleWithCoverage
+    runTestModuleWithCoverage(__file__)
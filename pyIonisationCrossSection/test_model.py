@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+"""
+.. py:currentmodule:: test_model
+.. moduleauthor:: Hendrix Demers <hendrix.demers@mail.mcgill.ca>
+
+Tests for the module `model`.
+"""
+
+# Script information for the file.
+__author__ = "Hendrix Demers (hendrix.demers@mail.mcgill.ca)"
+__version__ = ""
+__date__ = ""
+__copyright__ = "Copyright (c) 2012 Hendrix Demers"
+__license__ = ""
+
+# Standard library modules.
+import unittest
+import logging
+
+# Third party modules.
+import numpy as np
+
+# Local modules.
+
+# Project modules
+import pyIonisationCrossSection.model as model
+import pyIonisationCrossSection.atomic_shell as atomic_shell
+from pyIonisationCrossSection.casnati import Casnati
+from pyIonisationCrossSection.bote2009 import Bote2009
+
+# Globals and constants variables.
+
+class _ScalarModel(model.IonisationCrossSectionModel):
+    name = "Scalar"
+    shells = (atomic_shell.SHELL_K,)
+
+    def ics_nm2(self, atomicNumber, ionisationEnergy_eV, electronEnergy_eV, shell):
+        if electronEnergy_eV < ionisationEnergy_eV:
+            return 0.0
+        return atomicNumber*1.0e-6
+
+class Testmodel(unittest.TestCase):
+    """
+    TestCase class for the module `model`.
+    """
+
+    def setUp(self):
+        """
+        Setup method.
+        """
+
+        unittest.TestCase.setUp(self)
+
+    def tearDown(self):
+        """
+        Teardown method.
+        """
+
+        unittest.TestCase.tearDown(self)
+
+    def testSkeleton(self):
+        """
+        First test to check if the testcase is working with the testing framework.
+        """
+
+        #self.fail("Test if the testcase is working.")
+        self.assertTrue(True)
+
+    def test_getModel(self):
+        """
+        Tests for method `getModel`.
+        """
+
+        self.assertEquals([model.MODEL_BOTE2009, model.MODEL_BROWN1974, model.MODEL_CASNATI1982, model.MODEL_JAKOBY1987],
+                          model.getModelNames())
+
+        self.assertTrue(isinstance(model.getModel(model.MODEL_CASNATI1982), Casnati))
+        self.assertTrue(isinstance(model.getModel("Bote2009"), Bote2009))
+        self.assertTrue(model.getModel(model.MODEL_BOTE2009) is model.getModel(model.MODEL_BOTE2009))
+        self.assertRaises(KeyError, model.getModel, "unknown")
+
+        for name in model.getModelNames():
+            modelICS = model.getModel(name)
+            self.assertTrue(isinstance(modelICS, model.IonisationCrossSectionModel))
+            self.assertTrue(modelICS.name is not None)
+            self.assertTrue(atomic_shell.SHELL_K in modelICS.shells)
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_registerModel(self):
+        """
+        Tests for method `registerModel`.
+        """
+
+        model.registerModel("Scalar", _ScalarModel)
+        self.addCleanup(model._registry.pop, "scalar")
+
+        self.assertTrue("scalar" in model.getModelNames())
+        self.assertTrue(isinstance(model.getModel("scalar"), _ScalarModel))
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_ics_nm2_array(self):
+        """
+        Tests for method `ics_nm2_array`.
+        """
+
+        modelICS = _ScalarModel()
+        sigmas_nm2 = modelICS.ics_nm2_array(np.array([[6], [29]]), 1.0e3, [0.5e3, 2.0e3, 4.0e3], atomic_shell.SHELL_K)
+        self.assertEquals((2, 3), sigmas_nm2.shape)
+        np.testing.assert_allclose([[0.0, 6.0e-6, 6.0e-6], [0.0, 29.0e-6, 29.0e-6]], sigmas_nm2)
+
+        atomicNumbers = np.array([7, 28, 79])
+        ionisationEnergies_eV = np.array([0.399e3, 8.333e3, 80.725e3])
+        overvoltages = np.array([0.5, 1.0, 1.5, 4.0, 25.0])
+        energies_eV = ionisationEnergies_eV[:, np.newaxis]*overvoltages
+        for name in model.getModelNames():
+            modelICS = model.getModel(name)
+            sigmas_nm2 = modelICS.ics_nm2_array(atomicNumbers[:, np.newaxis], ionisationEnergies_eV[:, np.newaxis],
+                                                energies_eV, atomic_shell.SHELL_K)
+            self.assertEquals((3, 5), sigmas_nm2.shape)
+
+            for indexZ, atomicNumber in enumerate(atomicNumbers):
+                for indexU, energy_eV in enumerate(energies_eV[indexZ]):
+                    sigma_nm2 = modelICS.ics_nm2(int(atomicNumber), ionisationEnergies_eV[indexZ], energy_eV, atomic_shell.SHELL_K)
+                    self.assertAlmostEquals(sigma_nm2*1.0e8, sigmas_nm2[indexZ, indexU]*1.0e8)
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_isSupported(self):
+        """
+        Tests for method `isSupported`.
+        """
+
+        modelICS = model.getModel(model.MODEL_CASNATI1982)
+        self.assertTrue(modelICS.isSupported(29, atomic_shell.SHELL_K))
+        self.assertFalse(modelICS.isSupported(29, atomic_shell.SHELL_LI))
+        self.assertFalse(modelICS.isSupported(101, atomic_shell.SHELL_K))
+
+        modelICS = model.getModel(model.MODEL_BOTE2009)
+        self.assertTrue(modelICS.isSupported(79, atomic_shell.SHELL_MV))
+        self.assertFalse(modelICS.isSupported(1, atomic_shell.SHELL_MV))
+        self.assertFalse(modelICS.isSupported(100, atomic_shell.SHELL_K))
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_getShellIndexes(self):
+        """
+        Tests for method `getShellIndexes`.
+        """
+
+        shellIndexes = {atomic_shell.SHELL_K: 0, atomic_shell.SHELL_LIII: 1}
+        indexes = model.getShellIndexes([[atomic_shell.SHELL_LIII, atomic_shell.SHELL_K, atomic_shell.SHELL_LIII]], shellIndexes)
+        self.assertEquals([[1, 0, 1]], indexes.tolist())
+        self.assertRaises(KeyError, model.getShellIndexes, [atomic_shell.SHELL_MV], shellIndexes)
+
+        #self.fail("Test if the testcase is working.")
+
+if __name__ == '__main__':  #pragma: no cover
+    logging.getLogger().setLevel(logging.DEBUG)
+    from pyHendrixDemersTools.Testings import runTestModuleWithCoverage
+    runTestModuleWithCoverage(__file__)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+"""
+.. py:currentmodule:: test_trajectory
+.. moduleauthor:: Hendrix Demers <hendrix.demers@mail.mcgill.ca>
+
+Tests for the module `trajectory`.
+"""
+
+# Script information for the file.
+__author__ = "Hendrix Demers (hendrix.demers@mail.mcgill.ca)"
+__version__ = ""
+__date__ = ""
+__copyright__ = "Copyright (c) 2012 Hendrix Demers"
+__license__ = ""
+
+# Standard library modules.
+import unittest
+import logging
+
+# Third party modules.
+import numpy as np
+
+# Local modules.
+
+# Project modules
+import pyIonisationCrossSection.trajectory as trajectory
+import pyIonisationCrossSection.atomic_shell as atomic_shell
+from pyIonisationCrossSection.model import getModel
+
+# Globals and constants variables.
+
+class Testtrajectory(unittest.TestCase):
+    """
+    TestCase class for the module `trajectory`.
+    """
+
+    def setUp(self):
+        """
+        Setup method.
+        """
+
+        unittest.TestCase.setUp(self)
+
+        self.atomicNumber = 29
+        self.atomicMass_g_mol = 63.546
+        self.density_g_cm3 = 8.96
+        self.shells = [atomic_shell.SHELL_K, atomic_shell.SHELL_LIII]
+        self.ionisationEnergies_eV = [8979.0, 932.7]
+
+    def tearDown(self):
+        """
+        Teardown method.
+        """
+
+        unittest.TestCase.tearDown(self)
+
+    def testSkeleton(self):
+        """
+        First test to check if the testcase is working with the testing framework.
+        """
+
+        #self.fail("Test if the testcase is working.")
+        self.assertTrue(True)
+
+    def test_stoppingPower(self):
+        """
+        Tests for methods `createBetheStoppingPower` and `createJoyLuoStoppingPower`.
+        """
+
+        self.assertAlmostEquals(313.9, trajectory.computeMeanIonisationPotential_eV(29), places=1)
+        self.assertAlmostEquals(84.9, trajectory.computeNumberDensity_nm3(self.atomicMass_g_mol, self.density_g_cm3), places=1)
+
+        stoppingPowerBethe = trajectory.createBetheStoppingPower(self.atomicNumber, self.atomicMass_g_mol, self.density_g_cm3)
+        stoppingPowerJoyLuo = trajectory.createJoyLuoStoppingPower(self.atomicNumber, self.atomicMass_g_mol, self.density_g_cm3)
+
+        energies_eV = np.array([1.0e2, 1.0e3, 1.0e4, 1.0e5])
+        stoppingPowers_eV_nm = stoppingPowerJoyLuo(energies_eV)
+        self.assertTrue(np.all(stoppingPowers_eV_nm > 0.0))
+        self.assertTrue(np.all(np.diff(stoppingPowers_eV_nm) < 0.0))
+        self.assertAlmostEquals(11.7, stoppingPowers_eV_nm[2], places=1)
+        self.assertAlmostEquals(1.0, stoppingPowerBethe(1.0e5)/stoppingPowers_eV_nm[3], places=2)
+        self.assertTrue(stoppingPowerBethe(100.0) < 0.0)
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_computeYields(self):
+        """
+        Tests for method `IonisationYieldTable.computeYields` against a direct integration.
+        """
+
+        stoppingPower = trajectory.createJoyLuoStoppingPower(self.atomicNumber, self.atomicMass_g_mol, self.density_g_cm3)
+        numberDensity_nm3 = trajectory.computeNumberDensity_nm3(self.atomicMass_g_mol, self.density_g_cm3)
+        incidentEnergies_eV = np.array([[5.0e3, 2.0e4], [3.0e4, 1.0e5]])
+
+        for modelName in ["bote2009", "casnati1982"]:
+            model = getModel(modelName)
+            table = trajectory.IonisationYieldTable(model, self.atomicNumber, self.shells, self.ionisationEnergies_eV,
+                                                    stoppingPower, numberDensity_nm3, maximumEnergy_eV=1.0e5)
+            yields = table.computeYields(incidentEnergies_eV)
+            self.assertEquals((2, 2, 2), yields.shape)
+            self.assertEquals(0.0, yields[0, 0, 0])
+
+            for indexShell, (shell, ionisationEnergy_eV) in enumerate(zip(self.shells, self.ionisationEnergies_eV)):
+                for index in np.ndindex(incidentEnergies_eV.shape):
+                    incidentEnergy_eV = incidentEnergies_eV[index]
+                    if incidentEnergy_eV <= ionisationEnergy_eV:
+                        continue
+                    energies_eV = np.linspace(ionisationEnergy_eV, incidentEnergy_eV, 20001)
+                    integrands = numberDensity_nm3*model.ics_nm2_array(self.atomicNumber, ionisationEnergy_eV, energies_eV, shell)/stoppingPower(energies_eV)
+                    expectedValue = np.sum(0.5*(integrands[1:] + integrands[:-1])*np.diff(energies_eV))
+                    self.assertAlmostEquals(1.0, yields[(indexShell,) + index]/expectedValue, places=3)
+
+            self.assertRaises(ValueError, table.computeYields, 2.0e5)
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_computeIonisationYields(self):
+        """
+        Tests for method `computeIonisationYields`.
+        """
+
+        model = getModel("bote2009")
+        incidentEnergies_eV = np.linspace(1.0e3, 3.0e4, 30)
+        yields = trajectory.computeIonisationYields(model, self.atomicNumber, self.shells, self.ionisationEnergies_eV,
+                                                    incidentEnergies_eV, self.atomicMass_g_mol, self.density_g_cm3)
+        self.assertEquals((2, 30), yields.shape)
+        self.assertTrue(np.all(np.diff(yields, axis=1) >= 0.0))
+        self.assertTrue(yields[1, -1] > yields[0, -1] > 0.0)
+
+        self.assertRaises(ValueError, trajectory.computeIonisationYields, model, self.atomicNumber, self.shells,
+                          self.ionisationEnergies_eV, incidentEnergies_eV, self.atomicMass_g_mol, self.density_g_cm3,
+                          stoppingPower=lambda energies_eV: -np.ones(np.shape(energies_eV)))
+
+        #self.fail("Test if the testcase is working.")
+
+if __name__ == '__main__':  #pragma: no cover
+    logging.getLogger().setLevel(logging.DEBUG)
+    from pyHendrixDemersTools.Testings import runTestModuleWithCoverage
+    runTestModuleWithCoverage(__file__)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+"""
+.. py:currentmodule:: test_units
+.. moduleauthor:: Hendrix Demers <hendrix.demers@mail.mcgill.ca>
+
+Tests for the module `units`.
+"""
+
+# Script information for the file.
+__author__ = "Hendrix Demers (hendrix.demers@mail.mcgill.ca)"
+__version__ = ""
+__date__ = ""
+__copyright__ = "Copyright (c) 2012 Hendrix Demers"
+__license__ = ""
+
+# Standard library modules.
+import unittest
+import logging
+import itertools
+
+# Third party modules.
+import numpy as np
+
+# Local modules.
+
+# Project modules
+import pyIonisationCrossSection.units as units
+
+# Globals and constants variables.
+
+class Testunits(unittest.TestCase):
+    """
+    TestCase class for the module `units`.
+    """
+
+    def setUp(self):
+        """
+        Setup method.
+        """
+
+        unittest.TestCase.setUp(self)
+
+    def tearDown(self):
+        """
+        Teardown method.
+        """
+
+        unittest.TestCase.tearDown(self)
+
+    def testSkeleton(self):
+        """
+        First test to check if the testcase is working with the testing framework.
+        """
+
+        #self.fail("Test if the testcase is working.")
+        self.assertTrue(True)
+
+    def test_scalar(self):
+        """
+        Tests for the conversion of scalars.
+        """
+
+        self.assertAlmostEquals(1.5, units.eV_to_keV(1.5e3))
+        self.assertAlmostEquals(1.5e3, units.keV_to_eV(1.5))
+        self.assertAlmostEquals(1.0, units.cm2_to_nm2(1.0e-14))
+        self.assertAlmostEquals(1.0, units.nm2_to_cm2(1.0e14))
+        self.assertAlmostEquals(1.0, units.nm2_to_m2(1.0e18))
+        self.assertAlmostEquals(1.0, units.m2_to_nm2(1.0e-18))
+        self.assertAlmostEquals(1.0, units.cm2_to_m2(1.0e4))
+        self.assertAlmostEquals(1.0, units.m2_to_cm2(1.0e-4))
+        self.assertAlmostEquals(1.0, units.barn_to_nm2(1.0e10))
+        self.assertAlmostEquals(1.0, units.nm2_to_barn(1.0e-10))
+        self.assertAlmostEquals(1.0, units.barn_to_m2(1.0e28))
+        self.assertAlmostEquals(1.0, units.m2_to_barn(1.0e-28))
+        self.assertAlmostEquals(1.0, units.barn_to_cm2(1.0e24))
+        self.assertAlmostEquals(1.0, units.cm2_to_barn(1.0e-24))
+        self.assertTrue(isinstance(units.nm2_to_m2(2.0), float))
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_getConversionFactor(self):
+        """
+        Tests for method `getConversionFactor`.
+        """
+
+        self.assertAlmostEquals(1.0e-3, units.getConversionFactor(units.UNIT_eV, units.UNIT_keV))
+        for fromUnit, toUnit in itertools.product(units.AREA_UNITS, repeat=2):
+            factor = units.getConversionFactor(fromUnit, toUnit)
+            if fromUnit != toUnit:
+                functionFactor = getattr(units, "FACTOR_%s_TO_%s" % (fromUnit, toUnit))
+                self.assertAlmostEquals(1.0, factor/functionFactor)
+            self.assertAlmostEquals(1.0, units.convert(units.convert(3.0, fromUnit, toUnit), toUnit, fromUnit)/3.0)
+
+        self.assertRaises(ValueError, units.getConversionFactor, units.UNIT_eV, units.UNIT_nm2)
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_array(self):
+        """
+        Tests for the conversion of arrays.
+        """
+
+        values_nm2 = np.linspace(1.0, 10.0, 10)
+        values_m2 = units.nm2_to_m2(values_nm2)
+        np.testing.assert_allclose(values_nm2*1.0e-18, values_m2)
+        np.testing.assert_allclose(values_nm2*1.0e-18, units.nm2_to_m2(values_nm2.tolist()))
+
+        out = np.empty(10)
+        result = units.barn_to_nm2(values_nm2, out=out)
+        self.assertTrue(result is out)
+        np.testing.assert_allclose(values_nm2*1.0e-10, out)
+
+        result = units.eV_to_keV(values_nm2, out=values_nm2)
+        self.assertTrue(result is values_nm2)
+        np.testing.assert_allclose(np.linspace(1.0e-3, 10.0e-3, 10), values_nm2)
+
+        #self.fail("Test if the testcase is working.")
+
+    def test_computeNumberDensity_nm3(self):
+        """
+        Tests for method `computeNumberDensity_nm3`.
+        """
+
+        self.assertAlmostEquals(84.9, units.computeNumberDensity_nm3(63.546, 8.96), places=1)
+        numberDensities_nm3 = units.computeNumberDensity_nm3(np.array([1.008, 15.999]), np.array([0.1119, 0.8881]))
+        np.testing.assert_allclose([66.85, 33.43], numberDensities_nm3, atol=0.02)
+
+        #self.fail("Test if the testcase is working.")
+
+if __name__ == '__main__':  #pragma: no cover
+    logging.getLogger().setLevel(logging.DEBUG)
+    from pyHendrixDemersTools.Testings import runTestModuleWithCoverage
+    runTestModuleWithCoverage(__file__)
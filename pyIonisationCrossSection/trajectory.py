@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+"""
+.. py:currentmodule:: trajectory
+.. moduleauthor:: Hendrix Demers <hendrix.demers@mail.mcgill.ca>
+
+Number of ionisations produced by an electron slowing down in a material, continuous slowing down approximation.
+
+The yield of a shell for an incident energy E0 is the integral of n sigma(E) / S(E) from the ionisation energy
+Ec to E0, with n the number of atoms per volume, sigma the ionisation cross section of a model and S = -dE/ds the
+stopping power. The integral is tabulated once for each shell, the yields of any incident energies are then
+interpolated in the cumulative table.
+"""
+
+# Script information for the file.
+__author__ = "Hendrix Demers (hendrix.demers@mail.mcgill.ca)"
+__version__ = ""
+__date__ = ""
+__copyright__ = "Copyright (c) 2012 Hendrix Demers"
+__license__ = ""
+
+# Standard library modules.
+import math
+
+# Third party modules.
+import numpy as np
+
+# Local modules.
+
+# Project modules
+from pyIonisationCrossSection.units import computeNumberDensity_nm3
+
+# Globals and constants variables.
+# Constant of the Bethe stopping power, 2 pi e^4 N_A in keV cm2/g.
+BETHE_CONSTANT_keV_cm2_g = 7.85e4
+FACTOR_keV_cm_TO_eV_nm = 1.0e-4
+
+DEFAULT_MAXIMUM_ENERGY_eV = 1.0e6
+DEFAULT_NUMBER_POINTS_PER_DECADE = 200
+
+def computeMeanIonisationPotential_eV(atomicNumber):
+    """
+    Mean ionisation potential J from Berger and Seltzer (1964).
+    """
+    return 9.76*atomicNumber + 58.5*math.pow(atomicNumber, -0.19)
+
+def createBetheStoppingPower(atomicNumber, atomicMass_g_mol, density_g_cm3):
+    """
+    Return the Bethe stopping power function S(E) in eV/nm, E in eV.
+
+    The function is only positive above J/1.166, the Joy and Luo form is used for lower energies.
+    """
+    J_keV = computeMeanIonisationPotential_eV(atomicNumber)*1.0e-3
+    factor = BETHE_CONSTANT_keV_cm2_g*density_g_cm3*atomicNumber/atomicMass_g_mol*FACTOR_keV_cm_TO_eV_nm
+
+    def stoppingPower_eV_nm(energies_eV):
+        energies_keV = np.asarray(energies_eV, dtype=np.float64)*1.0e-3
+        return factor/energies_keV*np.log(1.166*energies_keV/J_keV)
+
+    return stoppingPower_eV_nm
+
+def createJoyLuoStoppingPower(atomicNumber, atomicMass_g_mol, density_g_cm3):
+    """
+    Return the Joy and Luo (1989) stopping power function S(E) in eV/nm, E in eV.
+
+    The Bethe formula is modified with J replaced by J/(1 + k J/E), k = 0.731 + 0.0688 log10(Z), it stays
+    positive down to a few eV.
+    """
+    J_keV = computeMeanIonisationPotential_eV(atomicNumber)*1.0e-3
+    k = 0.731 + 0.0688*math.log10(atomicNumber)
+    factor = BETHE_CONSTANT_keV_cm2_g*density_g_cm3*atomicNumber/atomicMass_g_mol*FACTOR_keV_cm_TO_eV_nm
+
+    def stoppingPower_eV_nm(energies_eV):
+        energies_keV = np.asarray(energies_eV, dtype=np.float64)*1.0e-3
+        return factor/energies_keV*np.log(1.166*(energies_keV + k*J_keV)/J_keV)
+
+    return stoppingPower_eV_nm
+
+class IonisationYieldTable(object):
+    """
+    Cumulative ionisation yields of shells of one element, tabulated from the threshold to `maximumEnergy_eV`.
+
+    The table of each shell is uniform in log(E/Ec) with the same step for all the shells, so the yields of an
+    array of incident energies are interpolated for all the shells at once. The cross sections of the whole table
+    are computed with one `ics_nm2_array` call of the model and the integral with the trapezoidal rule in log(E).
+    """
+
+    def __init__(self, model, atomicNumber, shells, ionisationEnergies_eV, stoppingPower, numberDensity_nm3,
+                 maximumEnergy_eV=DEFAULT_MAXIMUM_ENERGY_eV, numberPointsPerDecade=DEFAULT_NUMBER_POINTS_PER_DECADE):
+        self.model = model
+        self.atomicNumber = atomicNumber
+        self.shells = list(shells)
+        self.ionisationEnergies_eV = np.asarray(ionisationEnergies_eV, dtype=np.float64).reshape(len(self.shells))
+        self.maximumEnergy_eV = maximumEnergy_eV
+
+        self._step = math.log(10.0)/numberPointsPerDecade
+        minimumEnergy_eV = np.min(self.ionisationEnergies_eV)
+        numberIntervals = int(math.ceil(math.log(maximumEnergy_eV/minimumEnergy_eV)/self._step))
+        logOvervoltages = np.arange(numberIntervals + 1)*self._step
+
+        self._logIonisationEnergies = np.log(self.ionisationEnergies_eV)
+        self.energies_eV = self.ionisationEnergies_eV[:, np.newaxis]*np.exp(logOvervoltages)
+
+        crossSections_nm2 = model.ics_nm2_array(atomicNumber, self.ionisationEnergies_eV[:, np.newaxis], self.energies_eV,
+                                                np.array(self.shells)[:, np.newaxis])
+        stoppingPowers_eV_nm = stoppingPower(self.energies_eV)
+        if np.any(stoppingPowers_eV_nm <= 0.0):
+            raise ValueError("The stopping power is not positive over the energies of the table.")
+
+        # dN/dlog(E) = n sigma(E) E / S(E)
+        integrands = numberDensity_nm3*crossSections_nm2*self.energies_eV/stoppingPowers_eV_nm
+        self.yields = np.zeros(integrands.shape)
+        np.cumsum(0.5*self._step*(integrands[:, 1:] + integrands[:, :-1]), axis=1, out=self.yields[:, 1:])
+
+    def computeYields(self, incidentEnergies_eV):
+        """
+        Return the number of ionisations of each shell, an array of shape (number of shells,) + energies shape.
+
+        The yields are zero below the threshold, an energy above the table raises ValueError.
+        """
+        incidentEnergies_eV = np.asarray(incidentEnergies_eV, dtype=np.float64)
+        if np.any(incidentEnergies_eV > self.maximumEnergy_eV):
+            raise ValueError("The incident energies are above the maximum energy of the table: %g eV." % (self.maximumEnergy_eV))
+
+        shape = incidentEnergies_eV.shape
+        energies_eV = incidentEnergies_eV.reshape(1, -1)
+        x = (np.log(energies_eV) - self._logIonisationEnergies[:, np.newaxis])/self._step
+        x = np.clip(x, 0.0, self.yields.shape[1] - 1.0)
+        indexes = np.minimum(x.astype(np.int64), self.yields.shape[1] - 2)
+        weights = x - indexes
+
+        yields0 = np.take_along_axis(self.yields, indexes, axis=1)
+        yields1 = np.take_along_axis(self.yields, indexes + 1, axis=1)
+        yields = yields0 + weights*(yields1 - yields0)
+
+        return yields.reshape((len(self.shells),) + shape)
+
+def computeIonisationYields(model, atomicNumber, shells, ionisationEnergies_eV, incidentEnergies_eV, atomicMass_g_mol,
+                            density_g_cm3, stoppingPower=None, numberPointsPerDecade=DEFAULT_NUMBER_POINTS_PER_DECADE):
+    """
+    Compute the number of ionisations of each shell for the incident energies.
+
+    The Joy and Luo stopping power is used by default, the table extends to the largest incident energy.
+    """
+    if stoppingPower is None:
+        stoppingPower = createJoyLuoStoppingPower(atomicNumber, atomicMass_g_mol, density_g_cm3)
+    numberDensity_nm3 = computeNumberDensity_nm3(atomicMass_g_mol, density_g_cm3)
+    maximumEnergy_eV = max(float(np.max(incidentEnergies_eV)), float(np.max(ionisationEnergies_eV)))*(1.0 + 1.0e-9)
+
+    table = IonisationYieldTable(model, atomicNumber, shells, ionisationEnergies_eV, stoppingPower, numberDensity_nm3,
+                                 maximumEnergy_eV, numberPointsPerDecade)
+    return table.computeYields(incidentEnergies_eV)
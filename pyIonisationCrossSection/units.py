@@ -22,48 +22,111 @@ __svnId__ = "$Id$"
 # Project modules
 
 # Globals and constants variables.
-
-def eV_to_keV(value_eV):
-    value_keV = value_eV*1.0e-3
-    return value_keV
-
-def keV_to_eV(value_keV):
-    value_eV = value_keV*1.0e3
-    return value_eV
-
-def cm2_to_nm2(value_cm2):
-    value_nm2 = value_cm2*1.0e14
-    return value_nm2
-
-def nm2_to_cm2(value_nm2):
-    value_cm2 = value_nm2*1.0e-14
-    return value_cm2
-
-def nm2_to_m2(value_nm2):
-    value_m2 = value_nm2*1.0e-18
-    return value_m2
-
-def m2_to_nm2(value_m2):
-    value_nm2 = value_m2*1.0e18
-    return value_nm2
-
-def barn_to_nm2(value_barn):
-    value_m2 = barn_to_m2(value_barn)
-    value_nm2 = m2_to_nm2(value_m2)
-    return value_nm2
-
-def nm2_to_barn(value_nm2):
-    value_m2 = nm2_to_m2(value_nm2)
-    value_barn = m2_to_barn(value_m2)
-    return value_barn
-
-def barn_to_m2(value_barn):
-    value_m2 = value_barn*1.0e-28
-    return value_m2
-
-def m2_to_barn(value_m2):
-    value_barn = value_m2*1.0e28
-    return value_barn
+UNIT_eV = "eV"
+UNIT_keV = "keV"
+
+UNIT_m2 = "m2"
+UNIT_cm2 = "cm2"
+UNIT_nm2 = "nm2"
+UNIT_barn = "barn"
+
+# Value of each unit in the reference unit, eV for energy and m2 for area.
+ENERGY_UNITS = {UNIT_eV: 1.0, UNIT_keV: 1.0e3}
+AREA_UNITS = {UNIT_m2: 1.0, UNIT_cm2: 1.0e-4, UNIT_nm2: 1.0e-18, UNIT_barn: 1.0e-28}
+
+FACTOR_eV_TO_keV = 1.0e-3
+FACTOR_keV_TO_eV = 1.0e3
+
+FACTOR_cm2_TO_nm2 = 1.0e14
+FACTOR_nm2_TO_cm2 = 1.0e-14
+FACTOR_nm2_TO_m2 = 1.0e-18
+FACTOR_m2_TO_nm2 = 1.0e18
+FACTOR_cm2_TO_m2 = 1.0e-4
+FACTOR_m2_TO_cm2 = 1.0e4
+FACTOR_barn_TO_nm2 = 1.0e-10
+FACTOR_nm2_TO_barn = 1.0e10
+FACTOR_barn_TO_m2 = 1.0e-28
+FACTOR_m2_TO_barn = 1.0e28
+FACTOR_barn_TO_cm2 = 1.0e-24
+FACTOR_cm2_TO_barn = 1.0e24
+
+AVOGADRO_NUMBER = 6.02214076e23
+FACTOR_1_cm3_TO_1_nm3 = 1.0e-21
+
+def _convert(value, factor, out):
+    """
+    Multiply the value by the factor, the values of a list are converted to an array and the result is written
+    in `out` if given. numpy is only imported for these two cases, the conversion of scalars does not need it.
+    """
+    if out is not None:
+        import numpy as np
+        return np.multiply(value, factor, out=out)
+    if isinstance(value, (list, tuple)):
+        import numpy as np
+        value = np.asarray(value, dtype=np.float64)
+    return value*factor
+
+def getConversionFactor(fromUnit, toUnit):
+    """
+    Return the factor converting a value from one energy or area unit to another one of the same kind.
+    """
+    if fromUnit in ENERGY_UNITS and toUnit in ENERGY_UNITS:
+        return ENERGY_UNITS[fromUnit]/ENERGY_UNITS[toUnit]
+    elif fromUnit in AREA_UNITS and toUnit in AREA_UNITS:
+        return AREA_UNITS[fromUnit]/AREA_UNITS[toUnit]
+    else:
+        raise ValueError("Cannot convert from %s to %s." % (fromUnit, toUnit))
+
+def convert(value, fromUnit, toUnit, out=None):
+    return _convert(value, getConversionFactor(fromUnit, toUnit), out)
+
+def eV_to_keV(value_eV, out=None):
+    return _convert(value_eV, FACTOR_eV_TO_keV, out)
+
+def keV_to_eV(value_keV, out=None):
+    return _convert(value_keV, FACTOR_keV_TO_eV, out)
+
+def cm2_to_nm2(value_cm2, out=None):
+    return _convert(value_cm2, FACTOR_cm2_TO_nm2, out)
+
+def nm2_to_cm2(value_nm2, out=None):
+    return _convert(value_nm2, FACTOR_nm2_TO_cm2, out)
+
+def nm2_to_m2(value_nm2, out=None):
+    return _convert(value_nm2, FACTOR_nm2_TO_m2, out)
+
+def m2_to_nm2(value_m2, out=None):
+    return _convert(value_m2, FACTOR_m2_TO_nm2, out)
+
+def cm2_to_m2(value_cm2, out=None):
+    return _convert(value_cm2, FACTOR_cm2_TO_m2, out)
+
+def m2_to_cm2(value_m2, out=None):
+    return _convert(value_m2, FACTOR_m2_TO_cm2, out)
+
+def barn_to_nm2(value_barn, out=None):
+    return _convert(value_barn, FACTOR_barn_TO_nm2, out)
+
+def nm2_to_barn(value_nm2, out=None):
+    return _convert(value_nm2, FACTOR_nm2_TO_barn, out)
+
+def barn_to_m2(value_barn, out=None):
+    return _convert(value_barn, FACTOR_barn_TO_m2, out)
+
+def m2_to_barn(value_m2, out=None):
+    return _convert(value_m2, FACTOR_m2_TO_barn, out)
+
+def barn_to_cm2(value_barn, out=None):
+    return _convert(value_barn, FACTOR_barn_TO_cm2, out)
+
+def cm2_to_barn(value_cm2, out=None):
+    return _convert(value_cm2, FACTOR_cm2_TO_barn, out)
+
+def computeNumberDensity_nm3(atomicMass_g_mol, density_g_cm3):
+    """
+    Number of atoms per nm3 of an element of atomic mass in g/mol and partial density in g/cm3.
+    """
+    return density_g_cm3*AVOGADRO_NUMBER/atomicMass_g_mol*FACTOR_1_cm3_TO_1_nm3
 
 if __name__ == '__main__':  #pragma: no cover
     import pyHendrixDemersTools.Runner as Runner